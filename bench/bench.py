@@ -3,11 +3,30 @@ import os
 import json
 import argparse
 import subprocess
+import sys
 
 from datetime import datetime, timezone
 
-from common import env_detect, json_schema
-from tests import allreduce, check_rocm, ddp_step, gemm_torch, kernel_mix
+from common import env_detect, json_schema, profiling
+from tests import (
+    alloc_stress,
+    allreduce,
+    check_rocm,
+    ckpt_bench,
+    comm_replay,
+    compile_bench,
+    conv_bench,
+    cpu_affinity,
+    dataloader_bench,
+    ddp_step,
+    gemm_torch,
+    kernel_mix,
+    launch_overhead,
+    membw,
+    precision_matrix,
+    serve_bench,
+    startup_bench,
+)
 
 
 DEFAULT_ALLREDUCE_SIZES = [1024, 4096, 16384, 65536, 262144, 1048576]
@@ -144,6 +163,15 @@ def cmd_check(args):
     return 0 if check.get("status") == "pass" else 1
 
 
+def _profile_kwargs(args, name):
+    if not args.profile:
+        return {}
+    return {
+        "profile_iters": args.profile_iters,
+        "trace_path": profiling.trace_path(args.out, name) if _is_rank0() else "",
+    }
+
+
 def cmd_single(args):
     if not _is_rank0():
         return 0
@@ -152,12 +180,18 @@ def cmd_single(args):
         dtype_name=args.dtype,
         warmup=args.warmup,
         iters=args.iters,
+        duration_s=args.duration,
+        window_s=args.window,
+        **_profile_kwargs(args, "gemm"),
     )
     mix = kernel_mix.run_kernel_mix(
         size=args.kernel_mix_size,
         warmup=args.warmup,
         iters=args.iters,
         softmax_fp32=args.softmax_fp32,
+        duration_s=args.duration,
+        window_s=args.window,
+        **_profile_kwargs(args, "kernel_mix"),
     )
     warnings = [
         warning
@@ -181,6 +215,15 @@ def cmd_single(args):
             },
         }
     }
+    for name, result in (("gemm", gemm), ("kernel_mix", mix)):
+        for key in ("memory", "soak", "profile"):
+            if key in result:
+                tests["single"][name][key] = result[key]
+        warning = _warning_from_error(
+            f"single: {name} profile", result.get("profile", {})
+        )
+        if warning:
+            warnings.append(warning)
     _write_results(args.out, tests, warnings)
     return 0
 
@@ -202,13 +245,22 @@ def _parse_sizes(value):
 
 def cmd_multi(args):
     sizes = _parse_sizes(args.message_sizes) or DEFAULT_ALLREDUCE_SIZES
-    result = allreduce.run_allreduce(sizes, iters=args.iters)
+    result = allreduce.run_allreduce(
+        sizes,
+        iters=args.iters,
+        duration_s=args.duration,
+        window_s=args.window,
+        **_profile_kwargs(args, "allreduce"),
+    )
     warnings = []
     allreduce_payload = result
     warning = _warning_from_error("multi", result)
     if warning:
         warnings.append(warning)
         allreduce_payload = EMPTY_ALLREDUCE_RESULT
+    warning = _warning_from_error("multi: profile", result.get("profile", {}))
+    if warning:
+        warnings.append(warning)
     if _is_rank0():
         _write_results(args.out, {"multi": {"allreduce": allreduce_payload}}, warnings)
     return 0
@@ -222,13 +274,360 @@ def cmd_ddp(args):
         warmup=args.warmup,
         iters=args.iters,
         dtype_name=args.dtype,
+        duration_s=args.duration,
+        window_s=args.window,
+        comm_trace_path=args.comm_trace,
+        **_profile_kwargs(args, "ddp_step"),
+    )
+    warnings = []
+    for warning in (
+        _warning_from_error("ddp", result),
+        _warning_from_error("ddp: profile", result.get("profile", {})),
+    ):
+        if warning:
+            warnings.append(warning)
+    if _is_rank0():
+        _write_results(args.out, {"ddp_step": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_launch(args):
+    if not _is_rank0():
+        return 0
+    result = launch_overhead.run_launch_overhead(
+        chain_length=args.chain_length,
+        numel=args.numel,
+        warmup=args.warmup,
+        iters=args.iters,
+    )
+    warnings = []
+    warning = _warning_from_error("launch", result)
+    if warning:
+        warnings.append(warning)
+    if result.get("graph_error"):
+        warnings.append(f"launch: graph replay skipped: {result['graph_error']}")
+    _write_results(args.out, {"launch": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def _parse_names(value):
+    return [token.strip() for token in (value or "").split(",") if token.strip()]
+
+
+def cmd_compile(args):
+    if not _is_rank0():
+        return 0
+    result = compile_bench.run_compile(
+        modules=_parse_names(args.modules) or compile_bench.DEFAULT_MODULES,
+        size=args.size,
+        warmup=args.warmup,
+        iters=args.iters,
+        backend=args.backend,
+        cache_root=args.cache_root,
+        keep_cache=args.keep_cache,
+    )
+    warnings = []
+    warning = _warning_from_error("compile", result)
+    if warning:
+        warnings.append(warning)
+    for name, module in result.get("modules", {}).items():
+        warning = _warning_from_error(f"compile: {name}", module)
+        if warning:
+            warnings.append(warning)
+    _write_results(args.out, {"compile": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_conv(args):
+    if not _is_rank0():
+        return 0
+    result = conv_bench.run_conv(
+        shapes=_parse_names(args.shapes) or None,
+        batch=args.batch_size,
+        warmup=args.warmup,
+        iters=args.iters,
+        benchmark=args.benchmark,
+        cache_root=args.cache_root,
+        keep_cache=args.keep_cache,
+    )
+    warnings = []
+    warning = _warning_from_error("conv", result)
+    if warning:
+        warnings.append(warning)
+    for name, shape in result.get("shapes", {}).items():
+        warning = _warning_from_error(f"conv: {name}", shape)
+        if warning:
+            warnings.append(warning)
+    _write_results(args.out, {"conv": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_membw(args):
+    if not _is_rank0():
+        return 0
+    result = membw.run_membw(
+        sizes_mb=_parse_sizes(args.sizes_mb),
+        dtype_name=args.dtype,
+        warmup=args.warmup,
+        iters=args.iters,
+        device_name=args.device,
     )
     warnings = []
-    warning = _warning_from_error("ddp", result)
+    warning = _warning_from_error("membw", result)
     if warning:
         warnings.append(warning)
+    _write_results(args.out, {"membw": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_affinity(args):
+    result = cpu_affinity.run_cpu_affinity(
+        membw_mb=args.membw_mb,
+        gemm_size=args.gemm_size,
+        noise_work=args.noise_work,
+        noise_samples=args.noise_samples,
+        iters=args.iters,
+    )
+    warnings = []
+    warning = _warning_from_error("affinity", result)
+    if warning:
+        warnings.append(warning)
+    for overlap in result.get("overlap", []):
+        warnings.append(
+            f"affinity: ranks {overlap['ranks']} share cpus {overlap['cpus']}"
+        )
+    if result.get("cross_numa_ranks"):
+        warnings.append(
+            f"affinity: ranks {result['cross_numa_ranks']} span NUMA domains"
+        )
+    for record in result.get("ranks", []):
+        warning = _warning_from_error(f"affinity: rank {record['rank']}", record)
+        if warning:
+            warnings.append(warning)
     if _is_rank0():
-        _write_results(args.out, {"ddp_step": result}, warnings)
+        _write_results(args.out, {"cpu_affinity": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def _parse_flags(value):
+    return [token.strip() not in ("0", "false", "no") for token in _parse_names(value)]
+
+
+def cmd_dataloader(args):
+    if not _is_rank0():
+        return 0
+    result = dataloader_bench.run_dataloader(
+        cache_root=args.cache_root,
+        num_samples=args.samples,
+        sample_kb=args.sample_kb,
+        num_shards=args.shards,
+        batch_size=args.batch_size,
+        epochs=args.epochs,
+        workers=_parse_sizes(args.workers) or None,
+        prefetch=_parse_sizes(args.prefetch) or None,
+        persistent=_parse_flags(args.persistent) or None,
+        pin_memory=_parse_flags(args.pin_memory) or None,
+        start_methods=_parse_names(args.start_methods) or None,
+        kinds=_parse_names(args.datasets) or dataloader_bench.DATASET_KINDS,
+    )
+    warnings = []
+    warning = _warning_from_error("dataloader", result)
+    if warning:
+        warnings.append(warning)
+    for method in result.get("skipped_start_methods", []):
+        warnings.append(f"dataloader: start method not available: {method}")
+    for config in result.get("configs", []):
+        warning = _warning_from_error(
+            f"dataloader: {config['dataset']} workers={config['num_workers']}",
+            config,
+        )
+        if warning:
+            warnings.append(warning)
+    _write_results(args.out, {"dataloader": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_alloc(args):
+    if not _is_rank0():
+        return 0
+    confs = None
+    if args.alloc_confs is not None:
+        confs = [conf.strip() for conf in args.alloc_confs.split(";")]
+    result = alloc_stress.run_alloc_stress(
+        alloc_confs=confs,
+        steps=args.steps,
+        max_live=args.max_live,
+        median_mb=args.median_mb,
+        max_mb=args.max_mb,
+        seed=args.seed,
+    )
+    warnings = []
+    warning = _warning_from_error("alloc", result)
+    if warning:
+        warnings.append(warning)
+    elif result.get("by_conf"):
+        for label, conf_result in result["by_conf"].items():
+            warning = _warning_from_error(f"alloc: {label}", conf_result)
+            if warning:
+                warnings.append(warning)
+    _write_results(args.out, {"alloc_stress": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_precision(args):
+    configs = _parse_names(args.configs) or list(precision_matrix.CONFIGS)
+    parts = _parse_names(args.parts)
+    tests = {}
+    warnings = []
+    if "ddp" in parts:
+        tests["ddp"] = precision_matrix.run_ddp_matrix(
+            batch_size=args.batch_size,
+            input_size=args.input_size,
+            output_size=args.output_size,
+            warmup=args.warmup,
+            iters=args.iters,
+            configs=[c for c in configs if c in precision_matrix.DDP_CONFIGS],
+        )
+    if "kernel_mix" in parts and _is_rank0():
+        tests["kernel_mix"] = precision_matrix.run_kernel_mix_matrix(
+            size=args.kernel_mix_size,
+            warmup=args.warmup,
+            iters=args.iters,
+            softmax_fp32=args.softmax_fp32,
+            configs=configs,
+        )
+    if not _is_rank0():
+        return 0
+    for part, result in tests.items():
+        warning = _warning_from_error(f"precision: {part}", result)
+        if warning:
+            warnings.append(warning)
+        for name, record in result.get("configs", {}).items():
+            warning = _warning_from_error(f"precision: {part} {name}", record)
+            if warning:
+                warnings.append(warning)
+            elif not record.get("within_tolerance"):
+                warnings.append(
+                    f"precision: {part} {name} error {record.get('max_rel_err')} "
+                    f"exceeds tolerance {record.get('tolerance')}"
+                )
+    _write_results(args.out, {"precision": tests}, warnings)
+    return 0 if not any("error" in result for result in tests.values()) else 1
+
+
+def cmd_serve(args):
+    if not _is_rank0():
+        return 0
+    result = serve_bench.run_serve(
+        hidden=args.hidden,
+        layers=args.layers,
+        max_batch=args.max_batch,
+        max_delay_ms=args.max_delay_ms,
+        rates=[float(rate) for rate in _parse_names(args.rates)] or None,
+        start_rps=args.start_rps,
+        growth=args.growth,
+        max_points=args.max_points,
+        duration_s=args.duration,
+        slo_p99_ms=args.slo_p99_ms,
+    )
+    warnings = []
+    warning = _warning_from_error("serve", result)
+    if warning:
+        warnings.append(warning)
+    elif not any(point["within_slo"] for point in result["curve"]):
+        warnings.append(f"serve: no load point met the {args.slo_p99_ms} ms p99 SLO")
+    _write_results(args.out, {"serve": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_ckpt(args):
+    result = ckpt_bench.run_ckpt(
+        ckpt_dir=args.ckpt_dir,
+        size_mb=args.size_mb,
+        shape_mix=args.shape_mix,
+        dtype_name=args.dtype,
+        repeats=args.repeats,
+        threads=args.threads,
+        ops=_parse_names(args.ops) or None,
+        keep=args.keep,
+    )
+    warnings = []
+    warning = _warning_from_error("ckpt", result)
+    if warning:
+        warnings.append(warning)
+    for op, record in result.get("ops", {}).items():
+        warning = _warning_from_error(f"ckpt: {op}", record)
+        if warning:
+            warnings.append(warning)
+    if "error" not in result and not result["page_cache_evicted"]:
+        warnings.append("ckpt: could not evict the checkpoint, loads may be cached")
+    if _is_rank0():
+        _write_results(args.out, {"ckpt": result}, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_replay(args):
+    tests = {}
+    warnings = []
+    trace = args.trace
+    if args.self_check:
+        trace = os.path.join(
+            os.path.dirname(os.path.abspath(args.out)), "replay_self_check.json"
+        )
+        check = comm_replay.run_capture_check(trace)
+        tests["replay_capture_check"] = check
+        warning = _warning_from_error("replay: capture check", check)
+        if warning:
+            warnings.append(warning)
+        elif not check["ok"]:
+            warnings.append(
+                f"replay: capture check recorded {check['all_reduce_recorded']} "
+                f"all_reduce for {check['steps']} one-bucket DDP steps"
+            )
+        if warnings:
+            if _is_rank0():
+                _write_results(args.out, tests, warnings)
+            return 1
+    elif not trace:
+        raise SystemExit("replay needs --trace or --self-check")
+    result = comm_replay.run_replay(
+        trace, pacing=args.pacing, repeats=args.repeats, warmup=args.warmup
+    )
+    warning = _warning_from_error("replay", result)
+    if warning:
+        warnings.append(warning)
+    for op, reason in result.get("skipped_ops", {}).items():
+        warnings.append(f"replay: skipped {op}: {reason}")
+    if result.get("trace_dropped"):
+        warnings.append(f"replay: trace dropped {result['trace_dropped']} ops")
+    tests["replay"] = result
+    if _is_rank0():
+        _write_results(args.out, tests, warnings)
+    return 0 if "error" not in result else 1
+
+
+def cmd_startup(args):
+    # Runs on the host, not inside the container it measures.
+    if args.container:
+        os.environ.setdefault("BENCH_CONTAINER_IMAGE", args.container)
+    result = startup_bench.run_startup(
+        args.container,
+        runtime=args.runtime,
+        repeats=args.repeats,
+        cold_repeats=args.cold_repeats,
+        bind_counts=_parse_sizes(args.bind_counts),
+        bind_paths=_parse_names(args.bind_paths),
+        ranks=args.ranks,
+        rounds=args.rounds,
+        commands=_parse_names(args.commands) or None,
+    )
+    warnings = []
+    warning = _warning_from_error("startup", result)
+    if warning:
+        warnings.append(warning)
+    elif result["cold_method"] == "unavailable":
+        warnings.append("startup: could not evict the image, only warm starts timed")
+    _write_results(args.out, {"startup": result}, warnings)
     return 0 if "error" not in result else 1
 
 
@@ -238,6 +637,52 @@ def cmd_compare(args):
     return subprocess.call(cmd)
 
 
+def _add_soak_args(parser):
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=float(_env("BENCH_SOAK_DURATION", "0")),
+        help="Soak mode: keep the workload running for this many seconds (0 = off).",
+    )
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=float(_env("BENCH_SOAK_WINDOW", "10")),
+        help="Soak mode window length in seconds.",
+    )
+
+
+def _add_profile_args(parser):
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=_env("BENCH_PROFILE", "0") != "0",
+        help="Profile extra iterations after timing and record the top ops.",
+    )
+    parser.add_argument(
+        "--profile-iters",
+        type=int,
+        default=int(_env("BENCH_PROFILE_ITERS", str(profiling.DEFAULT_PROFILE_ITERS))),
+    )
+
+
+def cmd_tune(args):
+    tune_path = os.path.join(os.path.dirname(__file__), "scripts", "tune.py")
+    return subprocess.call([sys.executable, tune_path] + args.args)
+
+
+def cmd_scale(args):
+    scale_path = os.path.join(os.path.dirname(__file__), "scripts", "scale.py")
+    return subprocess.call([sys.executable, scale_path] + args.args)
+
+
+def cmd_bisect(args):
+    bisect_path = os.path.join(
+        os.path.dirname(__file__), "scripts", "bisect_images.py"
+    )
+    return subprocess.call([sys.executable, bisect_path] + args.args)
+
+
 def build_parser():
     parser = argparse.ArgumentParser(description="LUMI container benchmark")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -274,6 +719,8 @@ def build_parser():
     single.set_defaults(softmax_fp32=softmax_default)
     single.add_argument("--warmup", type=int, default=int(_env("BENCH_WARMUP", "2")))
     single.add_argument("--iters", type=int, default=int(_env("BENCH_ITERS", "5")))
+    _add_soak_args(single)
+    _add_profile_args(single)
     single.set_defaults(func=cmd_single)
 
     multi = subparsers.add_parser("multi", help="multi benchmark")
@@ -285,6 +732,8 @@ def build_parser():
         action="store_true",
         help="Run all-reduce sweep (default behavior).",
     )
+    _add_soak_args(multi)
+    _add_profile_args(multi)
     multi.set_defaults(func=cmd_multi)
 
     ddp = subparsers.add_parser("ddp", help="minimal DDP step benchmark")
@@ -293,20 +742,463 @@ def build_parser():
     ddp.add_argument("--input-size", type=int, default=int(_env("BENCH_DDP_INPUT", "4096")))
     ddp.add_argument("--output-size", type=int, default=int(_env("BENCH_DDP_OUTPUT", "4096")))
     ddp.add_argument("--dtype", default=_env("BENCH_DDP_DTYPE", "bfloat16"))
+    ddp.add_argument(
+        "--comm-trace",
+        default=_env("BENCH_COMM_TRACE", ""),
+        help="Record the collectives to this trace file for bench/run replay "
+        "('{rank}' in the path writes one file per rank).",
+    )
     ddp.add_argument("--warmup", type=int, default=int(_env("BENCH_WARMUP", "3")))
     ddp.add_argument("--iters", type=int, default=int(_env("BENCH_ITERS", "10")))
+    _add_soak_args(ddp)
+    _add_profile_args(ddp)
     ddp.set_defaults(func=cmd_ddp)
 
+    launch = subparsers.add_parser("launch", help="kernel launch overhead benchmark")
+    launch.add_argument("--out", required=True, help="Output JSON path")
+    launch.add_argument(
+        "--chain-length",
+        type=int,
+        default=int(_env("BENCH_LAUNCH_CHAIN", "100")),
+        help="Number of tiny ops per timed chain.",
+    )
+    launch.add_argument(
+        "--numel", type=int, default=int(_env("BENCH_LAUNCH_NUMEL", "1"))
+    )
+    launch.add_argument("--warmup", type=int, default=int(_env("BENCH_WARMUP", "2")))
+    launch.add_argument("--iters", type=int, default=int(_env("BENCH_ITERS", "20")))
+    launch.set_defaults(func=cmd_launch)
+
+    compile_parser = subparsers.add_parser(
+        "compile", help="torch.compile cold/warm cache benchmark"
+    )
+    compile_parser.add_argument("--out", required=True, help="Output JSON path")
+    compile_parser.add_argument(
+        "--modules",
+        default=_env("BENCH_COMPILE_MODULES", ",".join(compile_bench.DEFAULT_MODULES)),
+        help="Comma-separated modules to compile (kernel_mix, transformer).",
+    )
+    compile_parser.add_argument(
+        "--size", type=int, default=int(_env("BENCH_COMPILE_SIZE", "1024"))
+    )
+    compile_parser.add_argument(
+        "--backend", default=_env("BENCH_COMPILE_BACKEND", "inductor")
+    )
+    compile_parser.add_argument(
+        "--cache-root",
+        default=_env("BENCH_COMPILE_CACHE_ROOT", _env("BENCH_CACHE_ROOT", "")),
+        help="Directory that holds the per-run compile cache (e.g. /scratch or /tmp).",
+    )
+    compile_parser.add_argument(
+        "--keep-cache",
+        action="store_true",
+        help="Keep the compile cache directory after the run.",
+    )
+    compile_parser.add_argument(
+        "--warmup", type=int, default=int(_env("BENCH_WARMUP", "2"))
+    )
+    compile_parser.add_argument(
+        "--iters", type=int, default=int(_env("BENCH_ITERS", "5"))
+    )
+    compile_parser.set_defaults(func=cmd_compile)
+
+    conv = subparsers.add_parser(
+        "conv", help="conv2d/conv3d sweep with cold vs persisted MIOpen find-db"
+    )
+    conv.add_argument("--out", required=True, help="Output JSON path")
+    conv.add_argument(
+        "--shapes",
+        default=_env("BENCH_CONV_SHAPES", ""),
+        help="Comma-separated shape names (default: all): "
+        + ", ".join(conv_bench.DEFAULT_SHAPES),
+    )
+    conv.add_argument(
+        "--batch-size",
+        type=int,
+        default=int(_env("BENCH_CONV_BATCH", "0")),
+        help="Override every shape's batch size (0 = shape default, 1 on CPU).",
+    )
+    conv.add_argument(
+        "--no-benchmark",
+        dest="benchmark",
+        action="store_false",
+        help="Leave cudnn.benchmark off so MIOpen uses immediate mode, not find.",
+    )
+    conv.add_argument(
+        "--cache-root",
+        default=_env("BENCH_CONV_CACHE_ROOT", _env("BENCH_CACHE_ROOT", "")),
+        help="Directory that holds the per-run MIOpen find-db.",
+    )
+    conv.add_argument(
+        "--keep-cache",
+        action="store_true",
+        help="Keep the find-db directory after the run.",
+    )
+    conv.add_argument("--warmup", type=int, default=int(_env("BENCH_WARMUP", "2")))
+    conv.add_argument("--iters", type=int, default=int(_env("BENCH_ITERS", "5")))
+    conv.set_defaults(func=cmd_conv)
+
+    membw_parser = subparsers.add_parser(
+        "membw", help="STREAM-style memory bandwidth benchmark"
+    )
+    membw_parser.add_argument("--out", required=True, help="Output JSON path")
+    membw_parser.add_argument(
+        "--sizes-mb",
+        default=_env("BENCH_MEMBW_SIZES_MB", ""),
+        help="Comma-separated buffer sizes in MiB.",
+    )
+    membw_parser.add_argument("--dtype", default=_env("BENCH_MEMBW_DTYPE", "float32"))
+    membw_parser.add_argument(
+        "--device",
+        default=_env("BENCH_MEMBW_DEVICE", ""),
+        help="Force a torch device (e.g. cpu); defaults to the GPU when present.",
+    )
+    membw_parser.add_argument(
+        "--warmup", type=int, default=int(_env("BENCH_WARMUP", "2"))
+    )
+    membw_parser.add_argument(
+        "--iters", type=int, default=int(_env("BENCH_ITERS", "5"))
+    )
+    membw_parser.set_defaults(func=cmd_membw)
+
+    affinity = subparsers.add_parser(
+        "affinity", help="CPU binding, NUMA and OS-noise check on every rank"
+    )
+    affinity.add_argument("--out", required=True, help="Output JSON path")
+    affinity.add_argument(
+        "--membw-mb", type=int, default=int(_env("BENCH_AFFINITY_MEMBW_MB", "256"))
+    )
+    affinity.add_argument(
+        "--gemm-size", type=int, default=int(_env("BENCH_AFFINITY_GEMM_SIZE", "512"))
+    )
+    affinity.add_argument(
+        "--noise-work",
+        type=int,
+        default=int(_env("BENCH_AFFINITY_NOISE_WORK", "20000")),
+        help="Loop iterations in one fixed work quantum.",
+    )
+    affinity.add_argument(
+        "--noise-samples",
+        type=int,
+        default=int(_env("BENCH_AFFINITY_NOISE_SAMPLES", "200")),
+        help="Quanta timed per bound core.",
+    )
+    affinity.add_argument("--iters", type=int, default=int(_env("BENCH_ITERS", "5")))
+    affinity.set_defaults(func=cmd_affinity)
+
+    loader = subparsers.add_parser(
+        "dataloader", help="DataLoader input-pipeline throughput benchmark"
+    )
+    loader.add_argument("--out", required=True, help="Output JSON path")
+    loader.add_argument(
+        "--cache-root",
+        default=_env("BENCH_CACHE_ROOT", ""),
+        help="Where the synthetic dataset is generated and reused.",
+    )
+    loader.add_argument(
+        "--datasets",
+        default=_env("BENCH_DATALOADER_DATASETS", "files,shards"),
+        help="Comma-separated dataset kinds: files (one small file per sample), "
+        "shards (large memory-mapped files).",
+    )
+    loader.add_argument(
+        "--samples", type=int, default=int(_env("BENCH_DATALOADER_SAMPLES", "4096"))
+    )
+    loader.add_argument(
+        "--sample-kb", type=int, default=int(_env("BENCH_DATALOADER_SAMPLE_KB", "64"))
+    )
+    loader.add_argument(
+        "--shards", type=int, default=int(_env("BENCH_DATALOADER_SHARDS", "4"))
+    )
+    loader.add_argument(
+        "--batch-size", type=int, default=int(_env("BENCH_DATALOADER_BATCH", "32"))
+    )
+    loader.add_argument(
+        "--epochs", type=int, default=int(_env("BENCH_DATALOADER_EPOCHS", "2"))
+    )
+    loader.add_argument("--workers", default=_env("BENCH_DATALOADER_WORKERS", "0,2,4"))
+    loader.add_argument("--prefetch", default=_env("BENCH_DATALOADER_PREFETCH", "2"))
+    loader.add_argument(
+        "--persistent", default=_env("BENCH_DATALOADER_PERSISTENT", "0,1")
+    )
+    loader.add_argument("--pin-memory", default=_env("BENCH_DATALOADER_PIN", "0"))
+    loader.add_argument(
+        "--start-methods", default=_env("BENCH_DATALOADER_START", "fork,spawn")
+    )
+    loader.set_defaults(func=cmd_dataloader)
+
+    alloc = subparsers.add_parser("alloc", help="memory allocator stress benchmark")
+    alloc.add_argument("--out", required=True, help="Output JSON path")
+    alloc.add_argument(
+        "--alloc-confs",
+        default=os.environ.get("BENCH_ALLOC_CONFS"),
+        help="Semicolon-separated PYTORCH_HIP_ALLOC_CONF values to compare; "
+        "an empty entry means the allocator default.",
+    )
+    alloc.add_argument(
+        "--steps", type=int, default=int(_env("BENCH_ALLOC_STEPS", "2000"))
+    )
+    alloc.add_argument(
+        "--max-live", type=int, default=int(_env("BENCH_ALLOC_MAX_LIVE", "64"))
+    )
+    alloc.add_argument(
+        "--median-mb", type=float, default=float(_env("BENCH_ALLOC_MEDIAN_MB", "1"))
+    )
+    alloc.add_argument(
+        "--max-mb", type=float, default=float(_env("BENCH_ALLOC_MAX_MB", "256"))
+    )
+    alloc.add_argument("--seed", type=int, default=int(_env("BENCH_ALLOC_SEED", "0")))
+    alloc.set_defaults(func=cmd_alloc)
+
+    precision = subparsers.add_parser(
+        "precision", help="dtype matrix with numerical error against fp64"
+    )
+    precision.add_argument("--out", required=True, help="Output JSON path")
+    precision.add_argument(
+        "--configs",
+        default=_env("BENCH_PRECISION_CONFIGS", ",".join(precision_matrix.CONFIGS)),
+        help="Comma-separated configs: " + ", ".join(precision_matrix.CONFIGS),
+    )
+    precision.add_argument(
+        "--parts",
+        default=_env("BENCH_PRECISION_PARTS", "kernel_mix,ddp"),
+        help="Comma-separated workloads to run: kernel_mix, ddp.",
+    )
+    precision.add_argument(
+        "--kernel-mix-size",
+        type=int,
+        default=int(_env("BENCH_KERNEL_MIX_SIZE", "2048")),
+    )
+    precision.add_argument(
+        "--no-softmax-fp32",
+        dest="softmax_fp32",
+        action="store_false",
+        default=_env("BENCH_KERNEL_MIX_SOFTMAX_FP32", "1") != "0",
+        help="Keep softmax and GELU in the config dtype.",
+    )
+    precision.add_argument(
+        "--batch-size", type=int, default=int(_env("BENCH_DDP_BATCH", "64"))
+    )
+    precision.add_argument(
+        "--input-size", type=int, default=int(_env("BENCH_DDP_INPUT", "4096"))
+    )
+    precision.add_argument(
+        "--output-size", type=int, default=int(_env("BENCH_DDP_OUTPUT", "4096"))
+    )
+    precision.add_argument("--warmup", type=int, default=int(_env("BENCH_WARMUP", "2")))
+    precision.add_argument("--iters", type=int, default=int(_env("BENCH_ITERS", "5")))
+    precision.set_defaults(func=cmd_precision)
+
+    serve = subparsers.add_parser(
+        "serve", help="micro-batched inference latency vs throughput"
+    )
+    serve.add_argument("--out", required=True, help="Output JSON path")
+    serve.add_argument(
+        "--hidden", type=int, default=int(_env("BENCH_SERVE_HIDDEN", "1024"))
+    )
+    serve.add_argument(
+        "--layers", type=int, default=int(_env("BENCH_SERVE_LAYERS", "4"))
+    )
+    serve.add_argument(
+        "--max-batch", type=int, default=int(_env("BENCH_SERVE_MAX_BATCH", "32"))
+    )
+    serve.add_argument(
+        "--max-delay-ms",
+        type=float,
+        default=float(_env("BENCH_SERVE_MAX_DELAY_MS", "2")),
+        help="Longest time the oldest queued request waits for a batch to fill.",
+    )
+    serve.add_argument(
+        "--rates",
+        default=_env("BENCH_SERVE_RATES", ""),
+        help="Comma-separated request rates; default grows from --start-rps "
+        "until the server saturates.",
+    )
+    serve.add_argument(
+        "--start-rps",
+        type=float,
+        default=float(_env("BENCH_SERVE_START_RPS", "50")),
+    )
+    serve.add_argument(
+        "--growth", type=float, default=float(_env("BENCH_SERVE_GROWTH", "2"))
+    )
+    serve.add_argument(
+        "--max-points", type=int, default=int(_env("BENCH_SERVE_MAX_POINTS", "10"))
+    )
+    serve.add_argument(
+        "--duration",
+        type=float,
+        default=float(_env("BENCH_SERVE_DURATION", "5")),
+        help="Seconds of arrivals per load point.",
+    )
+    serve.add_argument(
+        "--slo-p99-ms",
+        type=float,
+        default=float(_env("BENCH_SERVE_SLO_P99_MS", "50")),
+    )
+    serve.set_defaults(func=cmd_serve)
+
+    ckpt = subparsers.add_parser(
+        "ckpt", help="checkpoint save/load throughput, torch.save and DCP"
+    )
+    ckpt.add_argument("--out", required=True, help="Output JSON path")
+    ckpt.add_argument(
+        "--ckpt-dir",
+        default=_env("BENCH_CKPT_DIR", _env("BENCH_CACHE_ROOT", "")),
+        help="Shared directory to write checkpoints under, e.g. on /scratch "
+        "or /flash.",
+    )
+    ckpt.add_argument(
+        "--size-mb",
+        type=int,
+        default=int(_env("BENCH_CKPT_SIZE_MB", "1024")),
+        help="State dict size per rank.",
+    )
+    ckpt.add_argument(
+        "--shape-mix",
+        choices=ckpt_bench.SHAPE_MIXES,
+        default=_env("BENCH_CKPT_SHAPE_MIX", "transformer"),
+    )
+    ckpt.add_argument("--dtype", default=_env("BENCH_CKPT_DTYPE", "bfloat16"))
+    ckpt.add_argument(
+        "--ops",
+        default=_env("BENCH_CKPT_OPS", ""),
+        help="Comma-separated ops (default: all): " + ", ".join(ckpt_bench.OPS),
+    )
+    ckpt.add_argument(
+        "--threads",
+        type=int,
+        default=int(_env("BENCH_CKPT_THREADS", "1")),
+        help="Writer threads per rank for torch.distributed.checkpoint.",
+    )
+    ckpt.add_argument(
+        "--repeats", type=int, default=int(_env("BENCH_CKPT_REPEATS", "3"))
+    )
+    ckpt.add_argument(
+        "--keep", action="store_true", help="Keep the checkpoints after the run."
+    )
+    ckpt.set_defaults(func=cmd_ckpt)
+
+    replay = subparsers.add_parser(
+        "replay", help="replay a recorded collective trace"
+    )
+    replay.add_argument("--out", required=True, help="Output JSON path")
+    replay.add_argument(
+        "--trace",
+        default="",
+        help="Trace written by common/comm_trace.py ('{rank}' selects per-rank files).",
+    )
+    replay.add_argument(
+        "--self-check",
+        action="store_true",
+        help="Capture a one-bucket DDP trace (gloo works), check that it holds "
+        "one all_reduce per step, then replay it.",
+    )
+    replay.add_argument(
+        "--pacing",
+        choices=comm_replay.PACINGS,
+        default=_env("BENCH_REPLAY_PACING", "original"),
+        help="original: keep the recorded gaps between collectives; "
+        "none: issue them back to back.",
+    )
+    replay.add_argument(
+        "--repeats", type=int, default=int(_env("BENCH_REPLAY_REPEATS", "3"))
+    )
+    replay.add_argument(
+        "--warmup",
+        type=int,
+        default=int(_env("BENCH_REPLAY_WARMUP", "1")),
+        help="Unmeasured passes (at least one) that find ops failing on any rank.",
+    )
+    replay.set_defaults(func=cmd_replay)
+
+    startup = subparsers.add_parser(
+        "startup", help="container launch latency, cold/warm and per bind mount"
+    )
+    startup.add_argument("--out", required=True, help="Output JSON path")
+    startup.add_argument(
+        "--container",
+        default=_env("BENCH_CONTAINER_IMAGE", _env("CONTAINER_IMAGE", "")),
+        help="Image to launch (run this on the host, not through a template).",
+    )
+    startup.add_argument(
+        "--runtime",
+        default=_env("BENCH_STARTUP_RUNTIME", _env("APPTAINER_CMD", "apptainer")),
+        help="Runtime command; 'exec <binds> <image> <command>' is appended.",
+    )
+    startup.add_argument(
+        "--commands",
+        default=_env("BENCH_STARTUP_COMMANDS", ""),
+        help="Comma-separated commands to time (default: all): "
+        + ", ".join(startup_bench.COMMANDS),
+    )
+    startup.add_argument(
+        "--repeats", type=int, default=int(_env("BENCH_STARTUP_REPEATS", "10"))
+    )
+    startup.add_argument(
+        "--cold-repeats",
+        type=int,
+        default=int(_env("BENCH_STARTUP_COLD_REPEATS", "3")),
+        help="Launches after evicting the image from the page cache.",
+    )
+    startup.add_argument(
+        "--bind-counts",
+        default=_env(
+            "BENCH_STARTUP_BIND_COUNTS",
+            ",".join(str(count) for count in startup_bench.DEFAULT_BIND_COUNTS),
+        ),
+    )
+    startup.add_argument(
+        "--bind-paths",
+        default=_env("BENCH_STARTUP_BIND_PATHS", ""),
+        help="Comma-separated host paths to bind first, e.g. the template's "
+        "/scratch, /flash, /project and /users roots.",
+    )
+    startup.add_argument(
+        "--ranks",
+        type=int,
+        default=_int_env("BENCH_STARTUP_RANKS", _int_env("BENCH_NTASKS_PER_NODE", 8)),
+        help="Concurrent launches, as from every rank on one node.",
+    )
+    startup.add_argument(
+        "--rounds", type=int, default=int(_env("BENCH_STARTUP_ROUNDS", "3"))
+    )
+    startup.set_defaults(func=cmd_startup)
+
     compare = subparsers.add_parser("compare", help="A/B comparison")
     compare.add_argument("args", nargs=argparse.REMAINDER)
     compare.set_defaults(func=cmd_compare)
 
+    tune = subparsers.add_parser(
+        "tune", help="successive-halving launch configuration tuner"
+    )
+    tune.add_argument("args", nargs=argparse.REMAINDER)
+    tune.set_defaults(func=cmd_tune)
+
+    scale = subparsers.add_parser(
+        "scale", help="multi-node weak/strong scaling study"
+    )
+    scale.add_argument("args", nargs=argparse.REMAINDER)
+    scale.set_defaults(func=cmd_scale)
+
+    bisect = subparsers.add_parser(
+        "bisect", help="find the first regressed image in an ordered series"
+    )
+    bisect.add_argument("args", nargs=argparse.REMAINDER)
+    bisect.set_defaults(func=cmd_bisect)
+
     return parser
 
 
 def main(argv=None):
     parser = build_parser()
-    args = parser.parse_args(argv)
+    args, extra = parser.parse_known_args(argv)
+    if extra:
+        # Pass-through commands (compare, tune, scale, bisect) forward options
+        # they do not define themselves.
+        if not hasattr(args, "args"):
+            parser.error("unrecognized arguments: " + " ".join(extra))
+        args.args = extra + args.args
     return args.func(args)
 
 
@@ -0,0 +1,145 @@
+import gzip
+import inspect
+import json
+import os
+import time
+
+
+TRACE_VERSION = 1
+DEFAULT_MAX_OPS = 200000
+# Collective -> name of the argument whose size is recorded. For the gather,
+# scatter and all-to-all ops that is the per-rank input.
+TRACED_OPS = {
+    "all_reduce": "tensor",
+    "broadcast": "tensor",
+    "reduce": "tensor",
+    "all_gather": "tensor",
+    "all_gather_into_tensor": "input_tensor",
+    "reduce_scatter_tensor": "input",
+    "all_to_all_single": "input",
+    "barrier": None,
+}
+WORLD_GROUP = 0
+
+
+def trace_file(path, rank):
+    return path.format(rank=rank) if "{rank}" in path else path
+
+
+def load(path, rank=0):
+    path = trace_file(path, rank)
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        trace = json.load(handle)
+    if trace.get("version") != TRACE_VERSION:
+        raise ValueError(f"unsupported trace version: {trace.get('version')}")
+    return trace
+
+
+class CommTracer:
+    # Records every collective as [op, dtype, numel, group, gap_us], where gap_us
+    # is the time since the previous collective was issued. Only issue times
+    # are kept, so async ops and DDP buckets cost nothing extra to trace.
+
+    def __init__(self, torch_mod, path, max_ops=DEFAULT_MAX_OPS):
+        self.torch = torch_mod
+        self.dist = torch_mod.distributed
+        self.path = path
+        self.max_ops = max_ops
+        self.ops = []
+        self.groups = [None]
+        self.dropped = 0
+        self._last_issue = None
+        self._originals = {}
+
+    def _group_index(self, group):
+        if group is None or group is self.dist.group.WORLD:
+            return WORLD_GROUP
+        ranks = list(self.dist.get_process_group_ranks(group))
+        if ranks == list(range(self.dist.get_world_size())):
+            return WORLD_GROUP
+        if ranks not in self.groups:
+            self.groups.append(ranks)
+        return self.groups.index(ranks)
+
+    def record(self, op, tensor=None, group=None):
+        now = time.perf_counter()
+        gap_us = 0 if self._last_issue is None else (now - self._last_issue) * 1e6
+        self._last_issue = now
+        if len(self.ops) >= self.max_ops:
+            self.dropped += 1
+            return
+        dtype = str(tensor.dtype).replace("torch.", "") if tensor is not None else ""
+        numel = tensor.numel() if tensor is not None else 0
+        self.ops.append([op, dtype, numel, self._group_index(group), round(gap_us)])
+
+    def _wrap(self, name, original):
+        signature = inspect.signature(original)
+        tensor_arg = TRACED_OPS[name]
+
+        def traced(*args, **kwargs):
+            bound = signature.bind_partial(*args, **kwargs).arguments
+            tensor = bound.get(tensor_arg) if tensor_arg else None
+            self.record(name, tensor, bound.get("group"))
+            return original(*args, **kwargs)
+
+        traced.__wrapped__ = original
+        return traced
+
+    def install(self):
+        # Patches the torch.distributed module attributes; code that imported a
+        # collective by name before this call keeps the untraced function.
+        for name in TRACED_OPS:
+            original = getattr(self.dist, name, None)
+            if original is None or name in self._originals:
+                continue
+            self._originals[name] = original
+            setattr(self.dist, name, self._wrap(name, original))
+        return self
+
+    def uninstall(self):
+        for name, original in self._originals.items():
+            setattr(self.dist, name, original)
+        self._originals = {}
+
+    def ddp_hook(self, state, bucket):
+        # DDP reduces its buckets in C++, past the patched Python API. Register
+        # with model.register_comm_hook(None, tracer.ddp_hook) to trace them.
+        # Same as default_hooks.allreduce_hook, but through the untraced
+        # all_reduce so each bucket is recorded once.
+        group = state if state is not None else self.dist.group.WORLD
+        tensor = bucket.buffer().div_(group.size())
+        self.record("all_reduce", tensor, group)
+        all_reduce = self._originals.get("all_reduce", self.dist.all_reduce)
+        work = all_reduce(tensor, group=group, async_op=True)
+        return work.get_future().then(lambda fut: fut.value()[0])
+
+    def save(self):
+        initialized = self.dist.is_available() and self.dist.is_initialized()
+        rank = self.dist.get_rank() if initialized else 0
+        if "{rank}" not in self.path and rank != 0:
+            return None
+        path = trace_file(self.path, rank)
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        trace = {
+            "version": TRACE_VERSION,
+            "rank": rank,
+            "world_size": self.dist.get_world_size() if initialized else 1,
+            "backend": str(self.dist.get_backend()) if initialized else "",
+            "torch_version": self.torch.__version__,
+            "groups": self.groups,
+            "dropped": self.dropped,
+            "ops": self.ops,
+        }
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as handle:
+            json.dump(trace, handle, separators=(",", ":"))
+        return path
+
+
+def install(path, max_ops=DEFAULT_MAX_OPS):
+    import torch
+
+    return CommTracer(torch, path, max_ops=max_ops).install()
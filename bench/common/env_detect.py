@@ -1,3 +1,4 @@
+import glob
 import os
 import shutil
 import socket
@@ -34,6 +35,55 @@ def gpu_count_from_env():
     return 0
 
 
+def parse_cpulist(value):
+    cpus = set()
+    for token in (value or "").strip().split(","):
+        token = token.strip()
+        if not token:
+            continue
+        if "-" in token:
+            start, end = token.split("-", 1)
+            cpus.update(range(int(start), int(end) + 1))
+        else:
+            cpus.add(int(token))
+    return cpus
+
+
+def format_cpulist(cpus):
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(
+        str(start) if start == end else f"{start}-{end}" for start, end in ranges
+    )
+
+
+def numa_nodes():
+    nodes = {}
+    for path in glob.glob("/sys/devices/system/node/node[0-9]*/cpulist"):
+        node = int(os.path.basename(os.path.dirname(path))[len("node"):])
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                nodes[node] = parse_cpulist(handle.read())
+        except (OSError, ValueError):
+            continue
+    return nodes
+
+
+def process_rss_bytes(pid="self"):
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
 def run_cmd(cmd):
     try:
         completed = subprocess.run(
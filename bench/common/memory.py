@@ -0,0 +1,76 @@
+import resource
+import tracemalloc
+
+from common import env_detect
+
+
+MB = 1024 * 1024
+
+_tracemalloc_owner = False
+
+
+def _device_available(torch_mod):
+    return torch_mod is not None and torch_mod.cuda.is_available()
+
+
+def _mb(value):
+    return value / MB if value is not None else None
+
+
+def peak_rss_bytes():
+    # ru_maxrss is reported in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def reset(torch_mod=None, device=None):
+    global _tracemalloc_owner
+    if _device_available(torch_mod):
+        torch_mod.cuda.synchronize(device)
+        torch_mod.cuda.reset_peak_memory_stats(device)
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracemalloc_owner = True
+    else:
+        tracemalloc.reset_peak()
+
+
+def report(torch_mod=None, device=None):
+    global _tracemalloc_owner
+    result = {
+        "rss_mb": _mb(env_detect.process_rss_bytes()),
+        "peak_rss_mb": _mb(peak_rss_bytes()),
+    }
+    if _device_available(torch_mod):
+        torch_mod.cuda.synchronize(device)
+        stats = torch_mod.cuda.memory_stats(device)
+        peak_allocated = stats.get("allocated_bytes.all.peak", 0)
+        peak_reserved = stats.get("reserved_bytes.all.peak", 0)
+        result.update(
+            {
+                "source": "device",
+                "allocated_mb": _mb(stats.get("allocated_bytes.all.current", 0)),
+                "reserved_mb": _mb(stats.get("reserved_bytes.all.current", 0)),
+                "peak_allocated_mb": _mb(peak_allocated),
+                "peak_reserved_mb": _mb(peak_reserved),
+                "reserved_to_allocated": (
+                    peak_reserved / peak_allocated if peak_allocated else None
+                ),
+                "alloc_retries": stats.get("num_alloc_retries", 0),
+                "ooms": stats.get("num_ooms", 0),
+            }
+        )
+        return result
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        result.update(
+            {
+                "source": "tracemalloc",
+                "traced_mb": _mb(current),
+                "peak_traced_mb": _mb(peak),
+            }
+        )
+        if _tracemalloc_owner:
+            tracemalloc.stop()
+            _tracemalloc_owner = False
+    return result
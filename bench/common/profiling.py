@@ -0,0 +1,98 @@
+import gzip
+import os
+import shutil
+import tempfile
+
+
+DEFAULT_PROFILE_ITERS = 3
+DEFAULT_TOP_N = 15
+
+
+def trace_path(out_path, name):
+    stem = os.path.basename(out_path)
+    if stem.endswith(".json"):
+        stem = stem[: -len(".json")]
+    return os.path.join(os.path.dirname(out_path), f"{stem}.{name}.trace.json.gz")
+
+
+def _self_time_us(event, device):
+    if device:
+        for attr in ("self_device_time_total", "self_cuda_time_total"):
+            value = getattr(event, attr, None)
+            if value is not None:
+                return float(value)
+        return 0.0
+    return float(getattr(event, "self_cpu_time_total", 0.0))
+
+
+def top_ops(events, iters, top_n=DEFAULT_TOP_N, device=False):
+    rows = []
+    for event in events:
+        self_us = _self_time_us(event, device)
+        if self_us <= 0:
+            continue
+        rows.append(
+            {
+                "name": event.key,
+                "calls": int(event.count),
+                "self_time_us": self_us,
+                "self_time_us_per_iter": self_us / max(iters, 1),
+            }
+        )
+    total = sum(row["self_time_us"] for row in rows)
+    rows.sort(key=lambda row: row["self_time_us"], reverse=True)
+    rows = rows[: max(top_n, 1)]
+    for row in rows:
+        row["share"] = row["self_time_us"] / total if total > 0 else None
+    return rows
+
+
+def _write_trace(prof, path):
+    dir_name = os.path.dirname(path)
+    if dir_name:
+        os.makedirs(dir_name, exist_ok=True)
+    handle, raw_path = tempfile.mkstemp(suffix=".json", dir=dir_name or None)
+    os.close(handle)
+    try:
+        prof.export_chrome_trace(raw_path)
+        with open(raw_path, "rb") as src, gzip.open(path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+    finally:
+        os.remove(raw_path)
+
+
+def profile_ops(fn, iters=DEFAULT_PROFILE_ITERS, trace_path="", top_n=DEFAULT_TOP_N):
+    # Called after the timed samples so the profiler overhead never leaks into
+    # the reported latencies.
+    try:
+        import torch
+        from torch.profiler import ProfilerActivity, profile
+    except ImportError:
+        return {"error": "torch.profiler not available"}
+
+    device = torch.cuda.is_available()
+    activities = [ProfilerActivity.CPU]
+    if device:
+        activities.append(ProfilerActivity.CUDA)
+
+    iters = max(iters, 1)
+    try:
+        with profile(activities=activities) as prof:
+            for _ in range(iters):
+                fn()
+        table = top_ops(prof.key_averages(), iters, top_n=top_n, device=device)
+    except Exception as exc:
+        return {"error": f"profiler failed: {exc}"}
+
+    result = {
+        "iters": iters,
+        "time_base": "device" if device else "cpu",
+        "top_ops": table,
+    }
+    if trace_path:
+        try:
+            _write_trace(prof, trace_path)
+            result["trace_path"] = trace_path
+        except OSError as exc:
+            result["trace_error"] = str(exc)
+    return result
@@ -0,0 +1,180 @@
+import os
+import statistics
+import time
+
+from common import stats
+
+
+DEFAULT_WINDOW_S = 10.0
+DEFAULT_DRIFT_PCT = 5.0
+MIN_WINDOWS = 3
+MONOTONIC_TAU = 0.6
+
+CONTINUE = 0
+CLOSE_WINDOW = 1
+STOP = 2
+
+
+def drift_threshold():
+    try:
+        return float(os.environ.get("BENCH_SOAK_DRIFT_PCT", DEFAULT_DRIFT_PCT))
+    except ValueError:
+        return DEFAULT_DRIFT_PCT
+
+
+def _window_record(index, offset_s, wall_s, window, busy_s, units_per_step):
+    steps = window.count
+    return {
+        "index": index,
+        "start_s": offset_s,
+        "wall_s": wall_s,
+        "steps": steps,
+        "p50_ms": window.percentile(50),
+        "p95_ms": window.percentile(95),
+        "throughput": (steps * units_per_step / busy_s) if busy_s > 0 else None,
+    }
+
+
+def _linear_trend_pct(values):
+    n = len(values)
+    mean_x = (n - 1) / 2.0
+    mean_y = sum(values) / n
+    cov = sum((i - mean_x) * (v - mean_y) for i, v in enumerate(values))
+    var = sum((i - mean_x) ** 2 for i in range(n))
+    if var == 0 or mean_y == 0:
+        return None
+    slope = cov / var
+    return slope * (n - 1) / mean_y * 100.0
+
+
+def _kendall_tau(values):
+    n = len(values)
+    score = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            diff = values[j] - values[i]
+            score += (diff > 0) - (diff < 0)
+    return score / (n * (n - 1) / 2.0)
+
+
+def _step_change(values, sign=1.0):
+    # Largest step in the worsening direction (sign=1 when higher is worse),
+    # so an early improvement such as warm-up cannot hide a later regression.
+    best = None
+    for split in range(2, len(values) - 1):
+        # Medians, so one slow warm-up window does not mask the step.
+        before = statistics.median(values[:split])
+        after = statistics.median(values[split:])
+        if before == 0:
+            continue
+        delta_pct = (after - before) / before * 100.0
+        if best is None or sign * delta_pct > sign * best["delta_pct"]:
+            best = {"window": split, "delta_pct": delta_pct}
+    return best
+
+
+def detect_drift(values, higher_is_worse=True, threshold_pct=None):
+    limit = drift_threshold() if threshold_pct is None else threshold_pct
+    values = [v for v in values if v is not None]
+    result = {
+        "threshold_pct": limit,
+        "windows": len(values),
+        "trend_pct": None,
+        "kendall_tau": None,
+        "step_change": None,
+        "verdict": "insufficient_windows",
+    }
+    if len(values) < MIN_WINDOWS:
+        return result
+
+    sign = 1.0 if higher_is_worse else -1.0
+    trend_pct = _linear_trend_pct(values)
+    tau = _kendall_tau(values)
+    step = _step_change(values, sign) if len(values) >= 4 else None
+    result.update(
+        {
+            "trend_pct": trend_pct,
+            "kendall_tau": tau,
+            "step_change": step,
+            "verdict": "stable",
+        }
+    )
+    if (
+        trend_pct is not None
+        and sign * trend_pct > limit
+        and sign * tau >= MONOTONIC_TAU
+    ):
+        result["verdict"] = "drift"
+    elif step is not None and sign * step["delta_pct"] > limit:
+        result["verdict"] = "step_change"
+    return result
+
+
+def run_soak(
+    step,
+    duration_s,
+    window_s=DEFAULT_WINDOW_S,
+    units_per_step=1.0,
+    units="steps",
+    agree=None,
+):
+    # `agree` combines the per-rank control code (max across ranks) so every
+    # rank closes windows and stops on the same step; it runs outside the
+    # timed region.
+    agree = agree or (lambda code: code)
+    window_s = max(float(window_s), 1.0e-3)
+    overall = stats.StreamingStats()
+    window = stats.StreamingStats()
+    windows = []
+    busy_s = 0.0
+    start = time.perf_counter()
+    window_start = start
+
+    while True:
+        t0 = time.perf_counter()
+        step()
+        elapsed = time.perf_counter() - t0
+        window.add(elapsed * 1000.0)
+        overall.add(elapsed * 1000.0)
+        busy_s += elapsed
+
+        now = time.perf_counter()
+        code = CONTINUE
+        if now - start >= duration_s:
+            code = STOP
+        elif now - window_start >= window_s:
+            code = CLOSE_WINDOW
+        code = agree(code)
+        if code == CONTINUE:
+            continue
+        windows.append(
+            _window_record(
+                len(windows),
+                window_start - start,
+                now - window_start,
+                window,
+                busy_s,
+                units_per_step,
+            )
+        )
+        window = stats.StreamingStats()
+        busy_s = 0.0
+        window_start = now
+        if code == STOP:
+            break
+
+    # A short trailing window (duration not a multiple of window_s) would add
+    # noise to the trend, so only near-full windows feed the verdict.
+    full = [w for w in windows if w["wall_s"] >= 0.5 * window_s] or windows
+    return {
+        "duration_s": time.perf_counter() - start,
+        "window_s": window_s,
+        "units": units,
+        "units_per_step": units_per_step,
+        "overall_ms": overall.summary(),
+        "windows": windows,
+        "drift": detect_drift([w["p50_ms"] for w in full], higher_is_worse=True),
+        "throughput_drift": detect_drift(
+            [w["throughput"] for w in full], higher_is_worse=False
+        ),
+    }
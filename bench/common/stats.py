@@ -1,33 +1,208 @@
+import math
 import time
-import statistics
 
 
-def _percentile(values, pct):
-    if not values:
-        return None
-    values_sorted = sorted(values)
-    k = (len(values_sorted) - 1) * (pct / 100.0)
-    f = int(k)
-    c = min(f + 1, len(values_sorted) - 1)
-    if f == c:
-        return values_sorted[f]
-    d0 = values_sorted[f] * (c - k)
-    d1 = values_sorted[c] * (k - f)
-    return d0 + d1
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+
+
+class StreamingStats:
+    # Log-bucketed quantile sketch (DDSketch-style): every reported quantile is
+    # within relative_accuracy of a true sample value, memory is bounded by
+    # max_bins, and two sketches with the same accuracy merge exactly.
+
+    def __init__(
+        self,
+        relative_accuracy=DEFAULT_RELATIVE_ACCURACY,
+        max_bins=DEFAULT_MAX_BINS,
+    ):
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self._zero_count = 0
+        self._bins = {}
+        self._negative_bins = {}
+
+    def _index(self, value):
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def _bin_value(self, index):
+        return 2.0 * self._gamma**index / (self._gamma + 1.0)
+
+    def _collapse(self, bins):
+        # Fold the smallest-magnitude bins together once the cap is hit so the
+        # upper quantiles keep their accuracy.
+        while len(bins) > self.max_bins:
+            lowest, second = sorted(bins)[:2]
+            bins[second] += bins.pop(lowest)
+
+    def add(self, value):
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if value > 0.0:
+            index = self._index(value)
+            self._bins[index] = self._bins.get(index, 0) + 1
+            self._collapse(self._bins)
+        elif value < 0.0:
+            index = self._index(-value)
+            self._negative_bins[index] = self._negative_bins.get(index, 0) + 1
+            self._collapse(self._negative_bins)
+        else:
+            self._zero_count += 1
+        return self
+
+    def extend(self, values):
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other):
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError("cannot merge sketches with different accuracy")
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.mean = other.mean
+            self._m2 = other._m2
+        else:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / total
+            self.mean += delta * other.count / total
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._zero_count += other._zero_count
+        for target, source in (
+            (self._bins, other._bins),
+            (self._negative_bins, other._negative_bins),
+        ):
+            for index, count in source.items():
+                target[index] = target.get(index, 0) + count
+            self._collapse(target)
+        return self
+
+    @property
+    def variance(self):
+        if self.count < 2:
+            return 0.0 if self.count else None
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stdev(self):
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def quantile(self, q):
+        if self.count == 0:
+            return None
+        if q <= 0.0:
+            return self.min
+        if q >= 1.0:
+            return self.max
+        rank = q * (self.count - 1)
+        cumulative = 0
+        for index in sorted(self._negative_bins, reverse=True):
+            cumulative += self._negative_bins[index]
+            if cumulative > rank:
+                return max(-self._bin_value(index), self.min)
+        cumulative += self._zero_count
+        if cumulative > rank:
+            return 0.0
+        for index in sorted(self._bins):
+            cumulative += self._bins[index]
+            if cumulative > rank:
+                return min(self._bin_value(index), self.max)
+        return self.max
+
+    def percentile(self, pct):
+        return self.quantile(pct / 100.0)
+
+    def summary(self, scale=1.0):
+        def _scaled(value):
+            return value * scale if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean": _scaled(self.mean if self.count else None),
+            "min": _scaled(self.min),
+            "max": _scaled(self.max),
+            "stdev": _scaled(self.stdev),
+            "p50": _scaled(self.percentile(50)),
+            "p95": _scaled(self.percentile(95)),
+            "p99": _scaled(self.percentile(99)),
+        }
+
+    def to_dict(self):
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self._m2,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self._zero_count,
+            "bins": {str(k): v for k, v in sorted(self._bins.items())},
+            "negative_bins": {
+                str(k): v for k, v in sorted(self._negative_bins.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(
+            relative_accuracy=state.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY),
+            max_bins=state.get("max_bins", DEFAULT_MAX_BINS),
+        )
+        sketch.count = state.get("count", 0)
+        sketch.mean = state.get("mean", 0.0)
+        sketch._m2 = state.get("m2", 0.0)
+        sketch.min = state.get("min")
+        sketch.max = state.get("max")
+        sketch._zero_count = state.get("zero_count", 0)
+        sketch._bins = {int(k): v for k, v in state.get("bins", {}).items()}
+        sketch._negative_bins = {
+            int(k): v for k, v in state.get("negative_bins", {}).items()
+        }
+        return sketch
+
+
+def merge_states(states):
+    merged = None
+    for state in states:
+        if not state:
+            continue
+        sketch = StreamingStats.from_dict(state)
+        merged = sketch if merged is None else merged.merge(sketch)
+    return merged
 
 
 def timeit(fn, warmup=2, iters=5):
     for _ in range(max(warmup, 0)):
         fn()
-    durations = []
+    sketch = StreamingStats()
     for _ in range(max(iters, 1)):
         start = time.perf_counter()
         fn()
         end = time.perf_counter()
-        durations.append(end - start)
+        sketch.add(end - start)
     return {
-        "durations_s": durations,
-        "p50_s": _percentile(durations, 50),
-        "p95_s": _percentile(durations, 95),
-        "mean_s": statistics.mean(durations) if durations else None,
+        "stats": sketch,
+        "p50_s": sketch.percentile(50),
+        "p95_s": sketch.percentile(95),
+        "mean_s": sketch.mean if sketch.count else None,
     }
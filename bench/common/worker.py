@@ -0,0 +1,42 @@
+import json
+import os
+import subprocess
+import sys
+
+
+RESULT_PREFIX = "BENCH_WORKER_RESULT "
+BENCH_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_worker(module, config, env=None):
+    # Runs `python -m <module> <config-json>` in a fresh interpreter, for
+    # settings that are only read once per process (allocator config, compile
+    # caches). The child reports back through emit().
+    child_env = dict(os.environ)
+    child_env.update(env or {})
+    pythonpath = child_env.get("PYTHONPATH", "")
+    child_env["PYTHONPATH"] = BENCH_DIR + (
+        os.pathsep + pythonpath if pythonpath else ""
+    )
+    completed = subprocess.run(
+        [sys.executable, "-m", module, json.dumps(config)],
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=child_env,
+    )
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    tail = completed.stderr.strip().splitlines()[-5:]
+    return {"error": f"{module} exited {completed.returncode}: " + " | ".join(tail)}
+
+
+def emit(result):
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def main(fn, argv):
+    emit(fn(json.loads(argv[1])))
+    return 0
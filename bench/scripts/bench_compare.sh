@@ -4,7 +4,7 @@ set -euo pipefail
 usage() {
   cat <<'USAGE'
 Usage:
-  bench/compare.sh --old <old.sif> --new <new.sif> --mode <check|single|multi|ddp> --results-dir <dir> [--template <path>] [-- <bench args>]
+  bench/compare.sh --old <old.sif> --new <new.sif> --mode <check|single|multi|ddp|launch|compile|membw|affinity|dataloader|alloc|precision|conv|serve|ckpt|replay> --results-dir <dir> [--template <path>] [-- <bench args>]
 
 Either pass --template or set BENCH_TEMPLATE in the environment.
 USAGE
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+from datetime import datetime, timezone
+
+import compare_results
+from tune import container_label, find_metric
+
+
+def _utc_now():
+    return (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
+
+
+def expand_images(patterns):
+    images = []
+    for pattern in patterns:
+        # A glob expands in name order, which is date order for the dated
+        # lumi-multitorch images; explicit paths keep the order given.
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for image in matches:
+            if image not in images:
+                images.append(image)
+    return images
+
+
+def measure(args, image):
+    label = container_label(image)
+    # The bench args are part of the key, so a rerun with other options does
+    # not reuse results measured under the old ones.
+    args_key = hashlib.sha1(" ".join(args.bench_args).encode()).hexdigest()[:8]
+    out_path = os.path.join(args.results_dir, f"{label}_{args.mode}_{args_key}.json")
+    cached = os.path.exists(out_path)
+    if not cached:
+        env = dict(os.environ)
+        env["RUN_ID"] = label
+        cmd = [
+            args.template,
+            image,
+            "--",
+            "bench/run",
+            args.mode,
+            "--out",
+            out_path,
+        ] + args.bench_args
+        completed = subprocess.run(cmd, check=False, env=env)
+        if completed.returncode != 0 or not os.path.exists(out_path):
+            return {
+                "image": image,
+                "value": None,
+                "cached": False,
+                "error": f"exit code {completed.returncode}",
+            }
+    value = compare_results.normalize_value(
+        compare_results.load_json(out_path), args.metric_spec
+    )
+    return {
+        "image": image,
+        "results": out_path,
+        "value": value,
+        "cached": cached,
+        "error": None if value is not None else "metric missing from results",
+    }
+
+
+def verdict(args, baseline, record):
+    record["delta_pct"] = compare_results.pct_delta(baseline, record["value"])
+    regression = compare_results.is_regression(record["delta_pct"], args.metric_spec)
+    record["bad"] = regression
+    return regression
+
+
+def bisect(args, images):
+    # images[0] is the known-good reference; every other image is judged
+    # against it, so a slow drift is pinned on the image that crossed the
+    # threshold rather than on the largest single step.
+    tested = {}
+
+    def test(index):
+        if index not in tested:
+            tested[index] = measure(args, images[index])
+            tested[index]["index"] = index
+        return tested[index]
+
+    baseline = test(0)
+    if baseline["value"] is None:
+        return tested, None, f"baseline failed: {baseline['error']}"
+    baseline["delta_pct"] = 0.0
+    baseline["bad"] = False
+
+    last = test(len(images) - 1)
+    if last["value"] is None:
+        return tested, None, f"newest image failed: {last['error']}"
+    if not verdict(args, baseline["value"], last):
+        return tested, None, "newest image is within the threshold"
+
+    good, bad = 0, len(images) - 1
+    while bad - good > 1:
+        mid = (good + bad) // 2
+        record = test(mid)
+        if record["value"] is None:
+            # An image that cannot run is neither good nor bad; probe its
+            # neighbours towards the bad end instead of giving up.
+            for probe in range(mid + 1, bad):
+                record = test(probe)
+                if record["value"] is not None:
+                    mid = probe
+                    break
+            else:
+                return tested, (good, bad), "images between the pair failed to run"
+        if verdict(args, baseline["value"], record):
+            bad = mid
+        else:
+            good = mid
+    return tested, (good, bad), ""
+
+
+def markdown(report):
+    lines = [
+        f"# Bisect: {report['metric']} ({report['mode']})",
+        "",
+        f"Threshold: {report['threshold_pct']}% "
+        + ("drop" if report["regression_mode"] == "drop" else "increase"),
+        "",
+        "| # | Image | Value | Delta % | Verdict | Cached |",
+        "|---|---|---|---|---|---|",
+    ]
+    for record in report["tested"]:
+        value = "" if record["value"] is None else f"{record['value']:.3f}"
+        delta = record.get("delta_pct")
+        delta = "" if delta is None else f"{delta:+.2f}"
+        if record["value"] is None:
+            state = "error"
+        else:
+            state = "bad" if record.get("bad") else "good"
+        lines.append(
+            f"| {record['index']} | {container_label(record['image'])} | {value} "
+            f"| {delta} | {state} | {'yes' if record['cached'] else 'no'} |"
+        )
+    lines.append("")
+    if report["culprit"]:
+        lines.append(
+            f"First bad image: `{report['culprit']['first_bad']}` "
+            f"(last good: `{report['culprit']['last_good']}`)"
+        )
+    if report["note"]:
+        lines.append(report["note"])
+    lines.append("")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Binary-search an ordered image series for the first regression."
+    )
+    parser.add_argument(
+        "--images",
+        action="append",
+        required=True,
+        help="Image path or glob, oldest first; repeat to list several.",
+    )
+    parser.add_argument(
+        "--template",
+        default=os.environ.get("BENCH_TEMPLATE", ""),
+        help="Launch template (defaults to BENCH_TEMPLATE).",
+    )
+    parser.add_argument("--mode", default="ddp", help="bench/run mode to execute.")
+    parser.add_argument(
+        "--metric",
+        default="ddp_samples_per_sec",
+        help="compare_results metric name to bisect on.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=None,
+        help="Regression threshold in percent (default: the metric's threshold).",
+    )
+    parser.add_argument(
+        "--results-dir",
+        required=True,
+        help="Per-image results are cached here and reused on later runs.",
+    )
+    parser.add_argument("bench_args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv[1:])
+    if args.bench_args and args.bench_args[0] == "--":
+        args.bench_args = args.bench_args[1:]
+    if not args.template:
+        raise SystemExit("Template not set. Use --template or BENCH_TEMPLATE.")
+    images = expand_images(args.images)
+    if len(images) < 2:
+        raise SystemExit("bisect needs at least two images")
+    args.metric_spec = dict(find_metric(args.metric))
+    if args.threshold is not None:
+        os.environ[args.metric_spec["threshold_env"]] = str(args.threshold)
+    os.makedirs(args.results_dir, exist_ok=True)
+
+    tested, pair, note = bisect(args, images)
+    culprit = None
+    if pair and not note:
+        culprit = {"last_good": images[pair[0]], "first_bad": images[pair[1]]}
+    report = {
+        "timestamp_utc": _utc_now(),
+        "mode": args.mode,
+        "metric": args.metric,
+        "regression_mode": args.metric_spec["regression_mode"],
+        "threshold_pct": compare_results.threshold(args.metric_spec),
+        "images": images,
+        "runs": sum(1 for record in tested.values() if not record["cached"]),
+        "tested": [tested[index] for index in sorted(tested)],
+        "culprit": culprit,
+        "note": note,
+    }
+    with open(
+        os.path.join(args.results_dir, "bisect.json"), "w", encoding="utf-8"
+    ) as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+    with open(
+        os.path.join(args.results_dir, "bisect.md"), "w", encoding="utf-8"
+    ) as handle:
+        handle.write(markdown(report))
+    print(markdown(report))
+    return 0 if culprit else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
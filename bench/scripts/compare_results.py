@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 METRICS = (
     {
         "name": "single_gemm_tflops",
+        "profile": "single_gemm_profile",
         "path": ("tests", "single", "gemm", "tflops"),
         "threshold_env": "BENCH_REGRESS_GEMM_PCT",
         "default_threshold": 10.0,
@@ -17,6 +18,7 @@ METRICS = (
     },
     {
         "name": "single_kernel_mix_p50_ms",
+        "profile": "single_kernel_mix_profile",
         "path": ("tests", "single", "kernel_mix", "latency_p50_ms"),
         "threshold_env": "BENCH_REGRESS_LATENCY_PCT",
         "default_threshold": 15.0,
@@ -25,6 +27,7 @@ METRICS = (
     },
     {
         "name": "multi_allreduce_bw_avg_gbps",
+        "profile": "multi_allreduce_profile",
         "path": ("tests", "multi", "allreduce", "bandwidth_gbps"),
         "reducer": "avg",
         "threshold_env": "BENCH_REGRESS_ALLREDUCE_BW_PCT",
@@ -34,6 +37,7 @@ METRICS = (
     },
     {
         "name": "multi_allreduce_lat_avg_us",
+        "profile": "multi_allreduce_profile",
         "path": ("tests", "multi", "allreduce", "latency_us"),
         "reducer": "avg",
         "threshold_env": "BENCH_REGRESS_LATENCY_PCT",
@@ -43,6 +47,7 @@ METRICS = (
     },
     {
         "name": "ddp_samples_per_sec",
+        "profile": "ddp_step_profile",
         "path": ("tests", "ddp_step", "samples_per_sec"),
         "threshold_env": "BENCH_REGRESS_DDP_SAMPLES_PCT",
         "default_threshold": 10.0,
@@ -51,12 +56,411 @@ METRICS = (
     },
     {
         "name": "ddp_step_time_ms_avg",
+        "profile": "ddp_step_profile",
         "path": ("tests", "ddp_step", "step_time_ms_avg"),
         "threshold_env": "BENCH_REGRESS_DDP_LATENCY_PCT",
         "default_threshold": 15.0,
         "regression_mode": "increase",
         "threshold_label": "ddp_latency_increase_pct",
     },
+    {
+        "name": "launch_eager_us_per_op",
+        "path": ("tests", "launch", "eager_us_per_op"),
+        "threshold_env": "BENCH_REGRESS_LAUNCH_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "launch_increase_pct",
+    },
+    {
+        "name": "launch_graph_us_per_op",
+        "path": ("tests", "launch", "graph_us_per_op"),
+        "threshold_env": "BENCH_REGRESS_LAUNCH_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "launch_increase_pct",
+    },
+    {
+        "name": "launch_cpu_us_per_op",
+        "path": ("tests", "launch", "cpu_us_per_op"),
+        "threshold_env": "BENCH_REGRESS_LAUNCH_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "launch_increase_pct",
+    },
+    {
+        "name": "compile_kernel_mix_cold_s",
+        "path": ("tests", "compile", "modules", "kernel_mix", "cold_compile_s"),
+        "threshold_env": "BENCH_REGRESS_COMPILE_PCT",
+        "default_threshold": 25.0,
+        "regression_mode": "increase",
+        "threshold_label": "compile_time_increase_pct",
+    },
+    {
+        "name": "compile_kernel_mix_warm_s",
+        "path": ("tests", "compile", "modules", "kernel_mix", "warm_compile_s"),
+        "threshold_env": "BENCH_REGRESS_COMPILE_PCT",
+        "default_threshold": 25.0,
+        "regression_mode": "increase",
+        "threshold_label": "compile_time_increase_pct",
+    },
+    {
+        "name": "compile_kernel_mix_compiled_p50_ms",
+        "path": ("tests", "compile", "modules", "kernel_mix", "compiled_p50_ms"),
+        "threshold_env": "BENCH_REGRESS_LATENCY_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "latency_increase_pct",
+    },
+    {
+        "name": "compile_transformer_cold_s",
+        "path": ("tests", "compile", "modules", "transformer", "cold_compile_s"),
+        "threshold_env": "BENCH_REGRESS_COMPILE_PCT",
+        "default_threshold": 25.0,
+        "regression_mode": "increase",
+        "threshold_label": "compile_time_increase_pct",
+    },
+    {
+        "name": "compile_transformer_warm_s",
+        "path": ("tests", "compile", "modules", "transformer", "warm_compile_s"),
+        "threshold_env": "BENCH_REGRESS_COMPILE_PCT",
+        "default_threshold": 25.0,
+        "regression_mode": "increase",
+        "threshold_label": "compile_time_increase_pct",
+    },
+    {
+        "name": "compile_transformer_compiled_p50_ms",
+        "path": ("tests", "compile", "modules", "transformer", "compiled_p50_ms"),
+        "threshold_env": "BENCH_REGRESS_LATENCY_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "latency_increase_pct",
+    },
+    {
+        "name": "conv_cold_first_call_total_s",
+        "path": ("tests", "conv", "summary", "cold_first_call_total_s"),
+        "threshold_env": "BENCH_REGRESS_COMPILE_PCT",
+        "default_threshold": 25.0,
+        "regression_mode": "increase",
+        "threshold_label": "compile_time_increase_pct",
+    },
+    {
+        "name": "conv_persisted_first_call_total_s",
+        "path": ("tests", "conv", "summary", "persisted_first_call_total_s"),
+        "threshold_env": "BENCH_REGRESS_COMPILE_PCT",
+        "default_threshold": 25.0,
+        "regression_mode": "increase",
+        "threshold_label": "compile_time_increase_pct",
+    },
+    {
+        "name": "conv_persisted_steady_tflops",
+        "path": ("tests", "conv", "summary", "persisted_steady_tflops"),
+        "threshold_env": "BENCH_REGRESS_CONV_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "conv_drop_pct",
+    },
+    {
+        "name": "serve_max_rps_at_slo",
+        "path": ("tests", "serve", "max_rps_at_slo"),
+        "threshold_env": "BENCH_REGRESS_SERVE_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "serve_drop_pct",
+    },
+    {
+        "name": "serve_saturation_rps",
+        "path": ("tests", "serve", "saturation_rps"),
+        "threshold_env": "BENCH_REGRESS_SERVE_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "serve_drop_pct",
+    },
+    {
+        "name": "serve_unloaded_p99_ms",
+        "path": ("tests", "serve", "unloaded_p99_ms"),
+        "threshold_env": "BENCH_REGRESS_LATENCY_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "latency_increase_pct",
+    },
+    {
+        "name": "ckpt_torch_save_aggregate_gbps",
+        "path": ("tests", "ckpt", "summary", "torch_save_aggregate_gbps"),
+        "threshold_env": "BENCH_REGRESS_CKPT_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "ckpt_drop_pct",
+    },
+    {
+        "name": "ckpt_dcp_save_aggregate_gbps",
+        "path": ("tests", "ckpt", "summary", "dcp_save_aggregate_gbps"),
+        "threshold_env": "BENCH_REGRESS_CKPT_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "ckpt_drop_pct",
+    },
+    {
+        "name": "ckpt_dcp_load_aggregate_gbps",
+        "path": ("tests", "ckpt", "summary", "dcp_load_aggregate_gbps"),
+        "threshold_env": "BENCH_REGRESS_CKPT_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "ckpt_drop_pct",
+    },
+    {
+        "name": "ckpt_time_to_resume_s",
+        "path": ("tests", "ckpt", "summary", "time_to_resume_s"),
+        "threshold_env": "BENCH_REGRESS_CKPT_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "ckpt_increase_pct",
+    },
+    {
+        "name": "replay_total_comm_s",
+        "path": ("tests", "replay", "total_comm_s"),
+        "threshold_env": "BENCH_REGRESS_REPLAY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "replay_increase_pct",
+    },
+    {
+        "name": "replay_wall_s",
+        "path": ("tests", "replay", "wall_s"),
+        "threshold_env": "BENCH_REGRESS_REPLAY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "replay_increase_pct",
+    },
+    {
+        "name": "startup_noop_warm_p50_ms",
+        "path": ("tests", "startup", "summary", "noop_warm_p50_ms"),
+        "threshold_env": "BENCH_REGRESS_STARTUP_PCT",
+        "default_threshold": 20.0,
+        "regression_mode": "increase",
+        "threshold_label": "startup_increase_pct",
+    },
+    {
+        "name": "startup_import_torch_cold_p50_ms",
+        "path": ("tests", "startup", "summary", "import_torch_cold_p50_ms"),
+        "threshold_env": "BENCH_REGRESS_STARTUP_PCT",
+        "default_threshold": 20.0,
+        "regression_mode": "increase",
+        "threshold_label": "startup_increase_pct",
+    },
+    {
+        "name": "startup_import_torch_warm_p50_ms",
+        "path": ("tests", "startup", "summary", "import_torch_warm_p50_ms"),
+        "threshold_env": "BENCH_REGRESS_STARTUP_PCT",
+        "default_threshold": 20.0,
+        "regression_mode": "increase",
+        "threshold_label": "startup_increase_pct",
+    },
+    {
+        "name": "startup_concurrent_warm_wall_p50_ms",
+        "path": ("tests", "startup", "summary", "concurrent_warm_wall_p50_ms"),
+        "threshold_env": "BENCH_REGRESS_STARTUP_PCT",
+        "default_threshold": 20.0,
+        "regression_mode": "increase",
+        "threshold_label": "startup_increase_pct",
+    },
+    {
+        "name": "membw_copy_peak_gbps",
+        "path": ("tests", "membw", "peak_gbps", "copy"),
+        "threshold_env": "BENCH_REGRESS_MEMBW_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "membw_drop_pct",
+    },
+    {
+        "name": "membw_triad_peak_gbps",
+        "path": ("tests", "membw", "peak_gbps", "triad"),
+        "threshold_env": "BENCH_REGRESS_MEMBW_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "membw_drop_pct",
+    },
+    {
+        "name": "membw_pinned_h2d_peak_gbps",
+        "path": ("tests", "membw", "peak_host_gbps", "pinned_h2d"),
+        "threshold_env": "BENCH_REGRESS_MEMBW_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "membw_drop_pct",
+    },
+    {
+        "name": "membw_pinned_d2h_peak_gbps",
+        "path": ("tests", "membw", "peak_host_gbps", "pinned_d2h"),
+        "threshold_env": "BENCH_REGRESS_MEMBW_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "membw_drop_pct",
+    },
+    {
+        "name": "affinity_membw_gbps_min",
+        "path": ("tests", "cpu_affinity", "summary", "membw_gbps_min"),
+        "threshold_env": "BENCH_REGRESS_MEMBW_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "membw_drop_pct",
+    },
+    {
+        "name": "affinity_gemm_gflops_min",
+        "path": ("tests", "cpu_affinity", "summary", "gemm_gflops_min"),
+        "threshold_env": "BENCH_REGRESS_GEMM_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "drop",
+        "threshold_label": "gemm_drop_pct",
+    },
+    {
+        "name": "affinity_noise_pct_max",
+        "path": ("tests", "cpu_affinity", "summary", "noise_pct_max"),
+        "threshold_env": "BENCH_REGRESS_NOISE_PCT",
+        "default_threshold": 50.0,
+        "regression_mode": "increase",
+        "threshold_label": "noise_increase_pct",
+    },
+    {
+        "name": "dataloader_files_samples_per_sec",
+        "path": ("tests", "dataloader", "best", "files", "samples_per_sec"),
+        "threshold_env": "BENCH_REGRESS_DATALOADER_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "drop",
+        "threshold_label": "dataloader_drop_pct",
+    },
+    {
+        "name": "dataloader_files_startup_s",
+        "path": ("tests", "dataloader", "best", "files", "startup_s"),
+        "threshold_env": "BENCH_REGRESS_LATENCY_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "latency_increase_pct",
+    },
+    {
+        "name": "dataloader_shards_samples_per_sec",
+        "path": ("tests", "dataloader", "best", "shards", "samples_per_sec"),
+        "threshold_env": "BENCH_REGRESS_DATALOADER_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "drop",
+        "threshold_label": "dataloader_drop_pct",
+    },
+    {
+        "name": "dataloader_shards_startup_s",
+        "path": ("tests", "dataloader", "best", "shards", "startup_s"),
+        "threshold_env": "BENCH_REGRESS_LATENCY_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "increase",
+        "threshold_label": "latency_increase_pct",
+    },
+    {
+        "name": "single_gemm_peak_reserved_mb",
+        "path": ("tests", "single", "gemm", "memory", "peak_reserved_mb"),
+        "threshold_env": "BENCH_REGRESS_MEMORY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "memory_increase_pct",
+    },
+    {
+        "name": "single_kernel_mix_peak_reserved_mb",
+        "path": ("tests", "single", "kernel_mix", "memory", "peak_reserved_mb"),
+        "threshold_env": "BENCH_REGRESS_MEMORY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "memory_increase_pct",
+    },
+    {
+        "name": "multi_allreduce_peak_reserved_mb",
+        "path": ("tests", "multi", "allreduce", "memory", "peak_reserved_mb"),
+        "threshold_env": "BENCH_REGRESS_MEMORY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "memory_increase_pct",
+    },
+    {
+        "name": "ddp_peak_allocated_mb",
+        "path": ("tests", "ddp_step", "memory", "peak_allocated_mb"),
+        "threshold_env": "BENCH_REGRESS_MEMORY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "memory_increase_pct",
+    },
+    {
+        "name": "ddp_peak_reserved_mb",
+        "path": ("tests", "ddp_step", "memory", "peak_reserved_mb"),
+        "threshold_env": "BENCH_REGRESS_MEMORY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "memory_increase_pct",
+    },
+    {
+        "name": "ddp_peak_rss_mb",
+        "path": ("tests", "ddp_step", "memory", "peak_rss_mb"),
+        "threshold_env": "BENCH_REGRESS_MEMORY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "memory_increase_pct",
+    },
+    {
+        "name": "alloc_default_allocs_per_sec",
+        "path": ("tests", "alloc_stress", "by_conf", "default", "allocs_per_sec"),
+        "threshold_env": "BENCH_REGRESS_ALLOC_PCT",
+        "default_threshold": 15.0,
+        "regression_mode": "drop",
+        "threshold_label": "alloc_drop_pct",
+    },
+    {
+        "name": "alloc_default_fragmentation",
+        "path": ("tests", "alloc_stress", "by_conf", "default", "fragmentation"),
+        "threshold_env": "BENCH_REGRESS_MEMORY_PCT",
+        "default_threshold": 10.0,
+        "regression_mode": "increase",
+        "threshold_label": "memory_increase_pct",
+    },
+)
+
+SOAK_SERIES = (
+    {"name": "single_gemm_soak", "path": ("tests", "single", "gemm", "soak")},
+    {
+        "name": "single_kernel_mix_soak",
+        "path": ("tests", "single", "kernel_mix", "soak"),
+    },
+    {"name": "multi_allreduce_soak", "path": ("tests", "multi", "allreduce", "soak")},
+    {"name": "ddp_step_soak", "path": ("tests", "ddp_step", "soak")},
+)
+DRIFT_VERDICTS = ("drift", "step_change")
+# Soak block key -> suffix of the comparison name; latency keeps the bare name.
+SOAK_DRIFTS = (("drift", ""), ("throughput_drift", "_throughput"))
+
+PROFILE_TABLES = (
+    {"name": "single_gemm_profile", "path": ("tests", "single", "gemm", "profile")},
+    {
+        "name": "single_kernel_mix_profile",
+        "path": ("tests", "single", "kernel_mix", "profile"),
+    },
+    {
+        "name": "multi_allreduce_profile",
+        "path": ("tests", "multi", "allreduce", "profile"),
+    },
+    {"name": "ddp_step_profile", "path": ("tests", "ddp_step", "profile")},
+)
+PROFILE_REPORT_TOP = 5
+
+PRECISION_MATRICES = (
+    {
+        "name": "precision_kernel_mix",
+        "path": ("tests", "precision", "kernel_mix", "configs"),
+    },
+    {"name": "precision_ddp", "path": ("tests", "precision", "ddp", "configs")},
+)
+NUMERIC_THRESHOLD_ENV = "BENCH_REGRESS_NUMERIC_PCT"
+NUMERIC_DEFAULT_THRESHOLD = 100.0
+
+SCALING_CURVES = (
+    {"name": "scaling_ddp_weak", "path": ("tests", "scaling", "ddp_weak", "points")},
+    {
+        "name": "scaling_ddp_strong",
+        "path": ("tests", "scaling", "ddp_strong", "points"),
+    },
+    {"name": "scaling_multi", "path": ("tests", "scaling", "multi", "points")},
 )
 
 
@@ -129,20 +533,174 @@ def compare_metric(old_payload, new_payload, metric):
     }
 
 
+def soak_drift(payload, series, key="drift"):
+    soak = get_value(payload, series["path"])
+    if not isinstance(soak, dict):
+        return None
+    return soak.get(key) or {}
+
+
+def compare_soak(old_payload, new_payload, series, key="drift"):
+    old_drift = soak_drift(old_payload, series, key)
+    new_drift = soak_drift(new_payload, series, key)
+    if old_drift is None and new_drift is None:
+        return None
+    old_verdict = (old_drift or {}).get("verdict")
+    new_verdict = (new_drift or {}).get("verdict")
+    regression = None
+    if old_drift is not None and new_drift is not None:
+        regression = (
+            new_verdict in DRIFT_VERDICTS and old_verdict not in DRIFT_VERDICTS
+        )
+    return {
+        "old_verdict": old_verdict,
+        "new_verdict": new_verdict,
+        "old_trend_pct": (old_drift or {}).get("trend_pct"),
+        "new_trend_pct": (new_drift or {}).get("trend_pct"),
+        "old_step_change": (old_drift or {}).get("step_change"),
+        "new_step_change": (new_drift or {}).get("step_change"),
+        "regression": regression,
+    }
+
+
+def op_times(payload, table):
+    profile = get_value(payload, table["path"])
+    if not isinstance(profile, dict) or "top_ops" not in profile:
+        return None
+    return {
+        row["name"]: row.get("self_time_us_per_iter") or 0.0
+        for row in profile["top_ops"]
+    }
+
+
+def compare_profile(old_payload, new_payload, table):
+    old_ops = op_times(old_payload, table)
+    new_ops = op_times(new_payload, table)
+    if old_ops is None or new_ops is None:
+        return None
+    # An op missing from one side's table only fell outside that side's top N;
+    # its time there is unknown, so it is listed apart rather than ranked.
+    ops = []
+    for name in set(old_ops) & set(new_ops):
+        old_us = old_ops[name]
+        new_us = new_ops[name]
+        ops.append(
+            {
+                "name": name,
+                "old_us_per_iter": old_us,
+                "new_us_per_iter": new_us,
+                "delta_us_per_iter": new_us - old_us,
+                "delta_pct": pct_delta(old_us, new_us),
+            }
+        )
+    ops.sort(key=lambda op: op["delta_us_per_iter"], reverse=True)
+    increases = [op for op in ops if op["delta_us_per_iter"] > 0]
+    decreases = [op for op in reversed(ops) if op["delta_us_per_iter"] < 0]
+    return {
+        "culprit": increases[0]["name"] if increases else None,
+        "top_increases": increases[:PROFILE_REPORT_TOP],
+        "top_decreases": decreases[:PROFILE_REPORT_TOP],
+        "only_old": sorted(set(old_ops) - set(new_ops)),
+        "only_new": sorted(set(new_ops) - set(old_ops)),
+    }
+
+
+def numeric_threshold():
+    return float(
+        os.environ.get(NUMERIC_THRESHOLD_ENV, str(NUMERIC_DEFAULT_THRESHOLD))
+    )
+
+
+def compare_precision(old_payload, new_payload, matrix):
+    # A config regresses when it newly falls outside its fp64 tolerance, or
+    # when its error grew by more than BENCH_REGRESS_NUMERIC_PCT.
+    old_configs = get_value(old_payload, matrix["path"]) or {}
+    new_configs = get_value(new_payload, matrix["path"]) or {}
+    results = {}
+    for config in sorted(set(old_configs) | set(new_configs)):
+        old = old_configs.get(config) or {}
+        new = new_configs.get(config) or {}
+        growth = pct_delta(old.get("max_rel_err"), new.get("max_rel_err"))
+        regression = None
+        if new and "error" not in new:
+            regression = (
+                new.get("within_tolerance") is False
+                and old.get("within_tolerance") is not False
+            ) or (growth is not None and growth > numeric_threshold())
+        results[f"{matrix['name']}_{config}"] = {
+            "old_max_rel_err": old.get("max_rel_err"),
+            "new_max_rel_err": new.get("max_rel_err"),
+            "growth_pct": growth,
+            "old_within_tolerance": old.get("within_tolerance"),
+            "new_within_tolerance": new.get("within_tolerance"),
+            "regression": regression,
+        }
+    return results
+
+
+def scaling_metrics(*payloads):
+    # Scaling studies carry one efficiency per node count, and the node counts
+    # vary between studies, so these metrics are derived from the payloads.
+    metrics = []
+    for curve in SCALING_CURVES:
+        node_counts = set()
+        for payload in payloads:
+            points = get_value(payload, curve["path"])
+            if isinstance(points, dict):
+                node_counts.update(points)
+        for nodes in sorted(node_counts, key=int):
+            metrics.append(
+                {
+                    "name": f"{curve['name']}_eff_{nodes}n",
+                    "path": curve["path"] + (nodes, "efficiency"),
+                    "threshold_env": "BENCH_REGRESS_SCALING_PCT",
+                    "default_threshold": 5.0,
+                    "regression_mode": "drop",
+                    "threshold_label": "scaling_eff_drop_pct",
+                }
+            )
+    return tuple(metrics)
+
+
 def compare_results(old_path, new_path):
     old_payload = load_json(old_path)
     new_payload = load_json(new_path)
+    all_metrics = METRICS + scaling_metrics(old_payload, new_payload)
     metrics = {
         metric["name"]: compare_metric(old_payload, new_payload, metric)
-        for metric in METRICS
+        for metric in all_metrics
     }
+    soak = {}
+    for series in SOAK_SERIES:
+        for key, suffix in SOAK_DRIFTS:
+            result = compare_soak(old_payload, new_payload, series, key)
+            if result is not None:
+                soak[series["name"] + suffix] = result
+    profiles = {}
+    for table in PROFILE_TABLES:
+        result = compare_profile(old_payload, new_payload, table)
+        if result is not None:
+            profiles[table["name"]] = result
+    precision = {}
+    for matrix in PRECISION_MATRICES:
+        precision.update(compare_precision(old_payload, new_payload, matrix))
+    for metric in all_metrics:
+        result = metrics[metric["name"]]
+        profile = profiles.get(metric.get("profile"))
+        if result.get("regression") and profile and profile["culprit"]:
+            result["suspect_op"] = profile["culprit"]
     regressions = [
-        name for name, result in metrics.items() if result.get("regression") is True
+        name
+        for name, result in list(metrics.items())
+        + list(soak.items())
+        + list(precision.items())
+        if result.get("regression") is True
     ]
     thresholds = {
         metric["threshold_label"]: threshold(metric)
-        for metric in METRICS
+        for metric in all_metrics
     }
+    thresholds["numeric_error_growth_pct"] = numeric_threshold()
     return {
         "run_id": old_payload.get("run_id", ""),
         "timestamp_utc": datetime.now(timezone.utc)
@@ -151,6 +709,9 @@ def compare_results(old_path, new_path):
         "old_results": old_path,
         "new_results": new_path,
         "metrics": metrics,
+        "soak": soak,
+        "profile": profiles,
+        "precision": precision,
         "regressions": regressions,
         "regression_count": len(regressions),
         "thresholds": thresholds,
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+import argparse
+import glob
+import json
+import math
+import os
+import statistics
+import sys
+
+from datetime import datetime, timezone
+
+import compare_results
+
+
+OBJECTIVES = ("throughput", "latency", "memory")
+
+
+def _utc_now():
+    return (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
+
+
+def parse_sets(entries):
+    # Each entry is label=pattern[,pattern...]; all files of one label are
+    # pooled, so a set can mix modes (single, ddp, ...) and repeats of each.
+    sets = {}
+    for entry in entries:
+        if "=" not in entry:
+            raise SystemExit(f"expected label=path[,path...]: {entry}")
+        label, patterns = entry.split("=", 1)
+        paths = sets.setdefault(label, [])
+        for pattern in patterns.split(","):
+            if glob.has_magic(pattern):
+                matches = sorted(glob.glob(pattern))
+            else:
+                matches = [pattern]
+            paths.extend(path for path in matches if path not in paths)
+        if not paths:
+            raise SystemExit(f"no result files for {label}")
+    return sets
+
+
+def objective(metric):
+    if metric["threshold_env"] == "BENCH_REGRESS_MEMORY_PCT":
+        return "memory"
+    if metric["regression_mode"] == "drop":
+        return "throughput"
+    return "latency"
+
+
+def _value(payload, metric):
+    value = compare_results.normalize_value(payload, metric)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def build_table(metrics, payloads):
+    # One row per metric, one column per image, each cell holding every
+    # repeat; the rest of the report works on whole rows at a time. Plain
+    # lists rather than numpy: like compare_results.py this runs on the host
+    # with only the standard library, while numpy is an optional extra that
+    # only the in-container affinity test uses.
+    return [
+        [
+            [v for v in (_value(p, metric) for p in image_payloads) if v is not None]
+            for image_payloads in payloads
+        ]
+        for metric in metrics
+    ]
+
+
+def _median(values):
+    return statistics.median(values) if values else None
+
+
+def _cv_pct(values):
+    if len(values) < 2:
+        return None
+    mean = statistics.fmean(values)
+    return statistics.stdev(values) / mean * 100.0 if mean else None
+
+
+def _goodness(metric, base, value):
+    # Ratio against the baseline oriented so that > 1 is always better.
+    if base is None or value is None or base <= 0 or value <= 0:
+        return None
+    if metric["regression_mode"] == "drop":
+        return value / base
+    return base / value
+
+
+def _geomean(values):
+    values = [v for v in values if v is not None]
+    if not values:
+        return None
+    return math.exp(sum(math.log(v) for v in values) / len(values))
+
+
+def pareto_front(labels, scores):
+    front = []
+    for label in labels:
+        own = scores[label]
+        if any(v is None for v in own.values()):
+            continue
+        dominated = False
+        for other in labels:
+            theirs = scores[other]
+            if other == label or any(v is None for v in theirs.values()):
+                continue
+            if all(theirs[k] >= own[k] for k in own) and any(
+                theirs[k] > own[k] for k in own
+            ):
+                dominated = True
+                break
+        if not dominated:
+            front.append(label)
+    return front
+
+
+def build_matrix(sets, baseline):
+    labels = list(sets)
+    payloads = [
+        [compare_results.load_json(path) for path in sets[label]] for label in labels
+    ]
+    all_payloads = [payload for image in payloads for payload in image]
+    metrics = compare_results.METRICS + compare_results.scaling_metrics(*all_payloads)
+    table = build_table(metrics, payloads)
+    base_col = labels.index(baseline)
+
+    report_metrics = {}
+    goodness_rows = []
+    for metric, row in zip(metrics, table):
+        medians = [_median(cell) for cell in row]
+        if all(value is None for value in medians):
+            goodness_rows.append(None)
+            continue
+        base = medians[base_col]
+        deltas = [compare_results.pct_delta(base, value) for value in medians]
+        present = [i for i, value in enumerate(medians) if value is not None]
+        present.sort(
+            key=lambda i: medians[i], reverse=metric["regression_mode"] == "drop"
+        )
+        goodness_rows.append([_goodness(metric, base, value) for value in medians])
+        report_metrics[metric["name"]] = {
+            "objective": objective(metric),
+            "regression_mode": metric["regression_mode"],
+            "values": dict(zip(labels, medians)),
+            "repeats": dict(zip(labels, (len(cell) for cell in row))),
+            "cv_pct": dict(zip(labels, (_cv_pct(cell) for cell in row))),
+            "delta_pct": dict(zip(labels, deltas)),
+            "regression": dict(
+                zip(
+                    labels,
+                    (compare_results.is_regression(d, metric) for d in deltas),
+                )
+            ),
+            "rank": [labels[i] for i in present],
+        }
+
+    scores = {label: {} for label in labels}
+    for name in OBJECTIVES:
+        rows = [
+            row
+            for metric, row in zip(metrics, goodness_rows)
+            if row is not None and objective(metric) == name
+        ]
+        # Only metrics every image reported enter a score, so an image is
+        # never rewarded for a test it skipped.
+        rows = [row for row in rows if all(v is not None for v in row)]
+        for col, label in enumerate(labels):
+            scores[label][name] = _geomean([row[col] for row in rows]) if rows else None
+    used = [
+        name
+        for name in OBJECTIVES
+        if all(scores[label][name] is not None for label in labels)
+    ]
+    pareto_scores = {label: {k: scores[label][k] for k in used} for label in labels}
+
+    mean_rank = {}
+    for label in labels:
+        positions = [
+            entry["rank"].index(label) + 1
+            for entry in report_metrics.values()
+            if label in entry["rank"]
+        ]
+        mean_rank[label] = statistics.fmean(positions) if positions else None
+
+    return {
+        "timestamp_utc": _utc_now(),
+        "baseline": baseline,
+        "images": {label: sets[label] for label in labels},
+        "metrics": report_metrics,
+        "regressions": {
+            label: sorted(
+                name
+                for name, entry in report_metrics.items()
+                if entry["regression"][label] is True
+            )
+            for label in labels
+            if label != baseline
+        },
+        "scores": scores,
+        "pareto": {
+            "objectives": used,
+            "front": pareto_front(labels, pareto_scores) if used else [],
+        },
+        "mean_rank": mean_rank,
+    }
+
+
+def _fmt(value, digits=3):
+    if value is None:
+        return ""
+    return f"{value:.{digits}f}"
+
+
+def markdown(report):
+    labels = list(report["images"])
+    baseline = report["baseline"]
+    lines = [f"# Container matrix (baseline: {baseline})", ""]
+    lines.append("| Image | " + " | ".join(OBJECTIVES) + " | Mean rank | Pareto |")
+    lines.append("|" + "|".join("---" for _ in range(len(OBJECTIVES) + 3)) + "|")
+    for label in labels:
+        score = report["scores"][label]
+        cells = [label] + [_fmt(score.get(name)) for name in OBJECTIVES]
+        cells.append(_fmt(report["mean_rank"][label], 2))
+        cells.append("yes" if label in report["pareto"]["front"] else "")
+        lines.append("| " + " | ".join(cells) + " |")
+    lines.append("")
+    lines.append(
+        "Scores are geometric means of value ratios against the baseline; "
+        "above 1 is better."
+    )
+    lines.append("")
+    lines.append("| Metric | " + " | ".join(labels) + " |")
+    lines.append("|" + "|".join("---" for _ in range(len(labels) + 1)) + "|")
+    for name, entry in report["metrics"].items():
+        cells = [name]
+        for label in labels:
+            value = entry["values"][label]
+            cell = _fmt(value)
+            delta = entry["delta_pct"][label]
+            if label != baseline and delta is not None:
+                cell += f" ({delta:+.1f}%)"
+            if entry["regression"][label]:
+                cell = f"**{cell}**"
+            cells.append(cell)
+        lines.append("| " + " | ".join(cells) + " |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Compare N result sets against a baseline and rank them."
+    )
+    parser.add_argument(
+        "sets",
+        nargs="+",
+        help="label=path[,path...]; globs allowed, files of one label are pooled.",
+    )
+    parser.add_argument(
+        "--baseline", default="", help="Label to compare against (default: first)."
+    )
+    parser.add_argument("--out-dir", required=True)
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv[1:])
+    sets = parse_sets(args.sets)
+    baseline = args.baseline or next(iter(sets))
+    if baseline not in sets:
+        raise SystemExit(f"baseline {baseline} is not one of: {', '.join(sets)}")
+    report = build_matrix(sets, baseline)
+    os.makedirs(args.out_dir, exist_ok=True)
+    with open(
+        os.path.join(args.out_dir, "matrix.json"), "w", encoding="utf-8"
+    ) as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+    with open(os.path.join(args.out_dir, "matrix.md"), "w", encoding="utf-8") as handle:
+        handle.write(markdown(report))
+    print(markdown(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timezone
+
+import compare_results
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import json_schema  # noqa: E402
+
+
+DEFAULT_NODES = "1,2,4,8"
+DEFAULT_MODES = "ddp,multi"
+DEFAULT_RANKS_PER_NODE = 8
+DEFAULT_BATCH_SIZE = 64
+RUN_FIELDS = ("kind", "nodes", "batch_size", "out", "returncode", "elapsed_s", "error")
+ALLREDUCE_BW = {
+    "path": ("tests", "multi", "allreduce", "bandwidth_gbps"),
+    "reducer": "avg",
+}
+ALLREDUCE_LAT = {
+    "path": ("tests", "multi", "allreduce", "latency_us"),
+    "reducer": "avg",
+}
+
+
+def _utc_now():
+    return (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
+
+
+def _parse_ints(value):
+    return sorted({int(token) for token in value.split(",") if token.strip()})
+
+
+def container_label(path):
+    name = os.path.basename(path.rstrip("/"))
+    return name[: -len(".sif")] if name.endswith(".sif") else name
+
+
+def allocation_hosts():
+    nodelist = os.environ.get(
+        "SLURM_JOB_NODELIST", os.environ.get("SLURM_NODELIST", "")
+    )
+    if not nodelist or not shutil.which("scontrol"):
+        return []
+    result = subprocess.run(
+        ["scontrol", "show", "hostnames", nodelist],
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def plan_runs(args, label):
+    runs = []
+    for nodes in args.nodes:
+        if "ddp" in args.modes:
+            runs.append(
+                {
+                    "kind": "ddp_weak",
+                    "mode": "ddp",
+                    "nodes": nodes,
+                    "batch_size": args.batch_size,
+                }
+            )
+            strong_batch = args.global_batch // (nodes * args.ranks_per_node)
+            if strong_batch >= 1:
+                runs.append(
+                    {
+                        "kind": "ddp_strong",
+                        "mode": "ddp",
+                        "nodes": nodes,
+                        "batch_size": strong_batch,
+                    }
+                )
+        if "multi" in args.modes and nodes > 1:
+            runs.append(
+                {"kind": "multi", "mode": "multi", "nodes": nodes, "batch_size": None}
+            )
+    for run in runs:
+        name = f"{label}_{run['kind']}_{run['nodes']}n"
+        run["run_id"] = name
+        run["out"] = os.path.join(args.results_dir, label, name + ".json")
+    # Largest steps first so small ones backfill the nodes they leave free.
+    runs.sort(key=lambda run: run["nodes"], reverse=True)
+    return runs
+
+
+def _start(args, container, run, hosts):
+    env = dict(os.environ)
+    env["NODES"] = str(run["nodes"])
+    env["RUN_ID"] = run["run_id"]
+    if hosts:
+        env["NODELIST"] = ",".join(hosts)
+    cmd = [
+        args.template,
+        container,
+        "--",
+        "bench/run",
+        run["mode"],
+        "--out",
+        run["out"],
+    ]
+    if run["batch_size"] is not None:
+        cmd += ["--batch-size", str(run["batch_size"])]
+    cmd += args.bench_args
+    os.makedirs(os.path.dirname(run["out"]), exist_ok=True)
+    log = open(run["out"][: -len(".json")] + ".log", "w", encoding="utf-8")
+    process = subprocess.Popen(cmd, env=env, stdout=log, stderr=subprocess.STDOUT)
+    return process, log
+
+
+def execute(args, container, runs):
+    # Every run is a nested `srun --nodes=N` job step of the surrounding
+    # allocation; steps whose node counts fit side by side run concurrently
+    # on disjoint NODELIST subsets.
+    hosts = allocation_hosts()
+    capacity = args.alloc_nodes or len(hosts) or max(run["nodes"] for run in runs)
+    free = list(hosts) if hosts else None
+    free_count = capacity
+    pending = [run for run in runs if run["nodes"] <= capacity]
+    for run in runs:
+        if run["nodes"] > capacity:
+            run["error"] = f"needs {run['nodes']} nodes, allocation has {capacity}"
+    active = []
+    while pending or active:
+        for run in list(pending):
+            if run["nodes"] > free_count or (active and args.serial):
+                continue
+            subset = None
+            if free is not None:
+                subset, free = free[: run["nodes"]], free[run["nodes"]:]
+            free_count -= run["nodes"]
+            process, log = _start(args, container, run, subset)
+            run["started"] = time.perf_counter()
+            active.append((run, process, log, subset))
+            pending.remove(run)
+        time.sleep(args.poll)
+        for item in list(active):
+            run, process, log, subset = item
+            if process.poll() is None:
+                continue
+            log.close()
+            run["elapsed_s"] = time.perf_counter() - run.pop("started")
+            run["returncode"] = process.returncode
+            if process.returncode != 0 or not os.path.exists(run["out"]):
+                run["error"] = f"exit code {process.returncode}"
+            free_count += run["nodes"]
+            if subset is not None:
+                free += subset
+            active.remove(item)
+    return runs
+
+
+def _efficiency_curve(points, base_nodes, key):
+    base = points.get(base_nodes, {}).get(key)
+    for nodes, point in points.items():
+        value = point.get(key)
+        if not base or value is None:
+            point["speedup"] = None
+            point["efficiency"] = None
+            continue
+        point["speedup"] = value / base
+        point["efficiency"] = point["speedup"] / (nodes / base_nodes)
+    return points
+
+
+def summarize(args, runs):
+    raw = {"ddp_weak": {}, "ddp_strong": {}, "multi": {}}
+    for run in runs:
+        if run.get("error"):
+            continue
+        payload = compare_results.load_json(run["out"])
+        if run["mode"] == "ddp":
+            ddp = compare_results.get_value(payload, ("tests", "ddp_step")) or {}
+            if ddp.get("samples_per_sec"):
+                raw[run["kind"]][run["nodes"]] = {
+                    "batch_size_per_rank": run["batch_size"],
+                    "samples_per_sec": ddp["samples_per_sec"],
+                    "step_time_ms_avg": ddp.get("step_time_ms_avg"),
+                }
+        else:
+            bw = compare_results.normalize_value(payload, ALLREDUCE_BW)
+            if bw:
+                raw["multi"][run["nodes"]] = {
+                    "bw_avg_gbps": bw,
+                    "lat_avg_us": compare_results.normalize_value(
+                        payload, ALLREDUCE_LAT
+                    ),
+                }
+
+    scaling = {
+        "nodes": args.nodes,
+        "ranks_per_node": args.ranks_per_node,
+        "runs": [
+            {key: run.get(key) for key in RUN_FIELDS}
+            for run in sorted(runs, key=lambda run: (run["kind"], run["nodes"]))
+        ],
+    }
+    for kind, points in raw.items():
+        if not points:
+            continue
+        base_nodes = min(points)
+        if kind == "multi":
+            # Ideal allreduce bus bandwidth stays flat as nodes are added, so
+            # efficiency is relative to the smallest count rather than linear.
+            base = points[base_nodes]["bw_avg_gbps"]
+            for point in points.values():
+                point["efficiency"] = point["bw_avg_gbps"] / base
+        else:
+            _efficiency_curve(points, base_nodes, "samples_per_sec")
+        scaling[kind] = {
+            "base_nodes": base_nodes,
+            "points": {str(nodes): points[nodes] for nodes in sorted(points)},
+        }
+    if "ddp_strong" in scaling:
+        scaling["ddp_strong"]["global_batch"] = args.global_batch
+    return scaling
+
+
+def markdown(label, scaling):
+    lines = [f"## {label}", ""]
+    for kind in ("ddp_weak", "ddp_strong", "multi"):
+        if kind not in scaling:
+            continue
+        value_key = "bw_avg_gbps" if kind == "multi" else "samples_per_sec"
+        lines.append(f"### {kind}")
+        lines.append("")
+        lines.append(f"| Nodes | {value_key} | Efficiency |")
+        lines.append("|---|---|---|")
+        for nodes, point in scaling[kind]["points"].items():
+            efficiency = point.get("efficiency")
+            eff = "" if efficiency is None else f"{efficiency * 100:.1f}%"
+            lines.append(f"| {nodes} | {point[value_key]:.3f} | {eff} |")
+        lines.append("")
+    failed = [run for run in scaling["runs"] if run.get("error")]
+    for run in failed:
+        lines.append(f"- {run['kind']} {run['nodes']}n failed: {run['error']}")
+    if failed:
+        lines.append("")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Weak/strong scaling study as job steps inside one allocation."
+    )
+    parser.add_argument(
+        "--container",
+        action="append",
+        required=True,
+        help="Container image; repeat to study several images.",
+    )
+    parser.add_argument(
+        "--template",
+        default=os.environ.get("BENCH_TEMPLATE", ""),
+        help="Multi-node launch template that honours NODES and NODELIST.",
+    )
+    parser.add_argument(
+        "--nodes",
+        default=os.environ.get("BENCH_SCALE_NODES", DEFAULT_NODES),
+        help="Comma-separated node counts.",
+    )
+    parser.add_argument(
+        "--modes",
+        default=os.environ.get("BENCH_SCALE_MODES", DEFAULT_MODES),
+        help="Comma-separated modes: ddp (weak and strong), multi.",
+    )
+    parser.add_argument("--ranks-per-node", type=int, default=DEFAULT_RANKS_PER_NODE)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=int(os.environ.get("BENCH_DDP_BATCH", DEFAULT_BATCH_SIZE)),
+        help="Per-rank batch size for weak scaling.",
+    )
+    parser.add_argument(
+        "--global-batch",
+        type=int,
+        default=0,
+        help="Fixed global batch for strong scaling "
+        "(default: batch size x ranks of the smallest node count).",
+    )
+    parser.add_argument(
+        "--alloc-nodes",
+        type=int,
+        default=int(os.environ.get("SLURM_JOB_NUM_NODES", "0") or 0),
+        help="Nodes available for concurrent steps (default: the allocation).",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run one step at a time so steps never share the interconnect.",
+    )
+    parser.add_argument("--poll", type=float, default=1.0, help=argparse.SUPPRESS)
+    parser.add_argument("--results-dir", required=True)
+    parser.add_argument("bench_args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv[1:])
+    if args.bench_args and args.bench_args[0] == "--":
+        args.bench_args = args.bench_args[1:]
+    if not args.template:
+        raise SystemExit("Template not set. Use --template or BENCH_TEMPLATE.")
+    args.nodes = _parse_ints(args.nodes)
+    args.modes = [token.strip() for token in args.modes.split(",") if token.strip()]
+    if not args.global_batch:
+        args.global_batch = args.batch_size * args.ranks_per_node * args.nodes[0]
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    sections = []
+    ok = True
+    for container in args.container:
+        label = container_label(container)
+        runs = execute(args, container, plan_runs(args, label))
+        scaling = summarize(args, runs)
+        ok = ok and not any(run.get("error") for run in runs)
+        payload = {
+            "schema_version": json_schema.SCHEMA_VERSION,
+            "run_id": label,
+            "timestamp_utc": _utc_now(),
+            "container": {"image_path": container, "image_digest": ""},
+            "tests": {"scaling": scaling},
+        }
+        out_path = os.path.join(args.results_dir, f"scaling_{label}.json")
+        with open(out_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+        sections.append(markdown(label, scaling))
+
+    report = "# Scaling study\n\n" + "\n".join(sections)
+    md_path = os.path.join(args.results_dir, "scaling.md")
+    with open(md_path, "w", encoding="utf-8") as handle:
+        handle.write(report)
+    print(report)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+import argparse
+import itertools
+import json
+import math
+import os
+import subprocess
+import sys
+
+from datetime import datetime, timezone
+
+import compare_results
+
+
+DEFAULT_SPACE = {
+    "DIST": ["block", "cyclic"],
+    "CPU_BIND": ["cores", "none"],
+    "ENABLE_LUMI_CPU_MASKS": ["0", "1"],
+    "USE_ROCR_VISIBLE_DEVICES": ["0", "1"],
+    "NCCL_NET_GDR_LEVEL": ["PHB", "3"],
+}
+DEFAULT_ETA = 2
+DEFAULT_MIN_ITERS = 5
+
+
+def _utc_now():
+    return (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
+
+
+def find_metric(name):
+    for metric in compare_results.METRICS:
+        if metric["name"] == name:
+            return metric
+    raise SystemExit(
+        f"unknown metric: {name} (choose from "
+        + ", ".join(metric["name"] for metric in compare_results.METRICS)
+        + ")"
+    )
+
+
+def higher_is_better(metric):
+    return metric["regression_mode"] == "drop"
+
+
+def load_space(value):
+    if not value:
+        return dict(DEFAULT_SPACE)
+    if os.path.exists(value):
+        with open(value, "r", encoding="utf-8") as handle:
+            space = json.load(handle)
+    else:
+        space = json.loads(value)
+    return {key: [str(v) for v in values] for key, values in space.items()}
+
+
+def candidates(space):
+    keys = sorted(space)
+    for index, values in enumerate(itertools.product(*(space[k] for k in keys))):
+        yield {"id": f"c{index:03d}", "env": dict(zip(keys, values))}
+
+
+def container_label(path):
+    name = os.path.basename(path.rstrip("/"))
+    return name[: -len(".sif")] if name.endswith(".sif") else name
+
+
+def run_candidate(args, container, candidate, iters, out_path):
+    env = dict(os.environ)
+    env.update(candidate["env"])
+    env["RUN_ID"] = os.path.splitext(os.path.basename(out_path))[0]
+    cmd = [
+        args.template,
+        container,
+        "--",
+        "bench/run",
+        args.mode,
+        "--out",
+        out_path,
+        "--iters",
+        str(iters),
+    ] + args.bench_args
+    completed = subprocess.run(cmd, check=False, env=env)
+    if completed.returncode != 0 or not os.path.exists(out_path):
+        return None, f"exit code {completed.returncode}"
+    payload = compare_results.load_json(out_path)
+    value = compare_results.normalize_value(payload, args.metric_spec)
+    if value is None:
+        return None, "metric missing from results"
+    return float(value), ""
+
+
+def successive_halving(args, container, label):
+    # Every rung runs the survivors with eta times more iterations than the
+    # previous rung and keeps the best 1/eta, so poor settings only ever pay
+    # for the cheapest measurement.
+    survivors = list(candidates(args.space))
+    scores = {c["id"]: {"env": c["env"], "rungs": []} for c in survivors}
+    rung = 0
+    iters = args.min_iters
+    while survivors:
+        rung_dir = os.path.join(args.results_dir, label, f"rung{rung}")
+        os.makedirs(rung_dir, exist_ok=True)
+        measured = []
+        for candidate in survivors:
+            name = f"{label}_r{rung}_{candidate['id']}.json"
+            out_path = os.path.join(rung_dir, name)
+            value, error = run_candidate(args, container, candidate, iters, out_path)
+            scores[candidate["id"]]["rungs"].append(
+                {"rung": rung, "iters": iters, "value": value, "error": error or None}
+            )
+            if value is not None:
+                measured.append((value, candidate))
+        measured.sort(
+            key=lambda item: item[0], reverse=higher_is_better(args.metric_spec)
+        )
+        if len(measured) <= 1 or rung + 1 >= args.max_rungs:
+            break
+        keep = max(1, math.ceil(len(measured) / args.eta))
+        survivors = [candidate for _, candidate in measured[:keep]]
+        rung += 1
+        iters *= args.eta
+
+    ranked = []
+    for cid, entry in scores.items():
+        last = entry["rungs"][-1]
+        ranked.append(
+            {
+                "id": cid,
+                "env": entry["env"],
+                "rung": last["rung"],
+                "iters": last["iters"],
+                "value": last["value"],
+                "error": last["error"],
+                "rungs": entry["rungs"],
+            }
+        )
+    sign = -1.0 if higher_is_better(args.metric_spec) else 1.0
+    ranked.sort(
+        key=lambda row: (
+            -row["rung"],
+            row["value"] is None,
+            sign * row["value"] if row["value"] is not None else 0.0,
+        )
+    )
+    return ranked
+
+
+def env_block(env):
+    return "\n".join(f"export {key}={value}" for key, value in sorted(env.items()))
+
+
+def markdown(report):
+    lines = [f"# Launch tuning: {report['metric']} ({report['mode']})", ""]
+    for label, result in report["containers"].items():
+        keys = sorted(report["space"])
+        lines.append(f"## {label}")
+        lines.append("")
+        lines.append("| Rank | Id | " + " | ".join(keys) + " | Rung | Iters | Value |")
+        lines.append("|" + "|".join("---" for _ in range(len(keys) + 5)) + "|")
+        for rank, row in enumerate(result["ranked"], start=1):
+            value = "" if row["value"] is None else f"{row['value']:.3f}"
+            cells = [str(rank), row["id"]] + [row["env"][k] for k in keys]
+            cells += [str(row["rung"]), str(row["iters"]), value]
+            lines.append("| " + " | ".join(cells) + " |")
+        lines.append("")
+        if result["winner"]:
+            lines.append("```bash")
+            lines.append(env_block(result["winner"]["env"]))
+            lines.append("```")
+            lines.append("")
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Rank launch settings as job steps inside one allocation."
+    )
+    parser.add_argument(
+        "--container",
+        action="append",
+        required=True,
+        help="Container image; repeat to tune several images.",
+    )
+    parser.add_argument(
+        "--template",
+        default=os.environ.get("BENCH_TEMPLATE", ""),
+        help="Launch template (defaults to BENCH_TEMPLATE).",
+    )
+    parser.add_argument("--mode", default="ddp", help="bench/run mode to execute.")
+    parser.add_argument(
+        "--metric",
+        default="ddp_samples_per_sec",
+        help="compare_results metric name to optimize.",
+    )
+    parser.add_argument(
+        "--space",
+        default=os.environ.get("BENCH_TUNE_SPACE", ""),
+        help="JSON object or file mapping env var names to candidate values.",
+    )
+    parser.add_argument("--results-dir", required=True)
+    parser.add_argument("--eta", type=int, default=DEFAULT_ETA)
+    parser.add_argument("--min-iters", type=int, default=DEFAULT_MIN_ITERS)
+    parser.add_argument(
+        "--max-rungs",
+        type=int,
+        default=0,
+        help="Stop after this many rungs (0 = until one candidate is left).",
+    )
+    parser.add_argument("bench_args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv[1:])
+    if args.bench_args and args.bench_args[0] == "--":
+        args.bench_args = args.bench_args[1:]
+    if not args.template:
+        raise SystemExit("Template not set. Use --template or BENCH_TEMPLATE.")
+    args.eta = max(args.eta, 2)
+    args.metric_spec = find_metric(args.metric)
+    args.space = load_space(args.space)
+    if args.max_rungs <= 0:
+        total = max(len(list(candidates(args.space))), 1)
+        args.max_rungs = max(1, math.ceil(math.log(total, args.eta)) + 1)
+
+    report = {
+        "timestamp_utc": _utc_now(),
+        "mode": args.mode,
+        "metric": args.metric,
+        "higher_is_better": higher_is_better(args.metric_spec),
+        "template": args.template,
+        "space": args.space,
+        "eta": args.eta,
+        "min_iters": args.min_iters,
+        "containers": {},
+    }
+    for container in args.container:
+        label = container_label(container)
+        ranked = successive_halving(args, container, label)
+        winner = ranked[0] if ranked and ranked[0]["value"] is not None else None
+        report["containers"][label] = {
+            "image_path": container,
+            "ranked": ranked,
+            "winner": winner,
+        }
+        if winner:
+            with open(
+                os.path.join(args.results_dir, f"winner_{label}.env"),
+                "w",
+                encoding="utf-8",
+            ) as handle:
+                handle.write(env_block(winner["env"]) + "\n")
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    json_path = os.path.join(args.results_dir, "tune.json")
+    with open(json_path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+    md_path = os.path.join(args.results_dir, "tune.md")
+    with open(md_path, "w", encoding="utf-8") as handle:
+        handle.write(markdown(report))
+    print(markdown(report))
+    return 0 if all(r["winner"] for r in report["containers"].values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -0,0 +1,157 @@
+import math
+import random
+import sys
+import time
+
+from common import env_detect, memory, worker
+
+
+DEFAULT_ALLOC_CONFS = [
+    "",
+    "expandable_segments:True",
+    "garbage_collection_threshold:0.8,max_split_size_mb:512",
+]
+MB = 1024 * 1024
+
+
+def _label(conf):
+    return conf or "default"
+
+
+def _plan(steps, max_live, median_mb, max_mb, seed):
+    # Variable-size alloc/free trace: lognormal sizes around median_mb, a
+    # bounded live set, and random frees so blocks of different sizes
+    # interleave like activations and gradients do in training.
+    rng = random.Random(seed)
+    mu = math.log(median_mb * MB)
+    live = 0
+    plan = []
+    for _ in range(steps):
+        free_index = None
+        if live and (live >= max_live or rng.random() < 0.45):
+            free_index = rng.randrange(live)
+            live -= 1
+        size = int(min(max(rng.lognormvariate(mu, 1.5), 512), max_mb * MB))
+        plan.append((free_index, size))
+        live += 1
+    return plan
+
+
+def _replay(torch_mod, device, plan, touch):
+    live = []
+    live_bytes = 0
+    peak_live = 0
+    baseline_rss = env_detect.process_rss_bytes() or 0
+    peak_rss = baseline_rss
+    start = time.perf_counter()
+    for step, (free_index, size) in enumerate(plan):
+        if free_index is not None:
+            freed = live.pop(free_index)
+            live_bytes -= freed.numel()
+            del freed
+        tensor = torch_mod.empty(size, dtype=torch_mod.uint8, device=device)
+        if touch:
+            tensor.fill_(1)
+        live.append(tensor)
+        live_bytes += size
+        peak_live = max(peak_live, live_bytes)
+        if touch and step % 64 == 0:
+            peak_rss = max(peak_rss, env_detect.process_rss_bytes() or 0)
+    if device.type == "cuda":
+        torch_mod.cuda.synchronize(device)
+    elapsed = time.perf_counter() - start
+    del live
+    return elapsed, peak_live, peak_rss - baseline_rss
+
+
+def _worker(config):
+    try:
+        import torch
+    except ImportError:
+        return {"error": "torch not available"}
+
+    if torch.cuda.is_available():
+        device = torch.device("cuda")
+        touch = False
+    else:
+        device = torch.device("cpu")
+        touch = True
+
+    plan = _plan(
+        config["steps"],
+        config["max_live"],
+        config["median_mb"],
+        config["max_mb"],
+        config["seed"],
+    )
+    try:
+        memory.reset(torch, device)
+        if device.type == "cuda":
+            # One untimed pass warms the caching allocator so the timed pass
+            # measures steady-state reuse rather than first-touch hipMalloc.
+            _replay(torch, device, plan, touch)
+        elapsed, peak_live, rss_growth = _replay(torch, device, plan, touch)
+        report = memory.report(torch, device)
+    except RuntimeError as exc:
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+    if device.type == "cuda":
+        fragmentation = report.get("reserved_to_allocated")
+    else:
+        fragmentation = rss_growth / peak_live if peak_live else None
+    return {
+        "device": device.type,
+        "steps": len(plan),
+        "allocs_per_sec": len(plan) / elapsed if elapsed > 0 else None,
+        "replay_s": elapsed,
+        "peak_live_mb": peak_live / MB,
+        "fragmentation": fragmentation,
+        "memory": report,
+    }
+
+
+def run_alloc_stress(
+    alloc_confs=None,
+    steps=2000,
+    max_live=64,
+    median_mb=1.0,
+    max_mb=256.0,
+    seed=0,
+):
+    config = {
+        "steps": steps,
+        "max_live": max_live,
+        "median_mb": median_mb,
+        "max_mb": max_mb,
+        "seed": seed,
+    }
+    confs = alloc_confs if alloc_confs is not None else DEFAULT_ALLOC_CONFS
+    by_conf = {}
+    for conf in confs:
+        # The allocator reads its config once at CUDA init, so each setting
+        # needs its own process.
+        env = {"PYTORCH_HIP_ALLOC_CONF": conf, "PYTORCH_CUDA_ALLOC_CONF": conf}
+        result = worker.run_worker("tests.alloc_stress", config, env=env)
+        result["alloc_conf"] = conf
+        by_conf[_label(conf)] = result
+
+    ok = {label: r for label, r in by_conf.items() if "error" not in r}
+    if not ok:
+        errors = "; ".join(f"{label}: {r['error']}" for label, r in by_conf.items())
+        return {"error": errors or "no allocator configs", "by_conf": by_conf}
+
+    fragmented = [label for label, r in ok.items() if r.get("fragmentation")]
+    return {
+        "plan": config,
+        "by_conf": by_conf,
+        "fastest": max(ok, key=lambda label: ok[label]["allocs_per_sec"] or 0),
+        "least_fragmented": (
+            min(fragmented, key=lambda label: ok[label]["fragmentation"])
+            if fragmented
+            else None
+        ),
+    }
+
+
+if __name__ == "__main__":
+    raise SystemExit(worker.main(_worker, sys.argv))
@@ -1,8 +1,18 @@
 import time
+
+from common import memory, profiling, soak
 from tests import distributed
 
 
-def run_allreduce(message_sizes, iters=5):
+def run_allreduce(
+    message_sizes,
+    iters=5,
+    duration_s=0,
+    window_s=soak.DEFAULT_WINDOW_S,
+    soak_size=0,
+    profile_iters=0,
+    trace_path="",
+):
     try:
         import torch
     except ImportError:
@@ -18,6 +28,7 @@ def run_allreduce(message_sizes, iters=5):
     device_index = distributed.local_cuda_index(torch)
     device = torch.device("cuda", device_index)
     torch.cuda.set_device(device)
+    memory.reset(torch, device)
     results = {
         "message_sizes_bytes": [],
         "bandwidth_gbps": [],
@@ -52,6 +63,30 @@ def run_allreduce(message_sizes, iters=5):
 
         checksum = torch.sum(tensor).item()
         results["checksum"] = f"{checksum:.4f}"
+        results["memory"] = memory.report(torch, device)
+
+        size = soak_size or max(message_sizes)
+        tensor = torch.ones(max(size // 4, 1), device=device, dtype=torch.float32)
+
+        def _step():
+            torch.distributed.all_reduce(tensor)
+            torch.cuda.synchronize()
+
+        if duration_s > 0:
+            results["soak"] = soak.run_soak(
+                _step,
+                duration_s,
+                window_s=window_s,
+                units_per_step=size / 1.0e9,
+                units="GB",
+                agree=distributed.agree_max(torch, device),
+            )
+            results["soak"]["message_size_bytes"] = size
+        if profile_iters > 0:
+            results["profile"] = profiling.profile_ops(
+                _step, iters=profile_iters, trace_path=trace_path
+            )
+            results["profile"]["message_size_bytes"] = size
         return results
     finally:
         if torch.distributed.is_initialized():
@@ -0,0 +1,299 @@
+import math
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from tests import distributed
+
+
+SHAPE_MIXES = ("transformer", "uniform", "small")
+OPS = ("torch_save", "torch_load", "torch_load_mmap", "dcp_save", "dcp_load")
+LOAD_OPS = ("torch_load", "torch_load_mmap", "dcp_load")
+UNIFORM_TENSOR_BYTES = 64 << 20
+SMALL_TENSOR_BYTES = (4 << 10, 64 << 10, 1 << 20)
+
+
+def _shapes(mix, total_bytes, element_size):
+    # (name, shape) list whose tensors add up to at least total_bytes.
+    total = max(total_bytes // element_size, 1)
+    shapes = []
+    if mix == "transformer":
+        # One block: fused qkv, output projection, MLP up/down and two norms,
+        # with the hidden size picked so the state holds at least four blocks.
+        hidden = 64
+        while hidden < 8192 and 12 * (2 * hidden) ** 2 * 4 <= total:
+            hidden *= 2
+        block = (
+            ("attn.qkv.weight", (3 * hidden, hidden)),
+            ("attn.qkv.bias", (3 * hidden,)),
+            ("attn.proj.weight", (hidden, hidden)),
+            ("mlp.fc1.weight", (4 * hidden, hidden)),
+            ("mlp.fc2.weight", (hidden, 4 * hidden)),
+            ("norm1.weight", (hidden,)),
+            ("norm2.weight", (hidden,)),
+        )
+        block_elems = sum(math.prod(shape) for _, shape in block)
+        for layer in range(max(math.ceil(total / block_elems), 1)):
+            shapes += [(f"layers.{layer}.{name}", shape) for name, shape in block]
+    elif mix == "uniform":
+        numel = min(max(UNIFORM_TENSOR_BYTES // element_size, 1), total)
+        count = math.ceil(total / numel)
+        shapes = [(f"tensor.{index}", (numel,)) for index in range(count)]
+    else:
+        # Many small tensors: per-tensor overhead instead of bandwidth.
+        remaining = total
+        index = 0
+        while remaining > 0:
+            numel = SMALL_TENSOR_BYTES[index % len(SMALL_TENSOR_BYTES)] // element_size
+            shapes.append((f"param.{index}", (max(numel, 1),)))
+            remaining -= numel
+            index += 1
+    return shapes
+
+
+def _evict_tree(root):
+    # Drop the checkpoint's pages from the page cache so loads read storage.
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            fd = os.open(os.path.join(dirpath, name), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+    return True
+
+
+def _tree_bytes(root):
+    total = 0
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def _summarize(op_times, bytes_per_rank, world_size):
+    # op_times[repeat][rank] in seconds. Every repeat starts on a barrier, so
+    # its wall time is the slowest rank.
+    walls = [max(times) for times in op_times]
+    wall_s = statistics.median(walls)
+    rank_s = [
+        statistics.median(times[rank] for times in op_times)
+        for rank in range(world_size)
+    ]
+    per_rank = [bytes_per_rank / seconds / 1e9 for seconds in rank_s if seconds > 0]
+    return {
+        "time_s": wall_s,
+        "time_s_all": walls,
+        "aggregate_gbps": (
+            bytes_per_rank * world_size / wall_s / 1e9 if wall_s else None
+        ),
+        "per_rank_gbps": {
+            "min": min(per_rank) if per_rank else None,
+            "mean": statistics.fmean(per_rank) if per_rank else None,
+            "max": max(per_rank) if per_rank else None,
+        },
+    }
+
+
+def run_ckpt(
+    ckpt_dir="",
+    size_mb=1024,
+    shape_mix="transformer",
+    dtype_name="bfloat16",
+    repeats=3,
+    threads=1,
+    ops=None,
+    keep=False,
+):
+    try:
+        import torch
+        import torch.distributed as dist
+    except ImportError:
+        return {"error": "torch not available"}
+
+    ops = list(ops or OPS)
+    unknown = [op for op in ops if op not in OPS]
+    if unknown:
+        return {"error": "unknown ops: " + ", ".join(unknown)}
+    if shape_mix not in SHAPE_MIXES:
+        return {"error": f"unknown shape mix: {shape_mix}"}
+    dtype_map = {
+        "float32": torch.float32,
+        "float16": torch.float16,
+        "bfloat16": torch.bfloat16,
+    }
+    dtype = dtype_map.get(dtype_name, torch.bfloat16)
+
+    # One rank without a launcher is fine; anything else needs the group.
+    launched = "WORLD_SIZE" in os.environ or "SLURM_NTASKS" in os.environ
+    if launched:
+        ok, err = distributed.init_process_group(torch)
+        if not ok:
+            return {"error": f"distributed init failed: {err}"}
+    world_size = dist.get_world_size() if dist.is_initialized() else 1
+    rank = dist.get_rank() if dist.is_initialized() else 0
+
+    if torch.cuda.is_available():
+        device = torch.device("cuda", distributed.local_cuda_index(torch))
+        torch.cuda.set_device(device)
+    else:
+        device = torch.device("cpu")
+
+    def _sync():
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+
+    def _barrier():
+        if dist.is_initialized():
+            dist.barrier()
+
+    def _gather(value):
+        if not dist.is_initialized():
+            return [value]
+        values = [None] * world_size
+        dist.all_gather_object(values, value)
+        return values
+
+    root = [None]
+    if rank == 0:
+        base = ckpt_dir or tempfile.gettempdir()
+        os.makedirs(base, exist_ok=True)
+        root[0] = tempfile.mkdtemp(prefix="ckpt_bench_", dir=base)
+    if dist.is_initialized():
+        dist.broadcast_object_list(root, src=0)
+    root = root[0]
+
+    element_size = torch.tensor([], dtype=dtype).element_size()
+    shapes = _shapes(shape_mix, size_mb << 20, element_size)
+    # Keys are unique per rank, so DCP treats every tensor as a shard that its
+    # own rank writes instead of a replica only rank 0 saves.
+    prefix = f"rank{rank}."
+    generator = torch.Generator().manual_seed(rank)
+    state = {
+        prefix + name: torch.randn(shape, generator=generator, dtype=dtype).to(device)
+        for name, shape in shapes
+    }
+    bytes_per_rank = sum(t.numel() * t.element_size() for t in state.values())
+    torch_path = os.path.join(root, "torch", f"rank{rank}.pt")
+    dcp_path = os.path.join(root, "dcp")
+    os.makedirs(os.path.dirname(torch_path), exist_ok=True)
+    os.makedirs(dcp_path, exist_ok=True)
+
+    def _resume(loaded):
+        # Resuming means the model's tensors hold the values, not just a
+        # (possibly lazy, mmap-backed) dict of them.
+        with torch.no_grad():
+            for key, tensor in state.items():
+                tensor.copy_(loaded[key], non_blocking=True)
+        _sync()
+
+    def torch_save():
+        with open(torch_path, "wb") as handle:
+            torch.save(state, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def torch_load():
+        _resume(torch.load(torch_path, map_location="cpu", weights_only=True))
+
+    def torch_load_mmap():
+        _resume(
+            torch.load(torch_path, map_location="cpu", weights_only=True, mmap=True)
+        )
+
+    def dcp_save():
+        from torch.distributed import checkpoint as dcp
+
+        writer = dcp.FileSystemWriter(dcp_path, thread_count=threads)
+        dcp.save(state, storage_writer=writer)
+
+    def dcp_load():
+        from torch.distributed import checkpoint as dcp
+
+        dcp.load(state, storage_reader=dcp.FileSystemReader(dcp_path))
+        _sync()
+
+    runners = {
+        "torch_save": torch_save,
+        "torch_load": torch_load,
+        "torch_load_mmap": torch_load_mmap,
+        "dcp_save": dcp_save,
+        "dcp_load": dcp_load,
+    }
+    results = {}
+    evicted = False
+    try:
+        for op in ops:
+            if op in LOAD_OPS:
+                saved = (
+                    torch_path
+                    if op.startswith("torch")
+                    else os.path.join(dcp_path, ".metadata")
+                )
+                if not all(_gather(os.path.exists(saved))):
+                    results[op] = {"error": "no checkpoint; run the save op first"}
+                    continue
+            op_times = []
+            error = ""
+            for _ in range(max(repeats, 1)):
+                if op in LOAD_OPS:
+                    # Every node drops its own cached pages.
+                    evicted = _evict_tree(root)
+                _sync()
+                _barrier()
+                start = time.perf_counter()
+                try:
+                    runners[op]()
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                elapsed = time.perf_counter() - start
+                errors = [e for e in _gather(error) if e]
+                if errors:
+                    error = errors[0]
+                    break
+                op_times.append(_gather(elapsed))
+            if error:
+                results[op] = {"error": error}
+                continue
+            results[op] = _summarize(op_times, bytes_per_rank, world_size)
+        on_disk = {"torch": _tree_bytes(os.path.dirname(torch_path))}
+        on_disk["dcp"] = _tree_bytes(dcp_path)
+        _barrier()
+    finally:
+        if rank == 0 and not keep:
+            shutil.rmtree(root, ignore_errors=True)
+        if dist.is_initialized():
+            dist.destroy_process_group()
+
+    summary = {}
+    for op, record in results.items():
+        if "error" in record:
+            continue
+        summary[f"{op}_aggregate_gbps"] = record["aggregate_gbps"]
+        summary[f"{op}_s"] = record["time_s"]
+    resumes = [
+        results[op]["time_s"]
+        for op in LOAD_OPS
+        if op in results and "error" not in results[op]
+    ]
+    summary["time_to_resume_s"] = min(resumes) if resumes else None
+    return {
+        "device": device.type,
+        "dtype": str(dtype).replace("torch.", ""),
+        "world_size": world_size,
+        "shape_mix": shape_mix,
+        "tensors_per_rank": len(state),
+        "bytes_per_rank": bytes_per_rank,
+        "total_bytes": bytes_per_rank * world_size,
+        "bytes_on_disk": on_disk,
+        "threads": threads,
+        "repeats": repeats,
+        "ckpt_dir": os.path.dirname(root),
+        "page_cache_evicted": evicted,
+        "ops": results,
+        "summary": summary,
+    }
@@ -0,0 +1,292 @@
+import time
+
+from common import comm_trace, stats
+from tests import distributed
+
+
+PACINGS = ("original", "none")
+
+
+def _runner(torch_mod, op, group, ranks, group_size, buffer):
+    dist = torch_mod.distributed
+    if op == "all_reduce":
+        return lambda numel, dtype: dist.all_reduce(
+            buffer(numel, dtype), group=group
+        )
+    if op == "broadcast":
+        return lambda numel, dtype: dist.broadcast(
+            buffer(numel, dtype), src=ranks[0], group=group
+        )
+    if op == "reduce":
+        return lambda numel, dtype: dist.reduce(
+            buffer(numel, dtype), dst=ranks[0], group=group
+        )
+    if op == "all_gather":
+        return lambda numel, dtype: dist.all_gather(
+            list(buffer(numel * group_size, dtype, "out").chunk(group_size)),
+            buffer(numel, dtype),
+            group=group,
+        )
+    if op == "all_gather_into_tensor":
+        return lambda numel, dtype: dist.all_gather_into_tensor(
+            buffer(numel * group_size, dtype, "out"),
+            buffer(numel, dtype),
+            group=group,
+        )
+    if op == "reduce_scatter_tensor":
+        return lambda numel, dtype: dist.reduce_scatter_tensor(
+            buffer(numel // group_size, dtype, "out"),
+            buffer(numel, dtype),
+            group=group,
+        )
+    if op == "all_to_all_single":
+        return lambda numel, dtype: dist.all_to_all_single(
+            buffer(numel, dtype, "out"), buffer(numel, dtype), group=group
+        )
+    if op == "barrier":
+        return lambda numel, dtype: dist.barrier(group=group)
+    return None
+
+
+def run_capture_check(trace_path, steps=3, size=256):
+    # Traces a DDP model small enough to fit one bucket: every step must
+    # record exactly one all_reduce. Leaves the process group up for replay.
+    try:
+        import torch
+        from torch.nn.parallel import DistributedDataParallel as DDP
+    except ImportError:
+        return {"error": "torch not available"}
+
+    ok, err = distributed.init_process_group(torch)
+    if not ok:
+        return {"error": f"distributed init failed: {err}"}
+    # nccl/rccl only reduces device tensors; gloo keeps the check on CPU.
+    if distributed.backend() != "gloo" and torch.cuda.is_available():
+        device_index = distributed.local_cuda_index(torch)
+        device = torch.device("cuda", device_index)
+        torch.cuda.set_device(device)
+        device_ids = [device_index]
+    else:
+        device = torch.device("cpu")
+        device_ids = None
+    tracer = comm_trace.CommTracer(torch, trace_path)
+    try:
+        model = DDP(
+            torch.nn.Linear(size, size, bias=False).to(device), device_ids=device_ids
+        )
+        model.register_comm_hook(None, tracer.ddp_hook)
+        x = torch.randn(8, size, device=device)
+        tracer.install()
+        for _ in range(steps):
+            model(x).sum().backward()
+            model.zero_grad(set_to_none=True)
+    except RuntimeError as exc:
+        tracer.uninstall()
+        torch.distributed.destroy_process_group()
+        return {"error": f"capture failed: {type(exc).__name__}: {exc}"}
+    tracer.uninstall()
+    recorded = sum(1 for op in tracer.ops if op[0] == "all_reduce")
+    saved = tracer.save()
+    # Rank 0 writes the trace the other ranks are about to read.
+    torch.distributed.barrier()
+    return {
+        "steps": steps,
+        "all_reduce_recorded": recorded,
+        "ok": recorded == steps,
+        "trace": saved,
+    }
+
+
+def run_replay(trace_path, pacing="original", repeats=1, warmup=1):
+    try:
+        import torch
+        import torch.distributed as dist
+    except ImportError:
+        return {"error": "torch not available"}
+
+    if pacing not in PACINGS:
+        return {"error": f"unknown pacing: {pacing}"}
+    ok, err = distributed.init_process_group(torch)
+    if not ok:
+        return {"error": f"distributed init failed: {err}"}
+
+    rank = dist.get_rank()
+    world_size = dist.get_world_size()
+    if distributed.backend() != "gloo" and torch.cuda.is_available():
+        device = torch.device("cuda", distributed.local_cuda_index(torch))
+        torch.cuda.set_device(device)
+    else:
+        device = torch.device("cpu")
+
+    def _sync():
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+
+    error = None
+    try:
+        trace = comm_trace.load(trace_path, rank)
+    except (OSError, ValueError) as exc:
+        error = f"cannot read trace: {exc}"
+    # Each rank's trace lists only the sub-groups that rank used, in its own
+    # first-use order. new_group is collective, so every rank creates the
+    # union of all of them in one sorted order and remaps its own indices.
+    rank_groups = [None] * world_size
+    dist.all_gather_object(rank_groups, (error, None if error else trace["groups"]))
+    errors = [err for err, _ in rank_groups if err]
+    if errors:
+        dist.destroy_process_group()
+        return {"error": errors[0]}
+    subgroups = sorted(
+        {tuple(ranks) for _, groups in rank_groups for ranks in groups[1:]}
+    )
+    if subgroups and trace["world_size"] != world_size:
+        dist.destroy_process_group()
+        return {
+            "error": f"trace uses sub-groups and was recorded on "
+            f"{trace['world_size']} ranks, not {world_size}"
+        }
+    groups = [(None, list(range(world_size)))]
+    for ranks in subgroups:
+        groups.append((dist.new_group(list(ranks)), list(ranks)))
+    remap = [comm_trace.WORLD_GROUP] + [
+        subgroups.index(tuple(ranks)) + 1 for ranks in trace["groups"][1:]
+    ]
+    for record in trace["ops"]:
+        record[3] = remap[record[3]]
+
+    buffers = {}
+
+    def buffer(numel, dtype, kind="in"):
+        # One buffer per dtype and role, grown to the largest size seen.
+        key = (dtype, kind)
+        current = buffers.get(key)
+        if current is None or current.numel() < numel:
+            current = torch.ones(
+                max(numel, 1), dtype=getattr(torch, dtype), device=device
+            )
+            buffers[key] = current
+        return current[:numel]
+
+    element_sizes = {
+        dtype: torch.tensor([], dtype=getattr(torch, dtype)).element_size()
+        for dtype in {record[1] for record in trace["ops"] if record[1]}
+    }
+    runners = {}
+    skipped = {}
+    for op, _, _, group_index, _ in trace["ops"]:
+        if (op, group_index) in runners:
+            continue
+        group, ranks = groups[group_index]
+        runner = _runner(torch, op, group, ranks, len(ranks), buffer)
+        if runner is None:
+            skipped[op] = "unsupported op"
+        # Ranks outside a sub-group skip its collectives, as they did when
+        # the trace was recorded.
+        runners[(op, group_index)] = runner if rank in ranks else None
+
+    agree = distributed.agree_max(torch, device)
+
+    def replay(record, check):
+        # check: after every op all ranks agree on whether it failed anywhere
+        # and drop it together, so no rank runs ahead of the others. Measured
+        # passes skip that extra collective and abort on a failure instead.
+        per_op = {}
+        last_issue = None
+        comm_s = 0.0
+        start = time.perf_counter()
+        for op, dtype, numel, group_index, gap_us in trace["ops"]:
+            if op in skipped:
+                continue
+            runner = runners[(op, group_index)]
+            error = ""
+            if runner is not None:
+                if pacing == "original" and last_issue is not None:
+                    # The recorded gap is issue-to-issue, so time spent in the
+                    # previous collective counts towards it.
+                    delay = last_issue + gap_us / 1e6 - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                last_issue = time.perf_counter()
+                try:
+                    runner(numel, dtype)
+                    _sync()
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+            if check:
+                if agree(1 if error else 0):
+                    skipped[op] = error or "failed on another rank"
+                    continue
+            elif error:
+                raise RuntimeError(f"{op}: {error}")
+            if runner is None:
+                continue
+            elapsed = time.perf_counter() - last_issue
+            if not record:
+                continue
+            comm_s += elapsed
+            entry = per_op.setdefault(
+                op, {"count": 0, "bytes": 0, "time": stats.StreamingStats()}
+            )
+            entry["count"] += 1
+            entry["bytes"] += numel * element_sizes.get(dtype, 0)
+            entry["time"].add(elapsed * 1e6)
+        return per_op, comm_s, time.perf_counter() - start
+
+    try:
+        # At least one checked pass, so every op that fails is known to all
+        # ranks before timing starts.
+        for _ in range(max(warmup, 1)):
+            dist.barrier()
+            replay(False, True)
+        comm_times = []
+        wall_times = []
+        per_op = {}
+        for _ in range(max(repeats, 1)):
+            dist.barrier()
+            per_op, comm_s, wall_s = replay(True, False)
+            comm_times.append(comm_s)
+            wall_times.append(wall_s)
+
+        # Collectives end together, so the slowest rank's totals are the
+        # job's; per-op detail comes from this rank.
+        rank_totals = [None] * world_size
+        dist.all_gather_object(rank_totals, (min(comm_times), min(wall_times)))
+        total_comm_s = max(comm for comm, _ in rank_totals)
+        wall_s = max(wall for _, wall in rank_totals)
+        ops = {}
+        for op, entry in per_op.items():
+            timing = entry["time"]
+            total_s = timing.mean * timing.count / 1e6
+            ops[op] = {
+                "count": entry["count"],
+                "bytes": entry["bytes"],
+                "total_ms": total_s * 1000.0,
+                "share": total_s / comm_times[-1] if comm_times[-1] else None,
+                "latency_p50_us": timing.percentile(50),
+                "latency_p99_us": timing.percentile(99),
+                "algbw_gbps": entry["bytes"] / total_s / 1e9 if total_s else None,
+            }
+        recorded_s = sum(record[4] for record in trace["ops"]) / 1e6
+        return {
+            "trace": comm_trace.trace_file(trace_path, rank),
+            "trace_world_size": trace["world_size"],
+            "trace_backend": trace.get("backend", ""),
+            "trace_ops": len(trace["ops"]),
+            "trace_dropped": trace.get("dropped", 0),
+            "recorded_duration_s": recorded_s,
+            "world_size": world_size,
+            "backend": distributed.backend(),
+            "device": device.type,
+            "pacing": pacing,
+            "repeats": repeats,
+            "ops": ops,
+            "skipped_ops": skipped,
+            "total_comm_s": total_comm_s,
+            "wall_s": wall_s,
+            "comm_fraction": total_comm_s / wall_s if wall_s else None,
+        }
+    except RuntimeError as exc:
+        return {"error": f"replay failed: {exc}"}
+    finally:
+        if dist.is_initialized():
+            dist.destroy_process_group()
@@ -0,0 +1,209 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from common import stats, worker
+
+
+DEFAULT_MODULES = ("kernel_mix", "transformer")
+
+
+def _cache_env(cache_dir):
+    return {
+        "TORCHINDUCTOR_CACHE_DIR": os.path.join(cache_dir, "inductor"),
+        "TORCHINDUCTOR_FX_GRAPH_CACHE": "1",
+        "TRITON_CACHE_DIR": os.path.join(cache_dir, "triton"),
+    }
+
+
+def _count_files(path):
+    total = 0
+    for _, _, files in os.walk(path):
+        total += len(files)
+    return total
+
+
+def _build_module(torch_mod, name, size, device, dtype):
+    from tests import kernel_mix
+
+    hidden = max(size, 64)
+    if name == "kernel_mix":
+        batch = max(hidden // 16, 16)
+        x = torch_mod.randn(batch, hidden, device=device, dtype=dtype)
+        residual = torch_mod.randn(batch, hidden, device=device, dtype=dtype)
+        w = torch_mod.randn(hidden, hidden, device=device, dtype=dtype)
+        return kernel_mix.mix_forward, (x, w, residual)
+    if name == "transformer":
+        layer = torch_mod.nn.TransformerEncoderLayer(
+            d_model=hidden,
+            nhead=max(hidden // 64, 1),
+            dim_feedforward=4 * hidden,
+            batch_first=True,
+        ).to(device=device, dtype=dtype)
+        layer.eval()
+        x = torch_mod.randn(8, 128, hidden, device=device, dtype=dtype)
+        return layer, (x,)
+    raise ValueError(f"unknown module: {name}")
+
+
+def _cache_counters(counters):
+    flat = {}
+    for group, values in counters.items():
+        for key, value in values.items():
+            if "cache" in key:
+                flat[f"{group}.{key}"] = value
+    hits = sum(v for k, v in flat.items() if k.endswith("cache_hit"))
+    misses = sum(v for k, v in flat.items() if k.endswith("cache_miss"))
+    return hits, misses, flat
+
+
+def _measure_module(torch_mod, name, config, device, dtype):
+    from torch._dynamo.utils import counters
+
+    target, inputs = _build_module(torch_mod, name, config["size"], device, dtype)
+    has_device = device.type == "cuda"
+
+    def _sync():
+        if has_device:
+            torch_mod.cuda.synchronize()
+
+    def _eager():
+        target(*inputs)
+        _sync()
+
+    with torch_mod.no_grad():
+        eager = stats.timeit(_eager, warmup=config["warmup"], iters=config["iters"])
+
+        torch_mod._dynamo.reset()
+        counters.clear()
+        compiled_fn = torch_mod.compile(target, backend=config["backend"])
+        _sync()
+        start = time.perf_counter()
+        compiled_fn(*inputs)
+        _sync()
+        compile_s = time.perf_counter() - start
+        hits, misses, flat = _cache_counters(counters)
+
+        def _compiled():
+            compiled_fn(*inputs)
+            _sync()
+
+        compiled = stats.timeit(
+            _compiled, warmup=config["warmup"], iters=config["iters"]
+        )
+
+    eager_p50 = eager["p50_s"]
+    compiled_p50 = compiled["p50_s"]
+    return {
+        "compile_s": compile_s,
+        "cache_hits": hits,
+        "cache_misses": misses,
+        "cache_counters": flat,
+        "eager_p50_ms": eager_p50 * 1000 if eager_p50 else None,
+        "compiled_p50_ms": compiled_p50 * 1000 if compiled_p50 else None,
+        "speedup": eager_p50 / compiled_p50 if eager_p50 and compiled_p50 else None,
+    }
+
+
+def _worker(config):
+    try:
+        import torch
+    except ImportError:
+        return {"error": "torch not available"}
+
+    if not hasattr(torch, "compile"):
+        return {"error": "torch.compile not available"}
+
+    if torch.cuda.is_available():
+        device = torch.device("cuda")
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    else:
+        device = torch.device("cpu")
+        dtype = torch.float32
+
+    results = {"device": device.type, "dtype": str(dtype).replace("torch.", "")}
+    modules = {}
+    for name in config["modules"]:
+        try:
+            modules[name] = _measure_module(torch, name, config, device, dtype)
+        except Exception as exc:
+            modules[name] = {"error": f"{type(exc).__name__}: {exc}"}
+    results["modules"] = modules
+    return results
+
+
+def run_compile(
+    modules=DEFAULT_MODULES,
+    size=1024,
+    warmup=2,
+    iters=5,
+    backend="inductor",
+    cache_root="",
+    keep_cache=False,
+):
+    config = {
+        "modules": list(modules),
+        "size": size,
+        "warmup": warmup,
+        "iters": iters,
+        "backend": backend,
+    }
+    if cache_root:
+        os.makedirs(cache_root, exist_ok=True)
+    cache_dir = tempfile.mkdtemp(prefix="compile_cache_", dir=cache_root or None)
+
+    try:
+        phases = {}
+        for phase in ("cold", "warm"):
+            phases[phase] = worker.run_worker(
+                "tests.compile_bench", config, env=_cache_env(cache_dir)
+            )
+            if "error" in phases[phase]:
+                return {"error": f"{phase}: {phases[phase]['error']}"}
+            phases[phase]["cache_files"] = _count_files(cache_dir)
+    finally:
+        if not keep_cache:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    cold = phases["cold"]
+    warm = phases["warm"]
+    summary = {}
+    for name in modules:
+        cold_module = cold["modules"].get(name, {})
+        warm_module = warm["modules"].get(name, {})
+        error = cold_module.get("error") or warm_module.get("error")
+        if error:
+            summary[name] = {"error": error}
+            continue
+        cold_s = cold_module["compile_s"]
+        warm_s = warm_module["compile_s"]
+        summary[name] = {
+            "cold_compile_s": cold_s,
+            "warm_compile_s": warm_s,
+            "warm_compile_speedup": cold_s / warm_s if warm_s else None,
+            "cold_cache_hits": cold_module["cache_hits"],
+            "cold_cache_misses": cold_module["cache_misses"],
+            "warm_cache_hits": warm_module["cache_hits"],
+            "warm_cache_misses": warm_module["cache_misses"],
+            "eager_p50_ms": warm_module["eager_p50_ms"],
+            "compiled_p50_ms": warm_module["compiled_p50_ms"],
+            "speedup": warm_module["speedup"],
+        }
+
+    return {
+        "backend": backend,
+        "device": cold["device"],
+        "dtype": cold["dtype"],
+        "size": size,
+        "cache_root": cache_root or tempfile.gettempdir(),
+        "cache_files_cold": cold["cache_files"],
+        "cache_files_warm": warm["cache_files"],
+        "modules": summary,
+        "phases": phases,
+    }
+
+
+if __name__ == "__main__":
+    raise SystemExit(worker.main(_worker, sys.argv))
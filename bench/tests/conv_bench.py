@@ -0,0 +1,235 @@
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from common import stats, worker
+
+
+# (in_channels, out_channels, spatial, kernel, stride, padding, batch)
+DEFAULT_SHAPES = {
+    "resnet_stem": (3, 64, (224, 224), 7, 2, 3, 32),
+    "resnet_3x3": (64, 64, (56, 56), 3, 1, 1, 32),
+    "resnet_1x1": (256, 64, (56, 56), 1, 1, 0, 32),
+    "resnet_down": (128, 256, (28, 28), 3, 2, 1, 32),
+    "unet_3x3": (128, 128, (128, 128), 3, 1, 1, 8),
+    "video_3d": (64, 64, (16, 56, 56), 3, 1, 1, 4),
+    "volume_3d": (32, 32, (64, 64, 64), 3, 1, 1, 2),
+}
+DIRECTIONS = ("fwd", "bwd")
+
+
+def _miopen_env(cache_dir):
+    return {
+        "MIOPEN_USER_DB_PATH": os.path.join(cache_dir, "config"),
+        "MIOPEN_CUSTOM_CACHE_DIR": os.path.join(cache_dir, "cache"),
+    }
+
+
+def _count_files(path):
+    total = 0
+    for _, _, files in os.walk(path):
+        total += len(files)
+    return total
+
+
+def _timed(fn, sync):
+    sync()
+    start = time.perf_counter()
+    fn()
+    sync()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def _measure_shape(torch_mod, shape, config, device, dtype):
+    in_ch, out_ch, spatial, kernel, stride, padding, batch = shape
+    batch = config["batch"] or (batch if device.type == "cuda" else 1)
+    conv_cls = getattr(torch_mod.nn, f"Conv{len(spatial)}d")
+    conv = conv_cls(
+        in_ch, out_ch, kernel, stride=stride, padding=padding, bias=False
+    ).to(device=device, dtype=dtype)
+    x = torch_mod.randn(
+        batch, in_ch, *spatial, device=device, dtype=dtype, requires_grad=True
+    )
+    has_device = device.type == "cuda"
+
+    def _sync():
+        if has_device:
+            torch_mod.cuda.synchronize()
+
+    def _forward():
+        with torch_mod.no_grad():
+            conv(x)
+        _sync()
+
+    # The first call of each direction pays the MIOpen find (with
+    # cudnn.benchmark) and kernel compilation unless the find-db has it.
+    first_fwd_ms = _timed(_forward, _sync)
+    y = conv(x)
+    grad = torch_mod.randn_like(y)
+
+    def _backward():
+        torch_mod.autograd.grad(y, (x, conv.weight), grad, retain_graph=True)
+        _sync()
+
+    first_bwd_ms = _timed(_backward, _sync)
+    fwd = stats.timeit(_forward, warmup=config["warmup"], iters=config["iters"])
+    bwd = stats.timeit(_backward, warmup=config["warmup"], iters=config["iters"])
+
+    fwd_flops = (
+        2.0 * batch * out_ch * in_ch * kernel ** len(spatial) * math.prod(y.shape[2:])
+    )
+    results = {"batch": batch, "output_shape": list(y.shape)}
+    for name, first_ms, timings, flops in (
+        ("fwd", first_fwd_ms, fwd, fwd_flops),
+        ("bwd", first_bwd_ms, bwd, 2.0 * fwd_flops),
+    ):
+        p50 = timings["p50_s"]
+        results[name] = {
+            "first_call_ms": first_ms,
+            "steady_p50_ms": p50 * 1000 if p50 else None,
+            "search_ms": first_ms - p50 * 1000 if p50 else None,
+            "flops": flops,
+            "tflops": flops / p50 / 1e12 if p50 else None,
+        }
+    return results
+
+
+def _worker(config):
+    try:
+        import torch
+    except ImportError:
+        return {"error": "torch not available"}
+
+    if torch.cuda.is_available():
+        device = torch.device("cuda")
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    else:
+        device = torch.device("cpu")
+        dtype = torch.float32
+    torch.backends.cudnn.benchmark = config["benchmark"]
+
+    shapes = {}
+    for name in config["shapes"]:
+        try:
+            shapes[name] = _measure_shape(
+                torch, DEFAULT_SHAPES[name], config, device, dtype
+            )
+        except Exception as exc:
+            shapes[name] = {"error": f"{type(exc).__name__}: {exc}"}
+    return {
+        "device": device.type,
+        "dtype": str(dtype).replace("torch.", ""),
+        "miopen": bool(torch.version.hip),
+        "shapes": shapes,
+    }
+
+
+def _phase_totals(phase):
+    first_ms = 0.0
+    steady_ms = 0.0
+    flops = 0.0
+    for result in phase["shapes"].values():
+        if "error" in result:
+            continue
+        for direction in DIRECTIONS:
+            record = result[direction]
+            if record["steady_p50_ms"] is None:
+                continue
+            first_ms += record["first_call_ms"]
+            steady_ms += record["steady_p50_ms"]
+            flops += record["flops"]
+    return {
+        "first_call_total_s": first_ms / 1000.0,
+        "steady_tflops": flops / (steady_ms / 1000.0) / 1e12 if steady_ms else None,
+    }
+
+
+def run_conv(
+    shapes=None,
+    batch=0,
+    warmup=2,
+    iters=5,
+    benchmark=True,
+    cache_root="",
+    keep_cache=False,
+):
+    config = {
+        "shapes": list(shapes or DEFAULT_SHAPES),
+        "batch": batch,
+        "warmup": warmup,
+        "iters": iters,
+        "benchmark": benchmark,
+    }
+    unknown = [name for name in config["shapes"] if name not in DEFAULT_SHAPES]
+    if unknown:
+        return {"error": "unknown shapes: " + ", ".join(unknown)}
+    if cache_root:
+        os.makedirs(cache_root, exist_ok=True)
+    cache_dir = tempfile.mkdtemp(prefix="miopen_finddb_", dir=cache_root or None)
+
+    try:
+        phases = {}
+        # cold starts from an empty find-db, as every template run does today;
+        # persisted is a fresh process reusing the find-db cold just wrote.
+        for phase in ("cold", "persisted"):
+            phases[phase] = worker.run_worker(
+                "tests.conv_bench", config, env=_miopen_env(cache_dir)
+            )
+            if "error" in phases[phase]:
+                return {"error": f"{phase}: {phases[phase]['error']}"}
+            phases[phase]["finddb_files"] = _count_files(cache_dir)
+    finally:
+        if not keep_cache:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    cold = phases["cold"]
+    persisted = phases["persisted"]
+    summary = {}
+    for name in config["shapes"]:
+        cold_shape = cold["shapes"].get(name, {})
+        persisted_shape = persisted["shapes"].get(name, {})
+        error = cold_shape.get("error") or persisted_shape.get("error")
+        if error:
+            summary[name] = {"error": error}
+            continue
+        summary[name] = {"batch": cold_shape["batch"]}
+        for direction in DIRECTIONS:
+            cold_dir = cold_shape[direction]
+            persisted_dir = persisted_shape[direction]
+            summary[name][direction] = {
+                "cold_first_call_ms": cold_dir["first_call_ms"],
+                "persisted_first_call_ms": persisted_dir["first_call_ms"],
+                "cold_search_ms": cold_dir["search_ms"],
+                "steady_p50_ms": persisted_dir["steady_p50_ms"],
+                "cold_tflops": cold_dir["tflops"],
+                "persisted_tflops": persisted_dir["tflops"],
+            }
+
+    cold_totals = _phase_totals(cold)
+    persisted_totals = _phase_totals(persisted)
+    return {
+        "device": cold["device"],
+        "dtype": cold["dtype"],
+        "miopen": cold["miopen"],
+        "benchmark": benchmark,
+        "cache_root": cache_root or tempfile.gettempdir(),
+        "finddb_files_cold": cold["finddb_files"],
+        "finddb_files_persisted": persisted["finddb_files"],
+        "summary": {
+            "cold_first_call_total_s": cold_totals["first_call_total_s"],
+            "persisted_first_call_total_s": persisted_totals["first_call_total_s"],
+            "tuning_cost_s": cold_totals["first_call_total_s"]
+            - persisted_totals["first_call_total_s"],
+            "cold_steady_tflops": cold_totals["steady_tflops"],
+            "persisted_steady_tflops": persisted_totals["steady_tflops"],
+        },
+        "shapes": summary,
+        "phases": phases,
+    }
+
+
+if __name__ == "__main__":
+    raise SystemExit(worker.main(_worker, sys.argv))
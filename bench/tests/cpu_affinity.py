@@ -0,0 +1,192 @@
+import os
+import socket
+import time
+
+from common import env_detect, stats
+from tests import distributed
+
+
+DEFAULT_MEMBW_MB = 256
+DEFAULT_GEMM_SIZE = 512
+DEFAULT_NOISE_WORK = 20000
+DEFAULT_NOISE_SAMPLES = 200
+
+
+def _affinity():
+    if hasattr(os, "sched_getaffinity"):
+        return set(os.sched_getaffinity(0))
+    return set(range(os.cpu_count() or 1))
+
+
+def _numpy_membw(np_mod, size_mb, iters):
+    numel = max(int(size_mb * 1024 * 1024) // 8, 1)
+    src = np_mod.ones(numel, dtype=np_mod.float64)
+    dst = np_mod.empty_like(src)
+    timings = stats.timeit(lambda: np_mod.copyto(dst, src), warmup=1, iters=iters)
+    p50 = timings["p50_s"]
+    return 2 * src.nbytes / p50 / 1.0e9 if p50 else None
+
+
+def _numpy_gemm(np_mod, size, iters):
+    a = np_mod.random.default_rng(0).standard_normal((size, size))
+    b = np_mod.random.default_rng(1).standard_normal((size, size))
+    timings = stats.timeit(lambda: np_mod.dot(a, b), warmup=1, iters=iters)
+    p50 = timings["p50_s"]
+    return 2 * size**3 / p50 / 1.0e9 if p50 else None
+
+
+def _quantum(work):
+    total = 0
+    for i in range(work):
+        total += i
+    return total
+
+
+def _noise_probe(cpus, work, samples):
+    # Fixed-work-quantum probe: the same loop is timed repeatedly on each bound
+    # core; anything above the fastest run is time stolen by the OS or other
+    # tenants.
+    can_pin = hasattr(os, "sched_setaffinity")
+    original = _affinity()
+    per_cpu = []
+    overall = stats.StreamingStats()
+    try:
+        for cpu in sorted(cpus) if can_pin else [None]:
+            if cpu is not None:
+                os.sched_setaffinity(0, {cpu})
+            _quantum(work)
+            sketch = stats.StreamingStats()
+            for _ in range(max(samples, 1)):
+                start = time.perf_counter()
+                _quantum(work)
+                sketch.add((time.perf_counter() - start) * 1.0e6)
+            overall.merge(sketch)
+            per_cpu.append(
+                {
+                    "cpu": cpu,
+                    "min_us": sketch.min,
+                    "p50_us": sketch.percentile(50),
+                    "p99_us": sketch.percentile(99),
+                    "max_us": sketch.max,
+                    "noise_pct": (sketch.mean - sketch.min) / sketch.min * 100.0,
+                }
+            )
+    finally:
+        if can_pin:
+            os.sched_setaffinity(0, original)
+    return {
+        "work": work,
+        "samples_per_cpu": samples,
+        "per_cpu": per_cpu,
+        "min_us": overall.min,
+        "p99_us": overall.percentile(99),
+        "max_us": overall.max,
+        "noise_pct": (overall.mean - overall.min) / overall.min * 100.0,
+    }
+
+
+def _rank_record(rank, membw_mb, gemm_size, noise_work, noise_samples, iters):
+    cpus = _affinity()
+    nodes = env_detect.numa_nodes()
+    numa = sorted(node for node, node_cpus in nodes.items() if cpus & node_cpus)
+    local_rank = distributed.env_int(
+        "LOCAL_RANK", distributed.env_int("SLURM_LOCALID", 0)
+    )
+    record = {
+        "rank": rank,
+        "local_rank": local_rank,
+        "hostname": socket.gethostname(),
+        "affinity": env_detect.format_cpulist(cpus),
+        "cpu_count": len(cpus),
+        "numa_nodes": numa,
+        "noise": _noise_probe(cpus, noise_work, noise_samples),
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        record["error"] = "numpy not available"
+        return record
+    record["membw_gbps"] = _numpy_membw(np, membw_mb, iters)
+    record["gemm_gflops"] = _numpy_gemm(np, gemm_size, iters)
+    return record
+
+
+def _gather(record):
+    try:
+        import torch
+    except ImportError:
+        return [record], ""
+
+    world_size = distributed.env_int(
+        "WORLD_SIZE", distributed.env_int("SLURM_NTASKS", 1)
+    )
+    if world_size <= 1:
+        return [record], ""
+    ok, err = distributed.init_process_group(torch, backend_name="gloo")
+    if not ok:
+        return None, f"distributed init failed: {err}"
+    try:
+        records = [None] * torch.distributed.get_world_size()
+        torch.distributed.all_gather_object(records, record)
+        return records, ""
+    finally:
+        torch.distributed.destroy_process_group()
+
+
+def _flags(records):
+    overlap = []
+    by_host = {}
+    for record in records:
+        by_host.setdefault(record["hostname"], []).append(record)
+    for host_records in by_host.values():
+        for i, first in enumerate(host_records):
+            first_cpus = env_detect.parse_cpulist(first["affinity"])
+            for second in host_records[i + 1:]:
+                shared = first_cpus & env_detect.parse_cpulist(second["affinity"])
+                if shared:
+                    overlap.append(
+                        {
+                            "ranks": [first["rank"], second["rank"]],
+                            "cpus": env_detect.format_cpulist(shared),
+                        }
+                    )
+    cross_numa = [r["rank"] for r in records if len(r["numa_nodes"]) > 1]
+    return overlap, cross_numa
+
+
+def _min_of(records, key):
+    values = [r[key] for r in records if r.get(key) is not None]
+    return min(values) if values else None
+
+
+def run_cpu_affinity(
+    membw_mb=DEFAULT_MEMBW_MB,
+    gemm_size=DEFAULT_GEMM_SIZE,
+    noise_work=DEFAULT_NOISE_WORK,
+    noise_samples=DEFAULT_NOISE_SAMPLES,
+    iters=5,
+):
+    rank = distributed.env_int("RANK", distributed.env_int("SLURM_PROCID", 0))
+    record = _rank_record(rank, membw_mb, gemm_size, noise_work, noise_samples, iters)
+    records, err = _gather(record)
+    if records is None:
+        return {"error": err}
+
+    records.sort(key=lambda r: r["rank"])
+    overlap, cross_numa = _flags(records)
+    noise = [r["noise"]["noise_pct"] for r in records]
+    return {
+        "world_size": len(records),
+        "cpu_bind": os.environ.get("BENCH_CPU_BIND", ""),
+        "ranks": records,
+        "overlap": overlap,
+        "cross_numa_ranks": cross_numa,
+        "status": "warn" if overlap or cross_numa else "pass",
+        "summary": {
+            "membw_gbps_min": _min_of(records, "membw_gbps"),
+            "gemm_gflops_min": _min_of(records, "gemm_gflops"),
+            "noise_pct_max": max(noise) if noise else None,
+            "overlap_count": len(overlap),
+            "cross_numa_count": len(cross_numa),
+        },
+    }
@@ -0,0 +1,287 @@
+import itertools
+import json
+import mmap
+import os
+import tempfile
+import time
+
+from common import env_detect
+
+
+DATASET_KINDS = ("files", "shards")
+DEFAULT_WORKERS = [0, 2, 4]
+DEFAULT_PREFETCH = [2]
+DEFAULT_PERSISTENT = [False, True]
+DEFAULT_PIN_MEMORY = [False]
+DEFAULT_START_METHODS = ["fork", "spawn"]
+RSS_SAMPLE_EVERY = 8
+
+
+class FileDataset:
+    def __init__(self, paths):
+        self.paths = paths
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, index):
+        import torch
+
+        with open(self.paths[index], "rb") as handle:
+            data = bytearray(handle.read())
+        return torch.frombuffer(data, dtype=torch.uint8)
+
+
+class ShardDataset:
+    # Shards are memory-mapped lazily so each worker maps its own view after
+    # fork/spawn instead of inheriting (or pickling) the parent's mappings.
+
+    def __init__(self, paths, samples_per_shard, sample_bytes):
+        self.paths = paths
+        self.samples_per_shard = samples_per_shard
+        self.sample_bytes = sample_bytes
+        self._maps = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_maps"] = {}
+        return state
+
+    def __len__(self):
+        return len(self.paths) * self.samples_per_shard
+
+    def _map(self, shard):
+        if shard not in self._maps:
+            with open(self.paths[shard], "rb") as handle:
+                self._maps[shard] = mmap.mmap(
+                    handle.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        return self._maps[shard]
+
+    def __getitem__(self, index):
+        import torch
+
+        shard, offset = divmod(index, self.samples_per_shard)
+        start = offset * self.sample_bytes
+        data = bytearray(self._map(shard)[start : start + self.sample_bytes])
+        return torch.frombuffer(data, dtype=torch.uint8)
+
+
+def _write_random(path, nbytes):
+    chunk = 4 * 1024 * 1024
+    with open(path, "wb") as handle:
+        remaining = nbytes
+        while remaining > 0:
+            size = min(chunk, remaining)
+            handle.write(os.urandom(size))
+            remaining -= size
+
+
+def _prepare_dataset(root, kind, num_samples, sample_bytes, num_shards):
+    meta = {
+        "kind": kind,
+        "num_samples": num_samples,
+        "sample_bytes": sample_bytes,
+        "num_shards": num_shards,
+    }
+    path = os.path.join(root, f"{kind}_{num_samples}x{sample_bytes}")
+    meta_path = os.path.join(path, "meta.json")
+    samples_per_shard = max(num_samples // max(num_shards, 1), 1)
+    if kind == "files":
+        paths = [os.path.join(path, f"{i:07d}.bin") for i in range(num_samples)]
+        file_bytes = sample_bytes
+    else:
+        paths = [os.path.join(path, f"shard_{i:04d}.bin") for i in range(num_shards)]
+        file_bytes = samples_per_shard * sample_bytes
+
+    generate_s = 0.0
+    cached = False
+    if os.path.exists(meta_path):
+        with open(meta_path, "r", encoding="utf-8") as handle:
+            cached = json.load(handle) == meta
+    if not cached:
+        os.makedirs(path, exist_ok=True)
+        start = time.perf_counter()
+        for file_path in paths:
+            _write_random(file_path, file_bytes)
+        generate_s = time.perf_counter() - start
+        with open(meta_path, "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+
+    if kind == "files":
+        dataset = FileDataset(paths)
+    else:
+        dataset = ShardDataset(paths, samples_per_shard, sample_bytes)
+    info = {
+        "path": path,
+        "samples": len(dataset),
+        "sample_bytes": sample_bytes,
+        "files": len(paths),
+        "cached": cached,
+        "generate_s": generate_s,
+    }
+    return dataset, info
+
+
+def _total_rss(iterator):
+    pids = ["self"] + [
+        worker.pid for worker in getattr(iterator, "_workers", []) if worker.pid
+    ]
+    values = [env_detect.process_rss_bytes(pid) for pid in pids]
+    values = [value for value in values if value is not None]
+    return sum(values) if values else None
+
+
+def _run_epoch(loader):
+    start = time.perf_counter()
+    iterator = iter(loader)
+    next(iterator)
+    startup_s = time.perf_counter() - start
+    peak_rss = _total_rss(iterator)
+    samples = 0
+    steady_start = time.perf_counter()
+    for index, batch in enumerate(iterator):
+        samples += batch.shape[0]
+        if index % RSS_SAMPLE_EVERY == 0:
+            rss = _total_rss(iterator)
+            if rss is not None:
+                peak_rss = max(peak_rss or 0, rss)
+    steady_s = time.perf_counter() - steady_start
+    return startup_s, samples, steady_s, peak_rss
+
+
+def _configs(workers, prefetch, persistent, pin_memory, start_methods):
+    seen = set()
+    for num_workers, factor, keep, pin, method in itertools.product(
+        workers, prefetch, persistent, pin_memory, start_methods
+    ):
+        if num_workers == 0:
+            # Worker-only options are meaningless in the main process.
+            factor, keep, method = None, False, None
+        key = (num_workers, factor, keep, pin, method)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield {
+            "num_workers": num_workers,
+            "prefetch_factor": factor,
+            "persistent_workers": keep,
+            "pin_memory": pin,
+            "start_method": method,
+        }
+
+
+def _measure(torch_mod, dataset, config, batch_size, epochs):
+    kwargs = {
+        "batch_size": batch_size,
+        "shuffle": True,
+        "num_workers": config["num_workers"],
+        "pin_memory": config["pin_memory"] and torch_mod.cuda.is_available(),
+    }
+    if config["num_workers"] > 0:
+        kwargs["prefetch_factor"] = config["prefetch_factor"]
+        kwargs["persistent_workers"] = config["persistent_workers"]
+        kwargs["multiprocessing_context"] = config["start_method"]
+    loader = torch_mod.utils.data.DataLoader(dataset, **kwargs)
+
+    startups = []
+    total_samples = 0
+    total_s = 0.0
+    peak_rss = None
+    for _ in range(max(epochs, 1)):
+        startup_s, samples, steady_s, rss = _run_epoch(loader)
+        startups.append(startup_s)
+        total_samples += samples
+        total_s += steady_s
+        if rss is not None:
+            peak_rss = max(peak_rss or 0, rss)
+    del loader
+
+    result = dict(config)
+    result.update(
+        {
+            "startup_s": startups[0],
+            "later_epoch_startup_s": (
+                sum(startups[1:]) / len(startups[1:]) if len(startups) > 1 else None
+            ),
+            "samples_per_sec": total_samples / total_s if total_s > 0 else None,
+            "peak_rss_mb": peak_rss / (1024 * 1024) if peak_rss else None,
+        }
+    )
+    return result
+
+
+def run_dataloader(
+    cache_root="",
+    num_samples=4096,
+    sample_kb=64,
+    num_shards=4,
+    batch_size=32,
+    epochs=2,
+    workers=None,
+    prefetch=None,
+    persistent=None,
+    pin_memory=None,
+    start_methods=None,
+    kinds=DATASET_KINDS,
+):
+    try:
+        import torch
+        import torch.multiprocessing as mp
+    except ImportError:
+        return {"error": "torch not available"}
+
+    unknown = [kind for kind in kinds if kind not in DATASET_KINDS]
+    if unknown:
+        return {"error": "unknown dataset kinds: " + ", ".join(unknown)}
+
+    root = os.path.join(cache_root or tempfile.gettempdir(), "dataloader")
+    try:
+        os.makedirs(root, exist_ok=True)
+    except OSError as exc:
+        return {"error": f"cannot create dataset root: {exc}"}
+
+    available = set(mp.get_all_start_methods())
+    requested = start_methods or DEFAULT_START_METHODS
+    methods = [m for m in requested if m in available]
+    skipped = [m for m in requested if m not in available]
+
+    datasets = {}
+    results = []
+    for kind in kinds:
+        dataset, info = _prepare_dataset(
+            root, kind, num_samples, sample_kb * 1024, num_shards
+        )
+        datasets[kind] = info
+        for config in _configs(
+            workers if workers is not None else DEFAULT_WORKERS,
+            prefetch or DEFAULT_PREFETCH,
+            persistent if persistent is not None else DEFAULT_PERSISTENT,
+            pin_memory if pin_memory is not None else DEFAULT_PIN_MEMORY,
+            methods or [None],
+        ):
+            try:
+                result = _measure(torch, dataset, config, batch_size, epochs)
+            except Exception as exc:
+                result = dict(config)
+                result["error"] = f"{type(exc).__name__}: {exc}"
+            result["dataset"] = kind
+            results.append(result)
+
+    best = {}
+    for kind in kinds:
+        ranked = [
+            r for r in results if r["dataset"] == kind and r.get("samples_per_sec")
+        ]
+        if ranked:
+            best[kind] = max(ranked, key=lambda r: r["samples_per_sec"])
+
+    return {
+        "root": root,
+        "batch_size": batch_size,
+        "epochs": epochs,
+        "datasets": datasets,
+        "skipped_start_methods": skipped,
+        "configs": results,
+        "best": best,
+    }
@@ -1,4 +1,6 @@
 import time
+
+from common import comm_trace, memory, profiling, soak, stats
 from tests import distributed
 
 
@@ -9,6 +11,11 @@ def run_ddp_step(
     warmup=3,
     iters=10,
     dtype_name="bfloat16",
+    duration_s=0,
+    window_s=soak.DEFAULT_WINDOW_S,
+    profile_iters=0,
+    trace_path="",
+    comm_trace_path="",
 ):
     try:
         import torch
@@ -27,6 +34,7 @@ def run_ddp_step(
     device_index = distributed.local_cuda_index(torch)
     device = torch.device("cuda", device_index)
     torch.cuda.set_device(device)
+    memory.reset(torch, device)
 
     dtype_map = {
         "float32": torch.float32,
@@ -40,6 +48,10 @@ def run_ddp_step(
         dtype=dtype,
     )
     model = DDP(model, device_ids=[device_index])
+    tracer = None
+    if comm_trace_path:
+        tracer = comm_trace.CommTracer(torch, comm_trace_path).install()
+        model.register_comm_hook(None, tracer.ddp_hook)
     optimizer = torch.optim.AdamW(model.parameters(), lr=1.0e-3)
     x = torch.randn(batch_size, input_size, device=device, dtype=dtype)
 
@@ -53,37 +65,60 @@ def run_ddp_step(
         for _ in range(max(warmup, 0)):
             step()
 
-        step_times = []
+        step_times = stats.StreamingStats()
         for _ in range(max(iters, 1)):
             torch.cuda.synchronize()
             start = time.perf_counter()
             step()
             torch.cuda.synchronize()
             end = time.perf_counter()
-            step_times.append((end - start) * 1000.0)
-
-        step_times_sorted = sorted(step_times)
-        mid = len(step_times_sorted) // 2
-        p50 = step_times_sorted[mid]
-        p95_index = int(0.95 * (len(step_times_sorted) - 1))
-        p95 = step_times_sorted[p95_index]
-        avg = sum(step_times) / len(step_times)
+            step_times.add((end - start) * 1000.0)
 
         world_size = dist.get_world_size()
+        rank_states = [None] * world_size
+        dist.all_gather_object(rank_states, step_times.to_dict())
+        merged = stats.merge_states(rank_states)
+        avg = merged.mean
+
         global_batch = batch_size * world_size
         samples_per_sec = (global_batch / (avg / 1000.0)) if avg > 0 else 0.0
 
-        return {
+        result = {
             "batch_size": batch_size,
             "input_size": input_size,
             "output_size": output_size,
             "dtype": dtype_name,
             "world_size": world_size,
             "step_time_ms_avg": avg,
-            "step_time_ms_p50": p50,
-            "step_time_ms_p95": p95,
+            "step_time_ms_p50": merged.percentile(50),
+            "step_time_ms_p95": merged.percentile(95),
+            "step_time_ms_p99": merged.percentile(99),
+            "step_time_ms_max": merged.max,
+            "step_time_stats": merged.to_dict(),
             "samples_per_sec": samples_per_sec,
+            "memory": memory.report(torch, device),
         }
+
+        def _synced_step():
+            step()
+            torch.cuda.synchronize()
+
+        if duration_s > 0:
+            result["soak"] = soak.run_soak(
+                _synced_step,
+                duration_s,
+                window_s=window_s,
+                units_per_step=global_batch,
+                units="samples",
+                agree=distributed.agree_max(torch, device),
+            )
+        if profile_iters > 0:
+            result["profile"] = profiling.profile_ops(
+                _synced_step, iters=profile_iters, trace_path=trace_path
+            )
+        if tracer is not None:
+            result["comm_trace"] = tracer.save()
+        return result
     finally:
         if dist.is_initialized():
             dist.destroy_process_group()
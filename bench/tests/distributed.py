@@ -49,7 +49,7 @@ def master_addr_from_slurm():
     return first_host_from_nodelist(nodelist)
 
 
-def init_process_group(torch_mod):
+def init_process_group(torch_mod, backend_name=None):
     if torch_mod.distributed.is_initialized():
         return True, ""
 
@@ -68,7 +68,7 @@ def init_process_group(torch_mod):
 
     try:
         torch_mod.distributed.init_process_group(
-            backend=backend(),
+            backend=backend_name or backend(),
             rank=rank,
             world_size=world_size,
         )
@@ -83,3 +83,12 @@ def local_cuda_index(torch_mod):
         return 0
     local_rank = env_int("LOCAL_RANK", env_int("SLURM_LOCALID", 0))
     return local_rank % device_count
+
+
+def agree_max(torch_mod, device):
+    def _agree(code):
+        flag = torch_mod.tensor([code], device=device, dtype=torch_mod.int32)
+        torch_mod.distributed.all_reduce(flag, op=torch_mod.distributed.ReduceOp.MAX)
+        return int(flag.item())
+
+    return _agree
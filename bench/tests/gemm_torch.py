@@ -1,7 +1,7 @@
 import os
 import time
 
-from common import stats
+from common import memory, profiling, soak, stats
 
 
 def _select_dtype(torch_mod, requested):
@@ -12,7 +12,16 @@ def _select_dtype(torch_mod, requested):
     return torch_mod.float16
 
 
-def run_gemm(size, dtype_name=None, warmup=2, iters=5):
+def run_gemm(
+    size,
+    dtype_name=None,
+    warmup=2,
+    iters=5,
+    duration_s=0,
+    window_s=soak.DEFAULT_WINDOW_S,
+    profile_iters=0,
+    trace_path="",
+):
     try:
         import torch
     except ImportError:
@@ -26,6 +35,7 @@ def run_gemm(size, dtype_name=None, warmup=2, iters=5):
         return {"error": f"unsupported dtype: {dtype_name}"}
 
     device = torch.device("cuda")
+    memory.reset(torch, device)
     a = torch.randn(size, size, device=device, dtype=dtype)
     b = torch.randn(size, size, device=device, dtype=dtype)
 
@@ -44,10 +54,24 @@ def run_gemm(size, dtype_name=None, warmup=2, iters=5):
     else:
         tflops = None
 
-    return {
+    result = {
         "dtype": str(dtype).replace("torch.", ""),
         "tflops": tflops,
         "latency_p50_ms": p50 * 1000 if p50 else None,
         "latency_p95_ms": p95 * 1000 if p95 else None,
         "size": size,
+        "memory": memory.report(torch, device),
     }
+    if duration_s > 0:
+        result["soak"] = soak.run_soak(
+            _op,
+            duration_s,
+            window_s=window_s,
+            units_per_step=2 * (size**3) / 1.0e12,
+            units="TFLOP",
+        )
+    if profile_iters > 0:
+        result["profile"] = profiling.profile_ops(
+            _op, iters=profile_iters, trace_path=trace_path
+        )
+    return result
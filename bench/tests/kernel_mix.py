@@ -1,10 +1,41 @@
-from common import stats
+from common import memory, profiling, soak, stats
 
 
-def run_kernel_mix(size, warmup=2, iters=5, softmax_fp32=True):
+def mix_block(x, w, residual, softmax_fp32=True, matmul=None):
+    import torch
+    import torch.nn.functional as F
+
+    hidden = w.shape[-1]
+    y = (matmul or torch.matmul)(x, w)
+    y = F.layer_norm(y, (hidden,))
+    if softmax_fp32:
+        y = y.float()
+        y = F.softmax(y, dim=-1)
+        y = F.gelu(y)
+        return y + residual.float()
+    y = F.softmax(y, dim=-1)
+    y = F.gelu(y)
+    return y + residual
+
+
+def mix_forward(x, w, residual, softmax_fp32=True):
+    import torch
+
+    return torch.mean(mix_block(x, w, residual, softmax_fp32)).to(x.dtype)
+
+
+def run_kernel_mix(
+    size,
+    warmup=2,
+    iters=5,
+    softmax_fp32=True,
+    duration_s=0,
+    window_s=soak.DEFAULT_WINDOW_S,
+    profile_iters=0,
+    trace_path="",
+):
     try:
         import torch
-        import torch.nn.functional as F
     except ImportError:
         return {"error": "torch not available"}
 
@@ -12,6 +43,7 @@ def run_kernel_mix(size, warmup=2, iters=5, softmax_fp32=True):
         return {"error": "cuda/rocm not available"}
 
     device = torch.device("cuda")
+    memory.reset(torch, device)
     hidden = max(size, 256)
     batch = max(hidden // 16, 16)
 
@@ -25,20 +57,7 @@ def run_kernel_mix(size, warmup=2, iters=5, softmax_fp32=True):
     w = torch.randn(hidden, hidden, device=device, dtype=dtype)
 
     def _op():
-        y = torch.matmul(x, w)
-        y = F.layer_norm(y, (hidden,))
-        if softmax_fp32:
-            y = y.float()
-            y = F.softmax(y, dim=-1)
-            y = F.gelu(y)
-            y = y + residual.float()
-            y = torch.mean(y)
-            y = y.to(dtype)
-        else:
-            y = F.softmax(y, dim=-1)
-            y = F.gelu(y)
-            y = y + residual
-            y = torch.mean(y)
+        y = mix_forward(x, w, residual, softmax_fp32=softmax_fp32)
         torch.cuda.synchronize()
         return y
 
@@ -46,10 +65,20 @@ def run_kernel_mix(size, warmup=2, iters=5, softmax_fp32=True):
     p50 = timings["p50_s"]
     p95 = timings["p95_s"]
 
-    return {
+    result = {
         "latency_p50_ms": p50 * 1000 if p50 else None,
         "latency_p95_ms": p95 * 1000 if p95 else None,
         "size": size,
         "batch": batch,
         "hidden": hidden,
+        "memory": memory.report(torch, device),
     }
+    if duration_s > 0:
+        result["soak"] = soak.run_soak(
+            _op, duration_s, window_s=window_s, units="iters"
+        )
+    if profile_iters > 0:
+        result["profile"] = profiling.profile_ops(
+            _op, iters=profile_iters, trace_path=trace_path
+        )
+    return result
@@ -0,0 +1,97 @@
+from common import stats
+
+
+def _chain(x, length):
+    for _ in range(length):
+        x.add_(1.0)
+    return x
+
+
+def _us_per_op(timings, length):
+    p50 = timings["p50_s"]
+    p95 = timings["p95_s"]
+    return (
+        p50 / length * 1.0e6 if p50 else None,
+        p95 / length * 1.0e6 if p95 else None,
+    )
+
+
+def _capture_graph(torch_mod, x, length):
+    # Warm the chain on a side stream before capture, as torch.cuda.graph requires.
+    side = torch_mod.cuda.Stream()
+    side.wait_stream(torch_mod.cuda.current_stream())
+    with torch_mod.cuda.stream(side):
+        _chain(x, length)
+    torch_mod.cuda.current_stream().wait_stream(side)
+    torch_mod.cuda.synchronize()
+
+    graph = torch_mod.cuda.CUDAGraph()
+    with torch_mod.cuda.graph(graph):
+        _chain(x, length)
+    return graph
+
+
+def run_launch_overhead(chain_length=100, numel=1, warmup=2, iters=5):
+    try:
+        import torch
+    except ImportError:
+        return {"error": "torch not available"}
+
+    length = max(chain_length, 1)
+    has_device = torch.cuda.is_available()
+    device = torch.device("cuda" if has_device else "cpu")
+
+    def _sync():
+        if has_device:
+            torch.cuda.synchronize()
+
+    x = torch.zeros(max(numel, 1), device=device, dtype=torch.float32)
+
+    def _eager():
+        _chain(x, length)
+        _sync()
+
+    eager = stats.timeit(_eager, warmup=warmup, iters=iters)
+    eager_p50, eager_p95 = _us_per_op(eager, length)
+
+    cpu_x = torch.zeros(max(numel, 1), dtype=torch.float32)
+    cpu = stats.timeit(lambda: _chain(cpu_x, length), warmup=warmup, iters=iters)
+    cpu_p50, cpu_p95 = _us_per_op(cpu, length)
+
+    result = {
+        "device": device.type,
+        "chain_length": length,
+        "numel": max(numel, 1),
+        "eager_us_per_op": eager_p50,
+        "eager_us_per_op_p95": eager_p95,
+        "graph_us_per_op": None,
+        "graph_us_per_op_p95": None,
+        "cpu_us_per_op": cpu_p50,
+        "cpu_us_per_op_p95": cpu_p95,
+    }
+
+    if not has_device:
+        result["graph_error"] = "cuda/rocm not available"
+        return result
+    if not hasattr(torch.cuda, "CUDAGraph"):
+        result["graph_error"] = "graph capture not supported by this torch"
+        return result
+
+    graph_x = torch.zeros(max(numel, 1), device=device, dtype=torch.float32)
+    try:
+        graph = _capture_graph(torch, graph_x, length)
+    except Exception as exc:
+        result["graph_error"] = f"graph capture failed: {exc}"
+        return result
+
+    def _replay():
+        graph.replay()
+        torch.cuda.synchronize()
+
+    replay = stats.timeit(_replay, warmup=warmup, iters=iters)
+    graph_p50, graph_p95 = _us_per_op(replay, length)
+    result["graph_us_per_op"] = graph_p50
+    result["graph_us_per_op_p95"] = graph_p95
+    if graph_p50:
+        result["graph_speedup"] = eager_p50 / graph_p50 if eager_p50 else None
+    return result
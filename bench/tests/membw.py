@@ -0,0 +1,184 @@
+from common import stats
+
+
+DEFAULT_SIZES_MB = [1, 16, 256, 1024, 4096]
+DEFAULT_CPU_SIZES_MB = [1, 16, 256]
+KERNELS = ("copy", "scale", "add", "triad")
+
+# Bytes moved per element, counting each read and write once (STREAM rules).
+KERNEL_TRAFFIC = {
+    "copy": 2,
+    "scale": 2,
+    "add": 3,
+    "triad": 3,
+}
+
+
+def _kernels(torch_mod, a, b, c, scalar):
+    return {
+        "copy": lambda: c.copy_(a),
+        "scale": lambda: torch_mod.mul(c, scalar, out=b),
+        "add": lambda: torch_mod.add(a, b, out=c),
+        "triad": lambda: torch_mod.add(b, c, alpha=scalar, out=a),
+    }
+
+
+def _gbps(nbytes, seconds):
+    if not seconds:
+        return None
+    return nbytes / seconds / 1.0e9
+
+
+def _sweep_kernels(torch_mod, device, sizes_mb, dtype, warmup, iters, sync):
+    element_size = torch_mod.tensor([], dtype=dtype).element_size()
+    sweep = {name: [] for name in KERNELS}
+    for size_mb in sizes_mb:
+        numel = max(int(size_mb * 1024 * 1024) // element_size, 1)
+        try:
+            a = torch_mod.ones(numel, device=device, dtype=dtype)
+            b = torch_mod.full((numel,), 2.0, device=device, dtype=dtype)
+            c = torch_mod.zeros(numel, device=device, dtype=dtype)
+        except RuntimeError as exc:
+            for name in KERNELS:
+                sweep[name].append(
+                    {"size_mb": size_mb, "gbps": None, "error": str(exc)}
+                )
+            continue
+
+        for name, fn in _kernels(torch_mod, a, b, c, 3.0).items():
+
+            def _op():
+                fn()
+                sync()
+
+            timings = stats.timeit(_op, warmup=warmup, iters=iters)
+            nbytes = KERNEL_TRAFFIC[name] * numel * element_size
+            sweep[name].append(
+                {
+                    "size_mb": size_mb,
+                    "gbps": _gbps(nbytes, timings["p50_s"]),
+                    "latency_p50_ms": timings["p50_s"] * 1000,
+                }
+            )
+        del a, b, c
+        if device.type == "cuda":
+            torch_mod.cuda.empty_cache()
+    return sweep
+
+
+def _transfer_times(torch_mod, device, nbytes, pinned, warmup, iters):
+    host = torch_mod.empty(nbytes, dtype=torch_mod.uint8, pin_memory=pinned)
+    dev = torch_mod.empty(nbytes, dtype=torch_mod.uint8, device=device)
+
+    def _h2d():
+        dev.copy_(host, non_blocking=pinned)
+        torch_mod.cuda.synchronize()
+
+    def _d2h():
+        host.copy_(dev, non_blocking=pinned)
+        torch_mod.cuda.synchronize()
+
+    up = stats.timeit(_h2d, warmup=warmup, iters=iters)
+    down = stats.timeit(_d2h, warmup=warmup, iters=iters)
+    return up, down
+
+
+def _host_transfers(torch_mod, device, sizes_mb, warmup, iters):
+    transfers = {}
+    for pinned in (True, False):
+        label = "pinned" if pinned else "pageable"
+        h2d = []
+        d2h = []
+        for size_mb in sizes_mb:
+            nbytes = max(int(size_mb * 1024 * 1024), 1)
+            try:
+                up, down = _transfer_times(
+                    torch_mod, device, nbytes, pinned, warmup, iters
+                )
+            except RuntimeError as exc:
+                # Pinned memory is page-locked host RAM; several GiB of it can
+                # fail where a pageable buffer of the same size does not.
+                h2d.append({"size_mb": size_mb, "gbps": None, "error": str(exc)})
+                d2h.append({"size_mb": size_mb, "gbps": None, "error": str(exc)})
+                continue
+            h2d.append({"size_mb": size_mb, "gbps": _gbps(nbytes, up["p50_s"])})
+            d2h.append({"size_mb": size_mb, "gbps": _gbps(nbytes, down["p50_s"])})
+        transfers[label] = {"h2d": h2d, "d2h": d2h}
+    return transfers
+
+
+def _peer_copy(torch_mod, sizes_mb, warmup, iters):
+    src_device = torch_mod.device("cuda", 0)
+    dst_device = torch_mod.device("cuda", 1)
+    entries = []
+    for size_mb in sizes_mb:
+        nbytes = max(int(size_mb * 1024 * 1024), 1)
+        src = torch_mod.empty(nbytes, dtype=torch_mod.uint8, device=src_device)
+        dst = torch_mod.empty(nbytes, dtype=torch_mod.uint8, device=dst_device)
+
+        def _op():
+            dst.copy_(src)
+            torch_mod.cuda.synchronize(src_device)
+            torch_mod.cuda.synchronize(dst_device)
+
+        timings = stats.timeit(_op, warmup=warmup, iters=iters)
+        entries.append({"size_mb": size_mb, "gbps": _gbps(nbytes, timings["p50_s"])})
+        del src, dst
+    return entries
+
+
+def _peak(entries):
+    values = [entry["gbps"] for entry in entries if entry.get("gbps")]
+    return max(values) if values else None
+
+
+def run_membw(
+    sizes_mb=None,
+    dtype_name="float32",
+    warmup=2,
+    iters=5,
+    device_name="",
+):
+    try:
+        import torch
+    except ImportError:
+        return {"error": "torch not available"}
+
+    dtype = getattr(torch, dtype_name or "float32", None)
+    if dtype is None:
+        return {"error": f"unsupported dtype: {dtype_name}"}
+
+    if device_name:
+        device = torch.device(device_name)
+    else:
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    if device.type == "cuda" and not torch.cuda.is_available():
+        return {"error": "cuda/rocm not available"}
+    if not sizes_mb:
+        sizes_mb = DEFAULT_SIZES_MB if device.type == "cuda" else DEFAULT_CPU_SIZES_MB
+
+    def _sync():
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+
+    sweep = _sweep_kernels(torch, device, sizes_mb, dtype, warmup, iters, _sync)
+    result = {
+        "device": device.type,
+        "dtype": str(dtype).replace("torch.", ""),
+        "sizes_mb": list(sizes_mb),
+        "kernels": sweep,
+        "peak_gbps": {name: _peak(entries) for name, entries in sweep.items()},
+    }
+    if device.type == "cuda":
+        transfers = _host_transfers(torch, device, sizes_mb, warmup, iters)
+        result["host_transfers"] = transfers
+        result["peak_host_gbps"] = {
+            f"{label}_{direction}": _peak(transfers[label][direction])
+            for label in transfers
+            for direction in ("h2d", "d2h")
+        }
+        if torch.cuda.device_count() > 1:
+            peer = _peer_copy(torch, sizes_mb, warmup, iters)
+            result["d2d_copy"] = peer
+            result["peak_gbps"]["d2d_copy"] = _peak(peer)
+    return result
@@ -0,0 +1,318 @@
+import contextlib
+import time
+
+from common import stats
+from tests import distributed, kernel_mix
+
+
+CONFIGS = ("fp32", "tf32", "fp16", "bf16", "autocast_fp16", "autocast_bf16", "fp8")
+DDP_CONFIGS = CONFIGS[:-1]
+# Bound on max |out - ref| / max |ref| against the fp64 reference.
+TOLERANCES = {
+    "fp32": 1e-4,
+    "tf32": 1e-2,
+    "fp16": 1e-2,
+    "bf16": 5e-2,
+    "autocast_fp16": 1e-2,
+    "autocast_bf16": 5e-2,
+    "fp8": 2e-1,
+}
+DDP_LR = 1.0e-2
+
+
+def _dtypes(torch, name):
+    # (tensor dtype, autocast dtype, allow tf32)
+    return {
+        "fp32": (torch.float32, None, False),
+        "tf32": (torch.float32, None, True),
+        "fp16": (torch.float16, None, False),
+        "bf16": (torch.bfloat16, None, False),
+        "autocast_fp16": (torch.float32, torch.float16, False),
+        "autocast_bf16": (torch.float32, torch.bfloat16, False),
+        "fp8": (torch.bfloat16, None, False),
+    }[name]
+
+
+def _unsupported(torch, name):
+    # allow_tf32 only reaches cuBLAS/cuDNN. ROCm builds ignore it and MI250X
+    # has no TF32 mode, so there "tf32" would just be fp32 run twice.
+    if name == "tf32" and torch.version.hip:
+        return "tf32 is not a separate mode on ROCm; it runs as fp32"
+    return None
+
+
+@contextlib.contextmanager
+def _precision(torch, device, autocast_dtype, allow_tf32):
+    saved = torch.backends.cuda.matmul.allow_tf32
+    torch.backends.cuda.matmul.allow_tf32 = allow_tf32
+    try:
+        if autocast_dtype is not None:
+            with torch.autocast(device_type=device.type, dtype=autocast_dtype):
+                yield
+        else:
+            yield
+    finally:
+        torch.backends.cuda.matmul.allow_tf32 = saved
+
+
+def _fp8_matmul(torch):
+    fp8 = getattr(
+        torch, "float8_e4m3fnuz" if torch.version.hip else "float8_e4m3fn", None
+    )
+    if fp8 is None or not hasattr(torch, "_scaled_mm"):
+        raise RuntimeError("fp8 matmul not available in this torch build")
+    fp8_max = torch.finfo(fp8).max
+
+    def matmul(a, b):
+        scale_a = a.abs().max().float().clamp(min=1e-12) / fp8_max
+        scale_b = b.abs().max().float().clamp(min=1e-12) / fp8_max
+        a8 = (a.float() / scale_a).to(fp8)
+        # _scaled_mm wants the second operand column-major.
+        b8 = (b.float() / scale_b).to(fp8).t().contiguous().t()
+        out = torch._scaled_mm(
+            a8, b8, scale_a=scale_a, scale_b=scale_b, out_dtype=a.dtype
+        )
+        return out[0] if isinstance(out, tuple) else out
+
+    return matmul
+
+
+def _errors(torch, out, ref):
+    out = out.detach().double()
+    if not bool(torch.isfinite(out).all()):
+        return {"nonfinite": True, "max_rel_err": None, "mean_rel_err": None}
+    diff = (out - ref).abs()
+    scale = ref.abs()
+    max_ref = float(scale.max())
+    mean_ref = float(scale.mean())
+    return {
+        "max_rel_err": float(diff.max()) / max_ref if max_ref else None,
+        "mean_rel_err": float(diff.mean()) / mean_ref if mean_ref else None,
+        "checksum": float(out.sum()),
+        "reference_checksum": float(ref.sum()),
+    }
+
+
+def _judge(record, name):
+    record["tolerance"] = TOLERANCES[name]
+    error = record.get("max_rel_err")
+    record["within_tolerance"] = error is not None and error <= TOLERANCES[name]
+    return record
+
+
+def _speedups(configs, key, higher_is_better=False):
+    base = configs.get("fp32", {}).get(key)
+    for record in configs.values():
+        value = record.get(key)
+        if not base or not value:
+            continue
+        record["speedup_vs_fp32"] = value / base if higher_is_better else base / value
+
+
+def run_kernel_mix_matrix(size, warmup=2, iters=5, softmax_fp32=True, configs=None):
+    try:
+        import torch
+    except ImportError:
+        return {"error": "torch not available"}
+
+    if not torch.cuda.is_available():
+        return {"error": "cuda/rocm not available"}
+
+    device = torch.device("cuda")
+    hidden = max(size, 256)
+    batch = max(hidden // 16, 16)
+    generator = torch.Generator().manual_seed(0)
+    x = torch.randn(batch, hidden, generator=generator, dtype=torch.float64)
+    w = torch.randn(hidden, hidden, generator=generator, dtype=torch.float64)
+    w /= hidden**0.5
+    residual = torch.randn(batch, hidden, generator=generator, dtype=torch.float64)
+    x, w, residual = (t.to(device) for t in (x, w, residual))
+
+    results = {}
+    for name in configs or CONFIGS:
+        reason = _unsupported(torch, name)
+        if reason:
+            results[name] = {"error": reason}
+            continue
+        dtype, autocast_dtype, allow_tf32 = _dtypes(torch, name)
+        try:
+            matmul = _fp8_matmul(torch) if name == "fp8" else None
+            xc, wc, rc = (t.to(dtype) for t in (x, w, residual))
+
+            def _op(res):
+                with _precision(torch, device, autocast_dtype, allow_tf32):
+                    y = kernel_mix.mix_block(xc, wc, res, softmax_fp32, matmul=matmul)
+                torch.cuda.synchronize()
+                return y
+
+            # Error is taken before the residual add, which would dominate the
+            # output, against fp64 on the same rounded inputs: it measures the
+            # kernels, not the cast. softmax_fp32 would round the reference
+            # through fp32, so it stays off there.
+            out = _op(torch.zeros_like(rc))
+            ref = kernel_mix.mix_block(
+                xc.double(), wc.double(), torch.zeros_like(x), softmax_fp32=False
+            )
+            timings = stats.timeit(lambda: _op(rc), warmup=warmup, iters=iters)
+        except (RuntimeError, TypeError) as exc:
+            results[name] = {"error": f"{type(exc).__name__}: {exc}"}
+            continue
+        record = {
+            "dtype": str(dtype).replace("torch.", ""),
+            "latency_p50_ms": timings["p50_s"] * 1000 if timings["p50_s"] else None,
+            "latency_p95_ms": timings["p95_s"] * 1000 if timings["p95_s"] else None,
+        }
+        record.update(_errors(torch, out, ref))
+        results[name] = _judge(record, name)
+    _speedups(results, "latency_p50_ms")
+    return {
+        "size": size,
+        "batch": batch,
+        "hidden": hidden,
+        "softmax_fp32": softmax_fp32,
+        "reference_dtype": "float64",
+        "configs": results,
+    }
+
+
+def run_ddp_matrix(
+    batch_size=64,
+    input_size=4096,
+    output_size=4096,
+    warmup=3,
+    iters=10,
+    configs=None,
+):
+    try:
+        import torch
+        import torch.distributed as dist
+        import torch.nn.functional as F
+        from torch.nn.parallel import DistributedDataParallel as DDP
+    except ImportError:
+        return {"error": "torch not available"}
+
+    if not torch.cuda.is_available():
+        return {"error": "cuda/rocm not available"}
+
+    ok, err = distributed.init_process_group(torch)
+    if not ok:
+        return {"error": f"distributed init failed: {err}"}
+
+    device_index = distributed.local_cuda_index(torch)
+    device = torch.device("cuda", device_index)
+    torch.cuda.set_device(device)
+    steps = max(warmup, 0) + max(iters, 1)
+
+    # Every rank draws the same data, so the averaged DDP gradient equals the
+    # local one and a single fp64 model without DDP is the exact reference.
+    generator = torch.Generator().manual_seed(0)
+    w0 = torch.randn(output_size, input_size, generator=generator, dtype=torch.float64)
+    w0 /= input_size**0.5
+    x = torch.randn(batch_size, input_size, generator=generator, dtype=torch.float64)
+    target = torch.randn(
+        batch_size, output_size, generator=generator, dtype=torch.float64
+    )
+    w0, x, target = (t.to(device) for t in (w0, x, target))
+
+    ref_w = w0.clone().requires_grad_(True)
+    for _ in range(steps):
+        ref_loss = F.mse_loss(x @ ref_w.t(), target)
+        (grad,) = torch.autograd.grad(ref_loss, ref_w)
+        with torch.no_grad():
+            ref_w -= DDP_LR * grad
+    ref_update = (ref_w.detach() - w0).flatten()
+
+    results = {}
+    agree = distributed.agree_max(torch, device)
+    try:
+        world_size = dist.get_world_size()
+        for name in configs or DDP_CONFIGS:
+            reason = _unsupported(torch, name)
+            if reason:
+                results[name] = {"error": reason}
+                continue
+            dtype, autocast_dtype, allow_tf32 = _dtypes(torch, name)
+            model = torch.nn.Linear(input_size, output_size, bias=False)
+            model = model.to(device=device, dtype=dtype)
+            with torch.no_grad():
+                model.weight.copy_(w0)
+            xc, tc = x.to(dtype), target.to(dtype)
+
+            def forward(module):
+                with _precision(torch, device, autocast_dtype, allow_tf32):
+                    return F.mse_loss(module(xc).float(), tc.float())
+
+            # A dtype or kernel the build lacks fails in this local probe, so
+            # every rank skips the config before any rank enters DDP's
+            # all_reduce and waits there for the others.
+            error = ""
+            try:
+                forward(model).backward()
+                torch.cuda.synchronize()
+            except RuntimeError as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            model.zero_grad(set_to_none=True)
+            if agree(1 if error else 0):
+                results[name] = {"error": error or "failed on another rank"}
+                del model
+                continue
+            model = DDP(model, device_ids=[device_index])
+            # Plain SGD keeps the update a linear function of the gradients,
+            # so the weight error measures the math rather than the optimizer.
+            optimizer = torch.optim.SGD(model.parameters(), lr=DDP_LR)
+
+            def step():
+                loss = forward(model)
+                loss.backward()
+                optimizer.step()
+                optimizer.zero_grad(set_to_none=True)
+                return loss
+
+            try:
+                for _ in range(max(warmup, 0)):
+                    step()
+                torch.cuda.synchronize()
+                start = time.perf_counter()
+                for _ in range(max(iters, 1)):
+                    loss = step()
+                torch.cuda.synchronize()
+            except RuntimeError as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            # Catches a failure after the last collective, e.g. in the final
+            # synchronize, before the timing all_reduce below.
+            if agree(1 if error else 0):
+                results[name] = {"error": error or "failed on another rank"}
+                del model, optimizer
+                continue
+            elapsed = torch.tensor([time.perf_counter() - start], device=device)
+            dist.all_reduce(elapsed, op=dist.ReduceOp.MAX)
+            step_ms = float(elapsed.item()) / max(iters, 1) * 1000.0
+
+            update = (model.module.weight.detach().double() - w0).flatten()
+            record = {
+                "dtype": str(dtype).replace("torch.", ""),
+                "step_time_ms_avg": step_ms,
+                "samples_per_sec": (
+                    batch_size * world_size / (step_ms / 1000.0)
+                    if step_ms > 0
+                    else None
+                ),
+                "loss": float(loss.item()),
+                "reference_loss": float(ref_loss.item()),
+            }
+            record.update(_errors(torch, update, ref_update))
+            results[name] = _judge(record, name)
+            del model, optimizer
+    finally:
+        if dist.is_initialized():
+            dist.destroy_process_group()
+    _speedups(results, "samples_per_sec", higher_is_better=True)
+    return {
+        "batch_size": batch_size,
+        "input_size": input_size,
+        "output_size": output_size,
+        "world_size": world_size,
+        "steps": steps,
+        "reference_dtype": "float64",
+        "configs": results,
+    }
@@ -0,0 +1,207 @@
+import asyncio
+import random
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from common import stats
+
+
+DEFAULT_START_RPS = 50.0
+DEFAULT_GROWTH = 2.0
+DEFAULT_MAX_POINTS = 10
+SATURATION_RATIO = 0.9
+INPUT_POOL = 1024
+
+
+def _build_model(torch_mod, hidden, layers, device, dtype):
+    blocks = []
+    for _ in range(layers):
+        blocks += [
+            torch_mod.nn.Linear(hidden, 4 * hidden),
+            torch_mod.nn.GELU(),
+            torch_mod.nn.Linear(4 * hidden, hidden),
+        ]
+    model = torch_mod.nn.Sequential(*blocks).to(device=device, dtype=dtype)
+    model.eval()
+    return model
+
+
+async def _generate(queue, rate, duration_s, rng):
+    # Open loop: arrivals follow their own Poisson schedule no matter how far
+    # behind the server is, and each request carries its scheduled time so
+    # queueing delay counts towards latency.
+    start = time.perf_counter()
+    offset = 0.0
+    count = 0
+    while True:
+        offset += rng.expovariate(rate)
+        if offset > duration_s:
+            break
+        delay = start + offset - time.perf_counter()
+        await asyncio.sleep(max(delay, 0))
+        queue.put_nowait((start + offset, count % INPUT_POOL))
+        count += 1
+    queue.put_nowait(None)
+    return count
+
+
+async def _batcher(queue, run_batch, max_batch, max_delay_s, latencies, batches):
+    # Dynamic micro-batching: a batch closes when it is full or when its
+    # oldest request has waited max_delay_s.
+    loop = asyncio.get_running_loop()
+    done = False
+    last_done = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while not done:
+            item = await queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + max_delay_s
+            while len(batch) < max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            await loop.run_in_executor(
+                executor, run_batch, [index for _, index in batch]
+            )
+            last_done = time.perf_counter()
+            for scheduled, _ in batch:
+                latencies.add((last_done - scheduled) * 1000.0)
+            batches.add(len(batch))
+    return last_done
+
+
+async def _run_point(run_batch, rate, duration_s, max_batch, max_delay_s, seed):
+    queue = asyncio.Queue()
+    latencies = stats.StreamingStats()
+    batches = stats.StreamingStats()
+    start = time.perf_counter()
+    requests, last_done = await asyncio.gather(
+        _generate(queue, rate, duration_s, random.Random(seed)),
+        _batcher(queue, run_batch, max_batch, max_delay_s, latencies, batches),
+    )
+    elapsed = (last_done or start) - start
+    arrival_rps = requests / duration_s
+    achieved_rps = latencies.count / elapsed if elapsed > 0 else 0.0
+    return {
+        "offered_rps": rate,
+        "arrival_rps": arrival_rps,
+        "achieved_rps": achieved_rps,
+        "requests": requests,
+        "latency_p50_ms": latencies.percentile(50),
+        "latency_p95_ms": latencies.percentile(95),
+        "latency_p99_ms": latencies.percentile(99),
+        "latency_max_ms": latencies.max if latencies.count else None,
+        "mean_batch": batches.mean if batches.count else None,
+        "saturated": achieved_rps < SATURATION_RATIO * arrival_rps,
+    }
+
+
+def _rate_at_slo(curve, slo_p99_ms):
+    # Throughput where p99 crosses the SLO, interpolated between the last
+    # passing point and the first failing one; the grid alone only moves in
+    # growth-factor steps.
+    points = sorted(curve, key=lambda point: point["offered_rps"])
+    passing = None
+    for point in points:
+        if point["within_slo"]:
+            passing = point
+            continue
+        if passing is None:
+            return 0.0
+        low_p99, high_p99 = passing["latency_p99_ms"], point["latency_p99_ms"]
+        if high_p99 is None or high_p99 <= low_p99:
+            return passing["achieved_rps"]
+        fraction = (slo_p99_ms - low_p99) / (high_p99 - low_p99)
+        return passing["achieved_rps"] + fraction * (
+            point["achieved_rps"] - passing["achieved_rps"]
+        )
+    return max((point["achieved_rps"] for point in points), default=0.0)
+
+
+def run_serve(
+    hidden=1024,
+    layers=4,
+    max_batch=32,
+    max_delay_ms=2.0,
+    rates=None,
+    start_rps=DEFAULT_START_RPS,
+    growth=DEFAULT_GROWTH,
+    max_points=DEFAULT_MAX_POINTS,
+    duration_s=5.0,
+    slo_p99_ms=50.0,
+    seed=0,
+):
+    try:
+        import torch
+    except ImportError:
+        return {"error": "torch not available"}
+
+    if torch.cuda.is_available():
+        device = torch.device("cuda")
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    else:
+        device = torch.device("cpu")
+        dtype = torch.float32
+
+    model = _build_model(torch, hidden, layers, device, dtype)
+    inputs = torch.randn(INPUT_POOL, hidden, dtype=dtype)
+    if device.type == "cuda":
+        inputs = inputs.pin_memory()
+
+    def run_batch(indices):
+        # Runs on the executor thread; inference_mode is thread-local.
+        with torch.inference_mode():
+            x = inputs[torch.tensor(indices)].to(device, non_blocking=True)
+            return model(x).cpu()
+
+    for _ in range(3):
+        run_batch(list(range(max_batch)))
+
+    max_delay_s = max_delay_ms / 1000.0
+    planned = list(rates) if rates else None
+    curve = []
+    rate = planned[0] if planned else start_rps
+    while True:
+        point = asyncio.run(
+            _run_point(run_batch, rate, duration_s, max_batch, max_delay_s, seed)
+        )
+        point["within_slo"] = (
+            point["latency_p99_ms"] is not None
+            and point["latency_p99_ms"] <= slo_p99_ms
+        )
+        curve.append(point)
+        if planned:
+            if len(curve) >= len(planned):
+                break
+            rate = planned[len(curve)]
+        else:
+            if point["saturated"] or len(curve) >= max_points:
+                break
+            rate *= growth
+
+    return {
+        "device": device.type,
+        "dtype": str(dtype).replace("torch.", ""),
+        "hidden": hidden,
+        "layers": layers,
+        "max_batch": max_batch,
+        "max_delay_ms": max_delay_ms,
+        "duration_s": duration_s,
+        "slo_p99_ms": slo_p99_ms,
+        "curve": curve,
+        "max_rps_at_slo": _rate_at_slo(curve, slo_p99_ms),
+        "saturation_rps": max(point["achieved_rps"] for point in curve),
+        "unloaded_p50_ms": curve[0]["latency_p50_ms"],
+        "unloaded_p99_ms": curve[0]["latency_p99_ms"],
+    }
@@ -0,0 +1,179 @@
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from common import stats
+
+
+COMMANDS = {
+    "noop": ["true"],
+    "import_torch": ["python3", "-c", "import torch"],
+}
+DEFAULT_BIND_COUNTS = (0, 4, 16, 64)
+BIND_TARGET_ROOT = "/mnt/bench_bind"
+STDERR_TAIL = 400
+
+
+def _evict(image):
+    # Drop the image's pages from the host page cache without root. This only
+    # works for a regular file (not a sandbox directory) on Linux, and pages
+    # still mapped by a running container stay resident.
+    if not os.path.isfile(image) or not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(image, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def _bind_args(sources):
+    args = []
+    for index, source in enumerate(sources):
+        args += ["--bind", f"{source}:{BIND_TARGET_ROOT}_{index}"]
+    return args
+
+
+def _launch(argv):
+    start = time.perf_counter()
+    result = subprocess.run(
+        argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    if result.returncode != 0:
+        tail = result.stderr.strip()[-STDERR_TAIL:]
+        raise RuntimeError(f"exit {result.returncode}: {' '.join(argv)}: {tail}")
+    return elapsed_ms
+
+
+def _series(argv, repeats, image=None):
+    timings = stats.StreamingStats()
+    for _ in range(repeats):
+        if image is not None:
+            _evict(image)
+        timings.add(_launch(argv))
+    return timings.summary()
+
+
+def _concurrent(argv, ranks, rounds, image=None):
+    # All ranks of a node start the container at once, as srun does at the
+    # start of every job step.
+    per_launch = stats.StreamingStats()
+    walls = stats.StreamingStats()
+    with ThreadPoolExecutor(max_workers=ranks) as executor:
+        for _ in range(rounds):
+            if image is not None:
+                _evict(image)
+            barrier = threading.Barrier(ranks)
+
+            def _rank_launch():
+                barrier.wait()
+                return _launch(argv)
+
+            start = time.perf_counter()
+            futures = [executor.submit(_rank_launch) for _ in range(ranks)]
+            for future in futures:
+                per_launch.add(future.result())
+            walls.add((time.perf_counter() - start) * 1000.0)
+    return {"per_launch_ms": per_launch.summary(), "wall_ms": walls.summary()}
+
+
+def run_startup(
+    image,
+    runtime="apptainer",
+    repeats=10,
+    cold_repeats=3,
+    bind_counts=DEFAULT_BIND_COUNTS,
+    bind_paths=None,
+    ranks=8,
+    rounds=3,
+    commands=None,
+):
+    runtime_argv = shlex.split(runtime)
+    if not runtime_argv or not shutil.which(runtime_argv[0]):
+        return {"error": f"runtime not found: {runtime}"}
+    if not image:
+        return {"error": "container image path required"}
+    commands = list(commands or COMMANDS)
+    unknown = [name for name in commands if name not in COMMANDS]
+    if unknown:
+        return {"error": "unknown commands: " + ", ".join(unknown)}
+
+    base = runtime_argv + ["exec"]
+    cold = _evict(image)
+    image_bytes = os.path.getsize(image) if os.path.isfile(image) else None
+    bind_root = tempfile.mkdtemp(prefix="bench_binds_")
+    try:
+        results = {}
+        for name in commands:
+            argv = base + [image] + COMMANDS[name]
+            record = {}
+            if cold:
+                record["cold_ms"] = _series(argv, cold_repeats, image=image)
+            # One unmeasured launch so warm starts from a populated cache.
+            _launch(argv)
+            record["warm_ms"] = _series(argv, repeats)
+            results[name] = record
+
+        # Mounts beyond the given paths are empty host directories; they cost
+        # the same mount work without depending on the site filesystem.
+        bind_paths = list(bind_paths or [])
+        sources = bind_paths + [
+            os.path.join(bind_root, str(index))
+            for index in range(max(max(bind_counts, default=0) - len(bind_paths), 0))
+        ]
+        for source in sources[len(bind_paths) :]:
+            os.makedirs(source)
+        binds = {}
+        for count in bind_counts:
+            argv = base + _bind_args(sources[:count]) + [image] + COMMANDS["noop"]
+            _launch(argv)
+            binds[str(count)] = _series(argv, repeats)
+
+        # The last command is the heaviest; it is what every rank runs first.
+        concurrent = {"ranks": ranks, "command": commands[-1]}
+        if ranks > 1:
+            argv = base + [image] + COMMANDS[commands[-1]]
+            if cold:
+                concurrent["cold"] = _concurrent(argv, ranks, 1, image=image)
+            concurrent["warm"] = _concurrent(argv, ranks, rounds)
+    except (OSError, RuntimeError) as exc:
+        return {"error": str(exc)}
+    finally:
+        shutil.rmtree(bind_root, ignore_errors=True)
+
+    bind_cost = None
+    if len(bind_counts) > 1:
+        low, high = min(bind_counts), max(bind_counts)
+        if high > low:
+            bind_cost = (binds[str(high)]["p50"] - binds[str(low)]["p50"]) / (
+                high - low
+            )
+    summary = {"bind_cost_ms_per_mount": bind_cost}
+    for name, record in results.items():
+        summary[f"{name}_warm_p50_ms"] = record["warm_ms"]["p50"]
+        if cold:
+            summary[f"{name}_cold_p50_ms"] = record["cold_ms"]["p50"]
+    if "warm" in concurrent:
+        summary["concurrent_warm_wall_p50_ms"] = concurrent["warm"]["wall_ms"]["p50"]
+        if cold:
+            summary["concurrent_cold_wall_ms"] = concurrent["cold"]["wall_ms"]["max"]
+    return {
+        "runtime": runtime,
+        "image": image,
+        "image_bytes": image_bytes,
+        "cold_method": "posix_fadvise_dontneed" if cold else "unavailable",
+        "repeats": repeats,
+        "cold_repeats": cold_repeats if cold else 0,
+        "commands": results,
+        "bind_counts": binds,
+        "concurrent": concurrent,
+        "summary": summary,
+    }
@@ -0,0 +1,42 @@
+#!/bin/bash
+set -euo pipefail
+
+# Local stand-in for `apptainer exec`: checks the bind sources and the image,
+# then runs the command on the host. Lets `bench/run startup` and the templates'
+# command line be exercised without a container runtime.
+# Usage:
+#   scripts/local_runtime.sh exec [--bind src:dst]... <image> <command> [args...]
+
+if [[ "${1:-}" != "exec" ]]; then
+  echo "local_runtime.sh: only 'exec' is supported" >&2
+  exit 1
+fi
+shift
+
+while [[ "$#" -gt 0 ]]; do
+  case "$1" in
+    --bind|-B)
+      source_path="${2%%:*}"
+      if [[ ! -e "${source_path}" ]]; then
+        echo "local_runtime.sh: bind source does not exist: ${source_path}" >&2
+        exit 1
+      fi
+      shift 2
+      ;;
+    --*)
+      shift
+      ;;
+    *)
+      break
+      ;;
+  esac
+done
+
+IMAGE="${1:?container image path required}"
+shift
+if [[ ! -e "${IMAGE}" ]]; then
+  echo "local_runtime.sh: image not found: ${IMAGE}" >&2
+  exit 1
+fi
+
+exec "$@"
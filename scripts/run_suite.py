@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SUITE = REPO_ROOT / "scripts" / "lumi_suite.json"
+LOCAL_TEMPLATE = REPO_ROOT / "templates" / "local.sh"
+LOCAL_NODES = 4
+LOCAL_BASE_PORT = 29600
+
+
+def _utc_now():
+    return (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
+
+
+def load_suite(path):
+    with open(path, "r", encoding="utf-8") as handle:
+        suite = json.load(handle)
+    names = set()
+    for step in suite["steps"]:
+        if step["name"] in names:
+            raise SystemExit(f"duplicate step name: {step['name']}")
+        names.add(step["name"])
+        if ("command" in step) == ("compare" in step):
+            raise SystemExit(
+                f"step {step['name']} needs exactly one of command, compare"
+            )
+    for step in suite["steps"]:
+        for dep in step.get("after", []):
+            if dep not in names:
+                raise SystemExit(f"step {step['name']} depends on unknown step {dep}")
+    return suite
+
+
+def allocation_hosts():
+    nodelist = os.environ.get("SLURM_JOB_NODELIST", "")
+    if not nodelist or not shutil.which("scontrol"):
+        return []
+    result = subprocess.run(
+        ["scontrol", "show", "hostnames", nodelist],
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def step_command(args, step):
+    template = str(LOCAL_TEMPLATE) if args.launcher == "local" else step["template"]
+    if "compare" in step:
+        return [
+            str(REPO_ROOT / "bench" / "compare.sh"),
+            "--old",
+            args.old,
+            "--new",
+            args.new,
+            "--mode",
+            step["compare"],
+            "--results-dir",
+            os.path.join(args.results_root, step["results_dir"]),
+            "--template",
+            template,
+        ] + (["--"] + step["args"] if step.get("args") else [])
+    container = args.old if step.get("container") == "old" else args.new
+    return (
+        [template, container, "--"]
+        + step["command"]
+        + step.get("args", [])
+        + ["--out", os.path.join(args.results_root, step["out"])]
+    )
+
+
+class Suite:
+    def __init__(self, args, steps, pool):
+        self.args = args
+        self.steps = steps
+        self.free = list(pool)
+        self.status = {
+            step["name"]: {"state": "pending", "nodes": step["nodes"]} for step in steps
+        }
+        self.status_path = os.path.join(args.results_root, "suite_status.json")
+        self.log_dir = os.path.join(args.results_root, "suite_logs")
+        os.makedirs(self.log_dir, exist_ok=True)
+
+    def write_status(self):
+        with open(self.status_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"updated_utc": _utc_now(), "steps": self.status},
+                handle,
+                indent=2,
+                sort_keys=True,
+            )
+
+    def _ready(self, step):
+        # Dependencies left out by --only are taken as done by an earlier run.
+        states = [
+            self.status[dep]["state"]
+            for dep in step.get("after", [])
+            if dep in self.status
+        ]
+        if any(state in ("failed", "skipped") for state in states):
+            return "skipped"
+        return all(state == "ok" for state in states)
+
+    async def _run(self, index, step, hosts):
+        name = step["name"]
+        env = dict(os.environ)
+        env.update({key: str(value) for key, value in step.get("env", {}).items()})
+        env["NODES"] = str(step["nodes"])
+        env["RUN_ID"] = f"{self.args.run_id}_{name}"
+        if self.args.launcher == "local":
+            env["MASTER_PORT"] = str(LOCAL_BASE_PORT + index)
+        else:
+            env["NODELIST"] = ",".join(hosts)
+        cmd = step_command(self.args, step)
+        log_path = os.path.join(self.log_dir, f"{name}.log")
+        record = self.status[name]
+        record.update(
+            {
+                "state": "running",
+                "hosts": hosts,
+                "command": cmd,
+                "log": log_path,
+                "started_utc": _utc_now(),
+            }
+        )
+        self.write_status()
+        start = time.perf_counter()
+        with open(log_path, "w", encoding="utf-8") as log:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    cwd=REPO_ROOT,
+                    env=env,
+                    stdout=log,
+                    stderr=asyncio.subprocess.STDOUT,
+                )
+                returncode = await process.wait()
+            except OSError as exc:
+                log.write(f"failed to start: {exc}\n")
+                returncode = None
+        record.update(
+            {
+                "state": "ok" if returncode == 0 else "failed",
+                "returncode": returncode,
+                "elapsed_s": time.perf_counter() - start,
+                "finished_utc": _utc_now(),
+            }
+        )
+        self.write_status()
+        print(f"[{record['state']}] {name} ({record['elapsed_s']:.1f}s) {log_path}")
+        return hosts
+
+    async def run(self):
+        # Steps start in suite order as soon as their dependencies are done
+        # and enough nodes are free; smaller later steps backfill around a
+        # large one that has to wait.
+        pending = list(enumerate(self.steps))
+        running = {}
+        for _, step in pending:
+            if step["nodes"] > len(self.free):
+                self.status[step["name"]]["state"] = "skipped"
+                self.status[step["name"]]["error"] = (
+                    f"needs {step['nodes']} nodes, pool has {len(self.free)}"
+                )
+        pending = [
+            (index, step)
+            for index, step in pending
+            if self.status[step["name"]]["state"] == "pending"
+        ]
+        self.write_status()
+        while pending or running:
+            for item in list(pending):
+                if running and self.args.serial:
+                    break
+                index, step = item
+                ready = self._ready(step)
+                if ready == "skipped":
+                    self.status[step["name"]]["state"] = "skipped"
+                    pending.remove(item)
+                    continue
+                if not ready or step["nodes"] > len(self.free):
+                    continue
+                hosts = self.free[: step["nodes"]]
+                self.free = self.free[step["nodes"] :]
+                task = asyncio.create_task(self._run(index, step, hosts))
+                running[task] = step
+                pending.remove(item)
+            self.write_status()
+            if not running:
+                # Nothing can start and nothing will finish: dependency cycle.
+                for _, step in pending:
+                    self.status[step["name"]]["state"] = "skipped"
+                    self.status[step["name"]]["error"] = "unsatisfiable dependencies"
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                running.pop(task)
+                self.free += task.result()
+        self.write_status()
+        return all(record["state"] == "ok" for record in self.status.values())
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Run a benchmark suite as concurrent steps on disjoint nodes."
+    )
+    parser.add_argument("--suite", default=str(DEFAULT_SUITE))
+    parser.add_argument(
+        "--launcher",
+        choices=("slurm", "local"),
+        default=os.environ.get("BENCH_LAUNCHER", "slurm"),
+        help="slurm: step templates as srun job steps inside the allocation; "
+        "local: templates/local.sh with plain processes and gloo.",
+    )
+    parser.add_argument(
+        "--nodes",
+        type=int,
+        default=0,
+        help="Size of the node pool (default: the allocation, or 4 for local).",
+    )
+    parser.add_argument("--old", default=os.environ.get("OLD_CONTAINER", ""))
+    parser.add_argument("--new", default=os.environ.get("NEW_CONTAINER", ""))
+    parser.add_argument(
+        "--results-root",
+        default=os.environ.get("RESULTS_ROOT", ""),
+        help="Where step results, logs and suite_status.json go.",
+    )
+    parser.add_argument("--only", default="", help="Comma-separated step names to run.")
+    parser.add_argument("--serial", action="store_true", help="One step at a time.")
+    return parser
+
+
+def main(argv):
+    args = build_parser().parse_args(argv[1:])
+    if not args.results_root:
+        raise SystemExit("Set --results-root or RESULTS_ROOT.")
+    if not args.new:
+        raise SystemExit("Set --new or NEW_CONTAINER.")
+    suite = load_suite(args.suite)
+    steps = suite["steps"]
+    if args.only:
+        only = {name.strip() for name in args.only.split(",") if name.strip()}
+        steps = [step for step in steps if step["name"] in only]
+    if any("compare" in step for step in steps) and not args.old:
+        raise SystemExit("Compare steps need --old or OLD_CONTAINER.")
+    args.run_id = os.environ.get(
+        "RUN_ID", _utc_now().replace(":", "").replace("-", "")
+    )
+
+    if args.launcher == "local":
+        pool = [f"local{i}" for i in range(args.nodes or LOCAL_NODES)]
+    else:
+        pool = allocation_hosts()
+        if args.nodes:
+            pool = pool[: args.nodes]
+        if not pool:
+            raise SystemExit("No allocation found; run inside salloc/sbatch.")
+    os.makedirs(args.results_root, exist_ok=True)
+    runner = Suite(args, steps, pool)
+    ok = asyncio.run(runner.run())
+    print(f"Status: {runner.status_path}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
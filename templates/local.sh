@@ -0,0 +1,42 @@
+#!/bin/bash
+set -euo pipefail
+
+# Local stand-in for the Slurm templates: no srun and no container. Runs the
+# bench command as NODES x LOCAL_RANKS_PER_NODE plain processes that rendezvous
+# over gloo on localhost.
+# Usage:
+#   NODES=2 ./templates/local.sh <container.sif> -- bench/run ddp --out results.json
+
+CONTAINER_IMAGE="${1:?container image path required}"
+shift
+if [[ "${1:-}" == "--" ]]; then
+  shift
+fi
+
+NODES="${NODES:-1}"
+LOCAL_RANKS_PER_NODE="${LOCAL_RANKS_PER_NODE:-2}"
+WORLD_SIZE=$((NODES * LOCAL_RANKS_PER_NODE))
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+cd "${SCRIPT_DIR}/.."
+
+export MASTER_ADDR=127.0.0.1
+export MASTER_PORT="${MASTER_PORT:-$((20000 + RANDOM % 20000))}"
+export WORLD_SIZE
+export BENCH_DIST_BACKEND="${BENCH_DIST_BACKEND:-gloo}"
+export BENCH_CONTAINER_IMAGE="${CONTAINER_IMAGE}"
+export BENCH_NODES="${NODES}"
+export BENCH_NTASKS_PER_NODE="${LOCAL_RANKS_PER_NODE}"
+export BENCH_GPUS_PER_NODE=0
+
+pids=()
+for ((rank = 0; rank < WORLD_SIZE; rank++)); do
+  RANK="${rank}" LOCAL_RANK=$((rank % LOCAL_RANKS_PER_NODE)) "$@" &
+  pids+=("$!")
+done
+
+status=0
+for pid in "${pids[@]}"; do
+  wait "${pid}" || status=$?
+done
+exit "${status}"
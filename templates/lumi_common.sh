@@ -71,9 +71,16 @@ lumi_init() {
 
   mkdir -p "${CACHE_ROOT}" "${RESULTS_DIR}" "${LOG_DIR}"
 
-  MIOPEN_DIR=$(mktemp -d)
+  if [[ "${PERSIST_MIOPEN_CACHE:-0}" == "1" ]]; then
+    # Keep the MIOpen find-db per image so later jobs skip the kernel search.
+    MIOPEN_DIR="${CACHE_ROOT}/miopen/$(basename "${CONTAINER_IMAGE}" .sif)"
+    mkdir -p "${MIOPEN_DIR}"
+  else
+    MIOPEN_DIR=$(mktemp -d)
+  fi
   export MIOPEN_CUSTOM_CACHE_DIR="${MIOPEN_DIR}/cache"
   export MIOPEN_USER_DB="${MIOPEN_DIR}/config"
+  export MIOPEN_USER_DB_PATH="${MIOPEN_DIR}/config"
   export TORCH_HOME="${TORCH_HOME:-${SCRATCH_ROOT}/${USER}/torch_home}"
   mkdir -p "${TORCH_HOME}"
 